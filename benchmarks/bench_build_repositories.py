@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+'''
+Benchmark of the ProcessBuildFull.build_repositories orchestration.
+
+It generates N local Git repositories, each one with a bare "origin"
+remote and a pom.xml depending on another generated repository, and puts
+a stub mvn on the PATH thats sleeps and/or consumes CPU instead of
+building. No network is required.
+
+The end-to-end wall time of build_repositories is measured for each
+number of repositories and each process mode, so the orchestration
+overhead can be compared between versions and between the serial and
+the parallel modes:
+> python benchmarks/bench_build_repositories.py --repos 5 50 500
+'''
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import multiple_builder
+
+REPO_NAME = 'sample_{}'
+GROUP_ID = 'com.benchmark'
+GIT_ENV = {
+    'GIT_AUTHOR_NAME': 'benchmark', 'GIT_AUTHOR_EMAIL': 'benchmark@local',
+    'GIT_COMMITTER_NAME': 'benchmark', 'GIT_COMMITTER_EMAIL': 'benchmark@local'
+}
+
+POM_TEMPLATE = '''<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>{group_id}</groupId>
+  <artifactId>{artifact_id}</artifactId>
+  <version>1.0</version>
+  <dependencies>{dependencies}</dependencies>
+</project>
+'''
+
+DEPENDENCY_TEMPLATE = '''
+    <dependency>
+      <groupId>{group_id}</groupId>
+      <artifactId>{artifact_id}</artifactId>
+      <version>1.0</version>
+    </dependency>'''
+
+STUB_MVN = '''#!{python}
+import os
+import time
+
+sleep = float(os.environ.get('BENCH_MVN_SLEEP', '0'))
+cpu = float(os.environ.get('BENCH_MVN_CPU', '0'))
+
+print('[INFO] Scanning for projects...')
+print('[INFO] Building ' + os.path.basename(os.getcwd()) + ' 1.0 [1/1]')
+
+time.sleep(sleep)
+
+end = time.process_time() + cpu
+while time.process_time() < end:
+    pass
+
+print('[INFO] BUILD SUCCESS')
+'''
+
+MODES = {
+    'serial': {'build_jobs': 1, 'sync_jobs': 1, 'is_pipeline': False},
+    'parallel': {'is_pipeline': False},
+    'pipeline': {'is_pipeline': True}
+}
+
+
+def run_git(args, cwd):
+    subprocess.run(['git'] + args, cwd=cwd, check=True, \
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, \
+                        env=dict(os.environ, **GIT_ENV))
+
+
+def create_repository(root_path, index):
+    name = REPO_NAME.format(index)
+    origin_path = os.path.join(root_path, 'origins', name + '.git')
+    repository_path = os.path.join(root_path, 'repositories', name)
+
+    os.makedirs(repository_path)
+    run_git(['init', '-q', '--bare', '-b', 'master', origin_path], root_path)
+    run_git(['init', '-q', '-b', 'master'], repository_path)
+
+    dependencies = str()
+    if index > 1:
+        dependencies = DEPENDENCY_TEMPLATE.format(group_id=GROUP_ID, \
+                        artifact_id=REPO_NAME.format(index // 2))
+
+    with open(os.path.join(repository_path, 'pom.xml'), 'w') as pom_file:
+        pom_file.write(POM_TEMPLATE.format(group_id=GROUP_ID, \
+                            artifact_id=name, dependencies=dependencies))
+
+    run_git(['add', '-A'], repository_path)
+    run_git(['commit', '-q', '-m', 'Initial commit'], repository_path)
+    run_git(['remote', 'add', 'origin', origin_path], repository_path)
+    run_git(['push', '-q', '-u', 'origin', 'master'], repository_path)
+
+
+def create_stub_mvn(root_path):
+    bin_path = os.path.join(root_path, 'bin')
+    mvn_path = os.path.join(bin_path, 'mvn')
+
+    os.makedirs(bin_path)
+    with open(mvn_path, 'w') as mvn_file:
+        mvn_file.write(STUB_MVN.format(python=sys.executable))
+
+    os.chmod(mvn_path, 0o755)
+    return bin_path
+
+
+def create_workspace(root_path, size):
+    for index in range(1, size + 1):
+        create_repository(root_path, index)
+
+    return os.path.join(root_path, 'repositories')
+
+
+def measure(repositories_path, size, mode, args):
+    multiple_builder.Const.REPO_PATHS = \
+                    tuple([REPO_NAME.format(i) for i in range(1, size + 1)])
+
+    repositories = [multiple_builder.Repository(p) for p in \
+                multiple_builder.PathHelper.fetch_repo_paths(repositories_path)]
+
+    process = multiple_builder.ProcessBuildFull()
+    process.root_path = repositories_path
+    process.repositories = repositories
+    process.discovered_repositories = repositories
+    process.is_clean_m2 = True
+    process.build_jobs = args.jobs
+    process.sync_jobs = args.sync_jobs
+
+    for attribute, value in MODES[mode].items():
+        setattr(process, attribute, value)
+
+    os.makedirs(multiple_builder.PathHelper._get_m2_path(), exist_ok=True)
+
+    start = time.monotonic()
+    process.build_repositories()
+    return time.monotonic() - start
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=\
+                '>>>>> Benchmark of the Multiple Builder orchestration <<<<<')
+    parser.add_argument('--repos', type=int, nargs='+', default=[5, 50, 500], \
+                        help='Numbers of repositories generated.')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), \
+                        default=list(MODES), help='Process modes measured.')
+    parser.add_argument('--jobs', type=int, default=4, \
+                        help='Concurrent builds of the parallel modes.')
+    parser.add_argument('--sync-jobs', type=int, default=8, \
+                        help='Concurrent Git syncs of the parallel modes.')
+    parser.add_argument('--mvn-sleep', type=float, default=0.0, \
+                        help='Seconds the stub mvn sleeps by build.')
+    parser.add_argument('--mvn-cpu', type=float, default=0.0, \
+                        help='CPU seconds the stub mvn consumes by build.')
+    parser.add_argument('--output', \
+                        help='JSON file where the results are written.')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    multiple_builder.logger = logging.getLogger('multiple_builder')
+    logging.basicConfig(format='> %(levelname)s - %(message)s', \
+                                                    level=logging.WARNING)
+    results = list()
+
+    with tempfile.TemporaryDirectory(prefix='multiple_builder_bench_') \
+                                                                as temp_path:
+        os.environ['PATH'] = create_stub_mvn(temp_path) + os.pathsep + \
+                                                        os.environ['PATH']
+        os.environ['HOME'] = temp_path
+        os.environ['BENCH_MVN_SLEEP'] = str(args.mvn_sleep)
+        os.environ['BENCH_MVN_CPU'] = str(args.mvn_cpu)
+
+        for size in args.repos:
+            repositories_path = create_workspace(\
+                            os.path.join(temp_path, f'workspace_{size}'), size)
+
+            for mode in args.modes:
+                wall_time = measure(repositories_path, size, mode, args)
+                results.append({'repositories': size, 'mode': mode, \
+                        'wall_time': wall_time, \
+                        'wall_time_by_repository': wall_time / size})
+
+                print(f'{size:>5} repositories | {mode:<8} | ' +\
+                        f'{wall_time:8.2f}s | ' +\
+                        f'{wall_time / size * 1000:8.1f} ms/repository')
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
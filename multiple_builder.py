@@ -1,12 +1,29 @@
 #!/usr/bin/env python
 import argparse
+import collections
+import contextlib
+import copy
+import fnmatch
+import hashlib
+import json
 import os
 import logging
+import queue
+import re
 import subprocess
 import shutil
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TypedDict, Text
+from typing import Any, Callable, List, Tuple, TypedDict, Text
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
 
 #Global object used to logger the hard code messages
 logger = None
@@ -27,7 +44,6 @@ class Const:
     This object is responsible for store all the constants required
     in the others class process.
     '''
-    PULL_UPDATED = "Already up to date"    
     M2_PATH = ".m2/repository/"
     REPO_PATHS = ('sample_1', 'sample_2', 'sample_3', 'sample_4', 'sample_5')
 
@@ -38,8 +54,50 @@ class Const:
         4: 'mvn clean install -T 4 -DskipTests -Dmaven.javadoc.skip=true',
         5: 'mvn clean isntall -T 4 -DskipTests -Dmaven.javadoc.skip=true -Dmaven.source.skip=true'
     }
+    BUILD_BACKEND_MVN = 'mvn'
+    BUILD_BACKEND_MVND = 'mvnd'
+    BUILD_BACKENDS = (BUILD_BACKEND_MVN, BUILD_BACKEND_MVND)
     BUILD_BRANCH = 'master'
     BUILD_BRANCH_OPT = 'M'
+    BUILD_JOBS = 1
+    WATCH_INTERVAL = 30
+    WATCH_MAX_INTERVAL = 600
+    SAMPLE_INTERVAL = 0.5
+    SYNC_JOBS = 4
+    POM_FILE = 'pom.xml'
+    STATE_DIR = '.multiple_builder'
+    BUILD_STATE_FILE = 'build_state.json'
+    LOGS_DIR = 'logs'
+    TRACES_DIR = 'traces'
+    RESOURCES_DIR = 'resources'
+    REPO_INDEX_FILE = 'repo_index.json'
+    DISCOVERY_MAX_DEPTH = 4
+    DISCOVERY_SKIP_DIRS = ('.git', 'target', 'node_modules', STATE_DIR)
+    GIT_DIR = '.git'
+    TRACE_FILE_EXTENSION = '.json'
+    M2_EVICT_ALL = 'all'
+    M2_EVICT_PROJECT = 'project'
+    M2_EVICT_LRU = 'lru'
+    M2_EVICT_MODES = (M2_EVICT_ALL, M2_EVICT_PROJECT, M2_EVICT_LRU)
+    M2_BUDGET = '10G'
+    PREPARE_FULL = 'full'
+    PREPARE_PRESERVE = 'preserve'
+    PREPARE_MODES = (PREPARE_FULL, PREPARE_PRESERVE)
+    ARTIFACT_CACHE_DIR = 'artifact_cache'
+    REACTOR_DIR = 'reactor'
+    JOURNAL_FILE = 'journal.json'
+    HISTORY_FILE = 'history.json'
+    WORKTREES_DIR = 'worktrees'
+    BRANCHES_DIR = 'branches'
+    POLLS_DIR = 'polls'
+    STAGING_DIR = 'staging'
+    BRANCH_M2_DIR = 'm2'
+    ARTIFACT_CACHE_SIZE = '20G'
+    TEST_CACHE_FILE = 'test_cache.json'
+    TEST_CACHE_SIZE = 10000
+    MIN_FREE_MEMORY = '1G'
+    OUTPUT_TAIL_LINES = 200
+    ERROR_TAIL_LINES = 40
 
 
 class ProcessBuildFull:
@@ -54,12 +112,75 @@ class ProcessBuildFull:
     - is_to_reset = True
     - is_to_update = True
     - is_build_all = True
+    - build_jobs = Const.BUILD_JOBS
+    - sync_jobs = Const.SYNC_JOBS
+    - is_pipeline = False
+    - m2_evict_mode = Const.M2_EVICT_ALL
+    - m2_budget = Const.M2_BUDGET
+    - is_artifact_cache = False
+    - artifact_cache_size = Const.ARTIFACT_CACHE_SIZE
+    - prepare_mode = Const.PREPARE_FULL
+    - is_reactor = False
+    - build_backend = Const.BUILD_BACKEND_MVN
+    - is_incremental = False
+    - is_to_resume = False
+    - is_keep_going = False
+    - is_to_probe = False
+    - build_branches = None
+    - m2_path = None
+    - is_staging_repository = False
+    - is_plan = False
+    - watch_interval = Const.WATCH_INTERVAL
+    - watch_max_interval = Const.WATCH_MAX_INTERVAL
+    - is_resource_sampling = False
+    - sample_interval = Const.SAMPLE_INTERVAL
+    - is_resource_control = False
+    - max_load = None
+    - min_free_memory = Const.MIN_FREE_MEMORY
+    - is_test_cache = False
     '''
     GIT_CHECKOUT_CMD = 'git checkout '
     GIT_CHECKOUT_MASTER_CMD = 'git checkout master'
     GIT_CLEAN_CMD = 'yes y | git clean -fxd'
     GIT_RESET_HARD_MASTER_CMD = 'git reset --hard origin/master'
     GIT_PULL_CMD = 'git pull'
+    GIT_HEAD_CMD = 'git rev-parse HEAD'
+    GIT_TREE_CMD = 'git rev-parse HEAD^{tree}'
+    GIT_STATUS_CMD = 'git status --porcelain'
+    GIT_TRACKED_STATUS_CMD = 'git status --porcelain --untracked-files=no'
+    GIT_UNTRACKED_CMD = 'git ls-files --others --exclude-standard --directory'
+    GIT_CLEAN_UNTRACKED_CMD = 'git clean -fd'
+    GIT_BRANCH_CMD = 'git rev-parse --abbrev-ref HEAD'
+    GIT_REMOTE_HEAD_CMD = 'git rev-parse origin/'
+    GIT_RESET_HARD_CMD = 'git reset --hard origin/'
+    GIT_DIFF_NAMES_CMD = 'git diff --name-only '
+    GIT_LS_REMOTE_CMD = 'git ls-remote origin refs/heads/'
+
+    PHASE_CLEAN_M2 = 'clean m2'
+    PHASE_GIT_STATUS = 'git status'
+    PHASE_GIT_PROBE = 'git ls-remote'
+    PHASE_GIT_CLEAN = 'git clean'
+    PHASE_GIT_CHECKOUT = 'git checkout'
+    PHASE_GIT_RESET = 'git reset'
+    PHASE_GIT_PULL = 'git pull'
+    PHASE_GIT_FETCH = 'git fetch'
+    PHASE_ARTIFACT_CACHE = 'artifact cache'
+    PHASE_BUILD = 'maven build'
+    PHASE_TEST = 'maven test'
+    PHASE_STAGING_MERGE = 'staging merge'
+    PHASE_REACTOR = 'maven reactor'
+    MAVEN_THREADS_PATTERN = re.compile(r'\s-T\s*\S+')
+    MAVEN_THREADS_OPT = ' -T '
+    MAVEN_REACTOR_OPTS = ' --fail-at-end -f '
+    MAVEN_PROJECTS_OPT = ' -pl '
+    MAVEN_ALSO_MAKE_OPTS = ' -am -amd'
+    MAVEN_REPO_LOCAL_OPT = ' -Dmaven.repo.local='
+    MAVEN_OPTS_ENV = 'MAVEN_OPTS'
+    MAVEN_HEAP_OPT = ' -Xmx'
+    MAVEN_SKIP_TESTS_OPT = ' -DskipTests'
+    MAVEN_SKIP_TESTS_PATTERN = re.compile(r'-DskipTests|-Dmaven\.test\.skip')
+    BRANCH_RUN_ATTRIBUTES = ('is_clean_m2', 'is_to_resume', 'timeline', \
+                            'resource_report', '_run_id', '_governor')
 
     def __init__(self):
         self.is_clean_m2 = False
@@ -68,25 +189,487 @@ class ProcessBuildFull:
         self.is_build_all = True
         self._build_command = None
         self.build_branch = Const.BUILD_BRANCH
+        self.build_jobs = Const.BUILD_JOBS
+        self.sync_jobs = Const.SYNC_JOBS
+        self.is_pipeline = False
+        self.m2_evict_mode = Const.M2_EVICT_ALL
+        self.m2_budget = Const.M2_BUDGET
+        self.is_artifact_cache = False
+        self.artifact_cache_size = Const.ARTIFACT_CACHE_SIZE
+        self.prepare_mode = Const.PREPARE_FULL
+        self.is_reactor = False
+        self.build_backend = Const.BUILD_BACKEND_MVN
+        self.is_incremental = False
+        self.is_to_resume = False
+        self.is_keep_going = False
+        self.is_to_probe = False
+        self.build_branches = None
+        self.m2_path = None
+        self.is_staging_repository = False
+        self.is_plan = False
+        self.watch_interval = Const.WATCH_INTERVAL
+        self.watch_max_interval = Const.WATCH_MAX_INTERVAL
+        self.is_resource_sampling = False
+        self.sample_interval = Const.SAMPLE_INTERVAL
+        self.is_resource_control = False
+        self.max_load = None
+        self.min_free_memory = Const.MIN_FREE_MEMORY
+        self.is_test_cache = False
+        self.repository_names = None
+        self.root_path = None
         self.repositories = list()
+        self.discovered_repositories = list()
+        self._sync_results = dict()
+        self._build_state = None
+        self._command_runner = None
+        self._graph = None
+        self._artifact_cache = None
+        self._artifact_keys = dict()
+        self._run_id = None
+        self._backend = None
+        self._journal = None
+        self._moved_repositories = None
+        self._is_worktree = False
+        self._state_path = None
+        self._worktrees = dict()
+        self._branch_processes = None
+        self._governor = None
+        self._history = None
+        self._test_cache = None
+        self._test_keys = None
+        self.resource_report = ResourceReport()
+        self._process_lane = BuildTimeline.PROCESS_LANE
+        self.timeline = BuildTimeline()
 
     def build_repositories(self):
         '''
         Before start the building repositories process,  is checked if it
         is required to clean the .m2 folder thats will influence in the
         build process. According to the object attributes the repositories
-        instance will  be built.
+        instance will  be built, following theirs dependency graph.
+        '''
+        if self.is_plan:
+            self._show_plan()
+            return
+
+        self._run_id = PathHelper.create_run_id()
+        self.timeline = BuildTimeline(self.root_path)
+        self.resource_report = ResourceReport(self.root_path)
+        self._governor = self._create_governor()
+
+        try:
+            if self.build_branches:
+                self._build_branches()
+            else:
+                self._build_branch_repositories()
+        finally:
+            self.timeline.export_chrome_trace(self._get_state_file_path(\
+                Const.TRACES_DIR, self._run_id + Const.TRACE_FILE_EXTENSION))
+
+            if self.is_resource_sampling:
+                self.resource_report.export(self._get_state_file_path(\
+                    Const.RESOURCES_DIR, self._run_id + \
+                                                Const.TRACE_FILE_EXTENSION))
+
+    def watch_repositories(self):
         '''
-        self._clean_m2_project_folder()
+        Build the repositories and keep watching theirs remotes until the
+        process is interrupted. The repositories, theirs build state and
+        history are kept in memory between the builds, as the branch
+        processes when build_branches is set.
+
+        Every watch_interval seconds the remote branch head of all the
+        repositories is read by 'git ls-remote' and only the repositories
+        thats have moved, or whose HEAD has not been built successfully
+        like the ones failed in the last build, are synchronized and built,
+        in dependency order. When build_branches is set the worktrees of
+        each branch are read against theirs own branch, and a repository
+        to build in any branch is built in all of them, the others
+        branches being skipped by the build state.
+        While nothing moves, or when a build fails, the interval is
+        doubled up to watch_max_interval seconds.
+        '''
+        repositories = list(self.repositories)
+        interval = self.watch_interval
+
+        if self.build_branches:
+            self._branch_processes = self._create_branch_processes()
+
+        self._build_watched(repositories)
+
+        self.is_clean_m2 = False
+        self.is_to_resume = False
+
+        while True:
+            logger.info(f'Watching {len(repositories)} repositories, ' +\
+                        f'the next poll is in {interval:.0f} seconds')
+            time.sleep(interval)
+
+            moved = self._poll_repositories(repositories)
+
+            if not moved:
+                interval = min(interval * 2, self.watch_max_interval)
+            elif self._build_watched(moved):
+                interval = self.watch_interval
+            else:
+                interval = min(interval * 2, self.watch_max_interval)
+
+    def _poll_repositories(self, repositories):
+        self.repositories = repositories
+        self.timeline = BuildTimeline(self.root_path)
+
+        if self.build_branches:
+            moved_repositories = self._probe_branches_repositories_to_build()
+        else:
+            self._start_poll()
+            moved_repositories = self._probe_repositories_to_build()
+        moved = [r for r in repositories if r in moved_repositories]
+
+        for repository in moved:
+            repository.refresh()
+
+        return moved
+
+    def _probe_branches_repositories_to_build(self):
+        moved = set()
+
+        for process in self._branch_processes \
+                                        or self._create_branch_processes():
+            self._update_branch_process(process)
+            process._start_poll()
+            branch_moved = process._probe_repositories_to_build()
+            moved.update([r for r in self.repositories \
+                                    if process._worktrees[r] in branch_moved])
+
+        return moved
+
+    def _start_poll(self):
+        self._command_runner = self._create_command_runner(\
+                    self._get_state_file_path(Const.LOGS_DIR, \
+                            Const.POLLS_DIR, PathHelper.create_run_id()))
+
+    def _probe_repositories_to_build(self):
+        return self._probe_moved_repositories() | \
+                                        self._get_not_built_repositories()
+
+    def _get_not_built_repositories(self):
+        build_state = self._build_state or BuildStateStore(\
+                        self._get_state_file_path(Const.BUILD_STATE_FILE))
+        not_built = set()
 
         for repository in self.repositories:
-            repository_path = repository._absolute_path
+            try:
+                head = self._read_head(repository._absolute_path)
+            except BuilderProcessException as e:
+                logger.warning(e)
+                head = None
+
+            if not build_state.is_built(repository, head, \
+                                    self.build_branch, self.build_command):
+                not_built.add(repository)
+
+        if not_built:
+            logger.info(f'{len(not_built)} repositories have not been ' +\
+                            'built at theirs HEAD and will be built again')
+        return not_built
+
+    def _build_watched(self, repositories):
+        self.repositories = repositories
+
+        try:
+            self.build_repositories()
+            return True
+        except BuilderProcessException as e:
+            logger.error(e)
+            return False
+        finally:
+            logger.info('Build phases summary:\n' + \
+                                        self.timeline.format_summary())
+
+    def _build_branch_repositories(self):
+        graph = DependencyGraph(self.repositories, \
+                self.discovered_repositories, self.repository_names)
+        self._graph = graph
+        self._history = self._history or BuildHistory(\
+                            self._get_state_file_path(Const.HISTORY_FILE))
+
+        try:
+            self._build_graph(graph)
+        finally:
+            self._history.record(self.repositories, \
+                                            self.timeline.get_events())
+
+    def _build_graph(self, graph):
+        self._journal = RunJournal(self._get_state_file_path(\
+                        Const.JOURNAL_FILE), self._get_journal_options(), \
+                                                    self.is_to_resume)
+
+        if self.is_clean_m2 \
+                and not self._journal.is_step_done(RunJournal.STEP_CLEAN_M2):
+            with self.timeline.phase(self._process_lane, self.PHASE_CLEAN_M2):
+                self._clean_m2_project_folder()
+
+            self._journal.mark_step_done(RunJournal.STEP_CLEAN_M2)
+
+        self._command_runner = self._create_command_runner()
+        self._build_state = self._build_state or BuildStateStore(\
+                        self._get_state_file_path(Const.BUILD_STATE_FILE))
+        self._artifact_cache = self._create_artifact_cache()
+        self._artifact_keys = dict()
+        self._test_cache = self._create_test_cache()
+        self._test_keys = ModuleTestKeys(graph, self.build_command, \
+                                                    self._run_process_command)
+        self._backend = BuildBackend.create(self.build_backend)
+
+        scheduler = BuildScheduler(graph, self.build_jobs, \
+                                        self.is_keep_going, self._governor, \
+                            graph.get_critical_paths(self._history.estimate))
+        self._sync_results = dict()
+        self._moved_repositories = self._probe_repositories()
+
+        if self.is_reactor:
+            self._sync_repositories()
+            self._build_reactor()
+        elif self.is_pipeline:
+            self._pipeline_repositories(graph, scheduler)
+        else:
+            self._sync_repositories()
+
+            for result in self._sync_results.values():
+                scheduler.release(result.repository, result.error)
+
+            scheduler.run(self._build_repository, is_to_wait_release=True)
+
+        self._journal.finish()
+
+    def _build_branches(self):
+        processes = self._branch_processes or self._create_branch_processes()
+
+        for process in processes:
+            self._update_branch_process(process)
+
+        with ThreadPoolExecutor(max_workers=len(processes)) as executor:
+            futures = [(p.build_branch, executor.submit(\
+                        p._build_branch_repositories)) for p in processes]
+
+        failed = list()
+
+        for branch, future in futures:
+            if future.exception() is not None:
+                logger.error(f'The branch {branch} build has failed. ' +\
+                                        f'Exception: {future.exception()}')
+                failed.append(branch)
+
+        if failed:
+            raise BuilderProcessException(\
+                        'Failed to build the branches: ' + ', '.join(failed))
+
+    def _create_branch_processes(self):
+        worktrees = self._create_branch_worktrees()
+        branches_repositories = worktrees.create(self.repositories)
+
+        return [self._create_branch_process(b, worktrees, \
+                    branches_repositories[b]) for b in self.build_branches]
+
+    def _update_branch_process(self, process):
+        process.repositories = [process._worktrees[r] \
+                                                for r in self.repositories]
+
+        for name in self.BRANCH_RUN_ATTRIBUTES:
+            setattr(process, name, getattr(self, name))
+
+    def _create_branch_worktrees(self):
+        return BranchWorktrees(PathHelper._get_valid_root_path(\
+                    self.root_path), self.build_branches, \
+                        self._run_process_command, self.timeline, \
+                                                            self.sync_jobs)
+
+    def _create_branch_process(self, branch, worktrees, repositories):
+        branch_path = worktrees.get_branch_path(branch)
+        index = self.build_branches.index(branch)
+        process = copy.copy(self)
+
+        process.build_branch = branch
+        process.build_branches = None
+        process.build_jobs = self._split_jobs(self.build_jobs, index)
+        process.sync_jobs = self._split_jobs(self.sync_jobs, index)
+        process.root_path = branch_path
+        process._state_path = worktrees.get_state_path(branch)
+        process.repositories = repositories
+        process._worktrees = dict(zip(self.repositories, repositories))
+        process._branch_processes = None
+        process.discovered_repositories = repositories + \
+                    [r for r in self.discovered_repositories \
+                                            if r not in self.repositories]
+        process.m2_path = worktrees.get_m2_path(branch)
+        process._is_worktree = True
+        process._process_lane = branch_path
+        process._command_runner = None
+        process._backend = None
+
+        os.makedirs(process.m2_path, exist_ok=True)
+        return process
+
+    def _split_jobs(self, jobs, index):
+        count = len(self.build_branches)
+
+        return max(1, jobs // count + (1 if index < jobs % count else 0))
+
+    def _get_priority_order(self):
+        critical_paths = self._graph.get_critical_paths(\
+                                                    self._history.estimate)
+
+        return sorted(self._graph.topological_order(), \
+                                    key=lambda r: -critical_paths[r])
+
+    def _show_plan(self):
+        graph = DependencyGraph(self.repositories, \
+                self.discovered_repositories, self.repository_names)
+        history = BuildHistory(self._get_state_file_path(Const.HISTORY_FILE))
+
+        logger.info('Build plan:\n' + \
+            BuildPlan(graph, history.estimate, self.build_jobs).format())
+
+    def _sync_repositories(self):
+        with ThreadPoolExecutor(max_workers=max(1, self.sync_jobs)) \
+                                                                as executor:
+            results = list(executor.map(self._sync_repository, \
+                                                self._get_priority_order()))
+
+        if not self.is_keep_going:
+            self._has_not_sync_errors(results)
+
+        self._sync_results.update({r.repository: r for r in results})
+
+    def _pipeline_repositories(self, graph, scheduler):
+        executor = ThreadPoolExecutor(max_workers=max(1, self.sync_jobs))
+
+        try:
+            for repository in self._get_priority_order():
+                future = executor.submit(self._sync_repository, repository)
+                future.add_done_callback(lambda f, r=repository: \
+                                    self._release_synced(scheduler, r, f))
+
+            scheduler.run(self._build_repository, is_to_wait_release=True)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-            self._prepare_repository(repository_path)
+    def _release_synced(self, scheduler, repository, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            error = BuilderProcessException(\
+                            f'Failed to synchronize the {repository}: {e}')
+            logger.error(error)
+            result = SyncResult(repository, error=error)
+
+        self._sync_results[result.repository] = result
+
+        scheduler.release(result.repository, result.error)
+
+    def _build_repository(self, repository):
+        if self._journal.is_done(repository, RunJournal.PHASE_BUILD):
+            logger.info(f'The {repository.initial} build has been ' +\
+                                    'skipped, it was finished by the last run')
+            return
+
+        self._execute_build_process(repository)
+
+        self._journal.mark_done(repository, RunJournal.PHASE_BUILD)
+
+    def _get_journal_options(self):
+        return {
+            'branch': self.build_branch,
+            'command': self.build_command,
+            'prepare_mode': self.prepare_mode,
+            'clean_m2': self.is_clean_m2,
+            'm2_evict_mode': self.m2_evict_mode
+        }
+
+    def _create_command_runner(self, log_dir=None):
+        return CommandRunner(log_dir or self._get_state_file_path(\
+                Const.LOGS_DIR, self._run_id or PathHelper.create_run_id()), \
+                sample_interval=self.sample_interval \
+                                    if self.is_resource_sampling else None, \
+                root_path=PathHelper._get_valid_root_path(self.root_path))
+
+    def _get_state_file_path(self, *file_names):
+        if self._state_path:
+            return os.path.join(self._state_path, *file_names)
+
+        root_path = PathHelper._get_valid_root_path(self.root_path)
+
+        return os.path.join(root_path, Const.STATE_DIR, *file_names)
+
+    def _probe_repositories(self):
+        if not self.is_to_probe:
+            return None
+
+        return self._probe_moved_repositories()
+
+    def _probe_moved_repositories(self):
+        with ThreadPoolExecutor(max_workers=max(1, self.sync_jobs)) \
+                                                                as executor:
+            moved = [r for r, is_moved in zip(self.repositories, \
+                    executor.map(self._is_repository_moved, \
+                                        self.repositories)) if is_moved]
+
+        logger.info(f'{len(moved)} of {len(self.repositories)} ' +\
+                        'repositories have moved and will be synchronized')
+        return set(moved)
+
+    def _is_repository_moved(self, repository):
+        path = repository._absolute_path
 
-            pull_result = self._update_repository(repository._absolute_path)
+        try:
+            with self.timeline.phase(path, self.PHASE_GIT_PROBE):
+                remote_head = self._run_process_command(\
+                        self.GIT_LS_REMOTE_CMD + self.build_branch, path)
+                branch = self._run_process_command(self.GIT_BRANCH_CMD, path)
+                changes = self._run_process_command(\
+                                        self.GIT_TRACKED_STATUS_CMD, path)
+                head = self._read_head(path)
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return True
+
+        return not remote_head.strip() \
+                    or remote_head.split()[0] != head \
+                        or (branch.strip() != self.build_branch \
+                                                and not self._is_worktree) \
+                            or bool(changes.strip())
+
+    def _sync_repository(self, repository):
+        result = SyncResult(repository)
+
+        if self._moved_repositories is not None \
+                                and repository not in self._moved_repositories:
+            logger.info(f'The {repository.initial} has not moved from ' +\
+                    f'origin/{self.build_branch}, the sync has been skipped')
+            return result
+
+        try:
+            if not self._journal.is_done(repository, \
+                                                RunJournal.PHASE_PREPARE):
+                self._prepare_repository(repository._absolute_path)
+                self._journal.mark_done(repository, RunJournal.PHASE_PREPARE)
+
+            if not self._journal.is_done(repository, RunJournal.PHASE_UPDATE):
+                self._update_repository(repository._absolute_path)
+                self._journal.mark_done(repository, RunJournal.PHASE_UPDATE)
+        except BuilderProcessException as e:
+            logger.error(e)
+            result.error = e
 
-            self._execute_build_process(repository, pull_result)
+        return result
+
+    def _has_not_sync_errors(self, results):
+        failed = [str(r.repository) for r in results if r.error]
+
+        if failed:
+            raise BuilderProcessException(\
+                'Failed to synchronize the repositories: ' + \
+                                                        ', '.join(failed))
 
     @property
     def build_command(self):
@@ -111,187 +694,3323 @@ class ProcessBuildFull:
                             f"The '{command}' is not a valid Maven command.")
     
     def _clean_m2_project_folder(self):
-        if self.is_clean_m2:
-            PathHelper.delete_m2()
+        if self.m2_evict_mode == Const.M2_EVICT_PROJECT:
+            M2Evictor(self.m2_path).evict_artifacts(set([a \
+                        for r in self.discovered_repositories or \
+                            self.repositories for a in r.artifacts]))
+        elif self.m2_evict_mode == Const.M2_EVICT_LRU:
+            M2Evictor(self.m2_path).evict_lru(\
+                                    M2Evictor.parse_size(self.m2_budget))
+        else:
+            PathHelper.delete_m2(self.m2_path)
 
     def _prepare_repository(self, repository_path):
-        self._run_process_command(self.GIT_CLEAN_CMD, repository_path)
-        
-        command = self.GIT_CHECKOUT_CMD + self.build_branch
-        self._run_process_command(command, repository_path)
+        if self._is_worktree:
+            self._prepare_worktree(repository_path)
+            return
+
+        if self.prepare_mode == Const.PREPARE_PRESERVE:
+            self._prepare_preserving_build_output(repository_path)
+            return
+
+        with self.timeline.phase(repository_path, self.PHASE_GIT_CLEAN):
+            self._run_process_command(self.GIT_CLEAN_CMD, repository_path)
+
+        with self.timeline.phase(repository_path, self.PHASE_GIT_CHECKOUT):
+            command = self.GIT_CHECKOUT_CMD + self.build_branch
+            self._run_process_command(command, repository_path)
+
+        if self.is_to_reset:
+            with self.timeline.phase(repository_path, self.PHASE_GIT_RESET):
+                self._run_process_command(self.GIT_RESET_HARD_MASTER_CMD, \
+                                                            repository_path)
+
+    def _prepare_preserving_build_output(self, repository_path):
+        with self.timeline.phase(repository_path, self.PHASE_GIT_STATUS):
+            untracked = self._run_process_command(self.GIT_UNTRACKED_CMD, \
+                                                            repository_path)
+            branch = self._run_process_command(self.GIT_BRANCH_CMD, \
+                                                    repository_path).strip()
 
-        self._run_process_command(self.GIT_RESET_HARD_MASTER_CMD, \
-                                                        repository_path)
+        if untracked.strip():
+            with self.timeline.phase(repository_path, self.PHASE_GIT_CLEAN):
+                self._run_process_command(self.GIT_CLEAN_UNTRACKED_CMD, \
+                                                            repository_path)
+
+        if branch != self.build_branch:
+            with self.timeline.phase(repository_path, \
+                                                self.PHASE_GIT_CHECKOUT):
+                self._run_process_command(\
+                    self.GIT_CHECKOUT_CMD + self.build_branch, repository_path)
+
+        if not self.is_to_reset:
+            return
+
+        if self._is_to_reset_preserving(repository_path):
+            with self.timeline.phase(repository_path, self.PHASE_GIT_RESET):
+                self._run_process_command(\
+                    self.GIT_RESET_HARD_CMD + self.build_branch, \
+                                                            repository_path)
+        elif not untracked.strip() and branch == self.build_branch:
+            logger.info(f'The repository: {repository_path} is already ' +\
+                    f'clean at origin/{self.build_branch}, the clean, ' +\
+                                    'checkout and reset have been skipped')
+
+    def _prepare_worktree(self, repository_path):
+        with self.timeline.phase(repository_path, self.PHASE_GIT_STATUS):
+            untracked = self._run_process_command(self.GIT_UNTRACKED_CMD, \
+                                                            repository_path)
+
+        if untracked.strip():
+            with self.timeline.phase(repository_path, self.PHASE_GIT_CLEAN):
+                self._run_process_command(self.GIT_CLEAN_UNTRACKED_CMD, \
+                                                            repository_path)
+
+    def _update_worktree(self, repository_path):
+        with self.timeline.phase(repository_path, self.PHASE_GIT_FETCH):
+            output = self._run_process_command(\
+                BranchWorktrees.GIT_FETCH_BRANCH_CMD.format(\
+                                    self.build_branch), repository_path)
+
+        if self._is_to_reset_preserving(repository_path):
+            with self.timeline.phase(repository_path, self.PHASE_GIT_RESET):
+                self._run_process_command(\
+                    self.GIT_RESET_HARD_CMD + self.build_branch, \
+                                                            repository_path)
+
+        return output
+
+    def _is_to_reset_preserving(self, repository_path):
+        with self.timeline.phase(repository_path, self.PHASE_GIT_STATUS):
+            changes = self._run_process_command(\
+                            self.GIT_TRACKED_STATUS_CMD, repository_path)
+            head = self._read_head(repository_path)
+            remote_head = self._run_process_command(\
+                                self.GIT_REMOTE_HEAD_CMD + self.build_branch, \
+                                                    repository_path).strip()
+
+        return bool(changes.strip()) or head != remote_head
 
     def _update_repository(self, repository_path):
+        if self.is_to_update and self._is_worktree:
+            return self._update_worktree(repository_path)
+
         if self.is_to_update:
-            return self._run_process_command(self.GIT_PULL_CMD, \
+            with self.timeline.phase(repository_path, self.PHASE_GIT_PULL):
+                return self._run_process_command(self.GIT_PULL_CMD, \
                                                             repository_path)
 
-    def _execute_build_process(self, repository, pull_result):
+    def _execute_build_process(self, repository):
         try:
-            self._is_process_to_build(pull_result, repository.initial)
+            head, artifact_key = self._check_build(repository)
+
+            if not self._restore_artifacts(repository, artifact_key):
+                command, env = self._get_resource_options(repository, \
+                                                self._get_backend_command())
+                incremental_options = \
+                            self._get_incremental_options(repository, head)
+                untested = self._get_untested_modules(repository) \
+                                        if not incremental_options else None
+                test_command = None
 
-            self._run_process_command(self.build_command, \
-                                                    repository._absolute_path)
+                if untested is not None:
+                    command, test_command = self._get_test_commands(\
+                                            repository, command, untested)
+
+                self._run_build_command(repository, \
+                            command + incremental_options, env, test_command)
+
+                if untested is not None:
+                    self._test_cache.record(\
+                                self._get_test_keys(repository).values())
+
+                self._store_artifacts(repository, artifact_key)
+
+            self._build_state.record(repository, head, self.build_branch, \
+                                                        self.build_command)
         except ProcessNotValid as e:
             logger.info(e)
 
-    def _is_process_to_build(self, pull_result, initial):
-        if (not self.is_build_all or not self.is_clean_m2) \
-                and (pull_result is not None \
-                    and Const.PULL_UPDATED in pull_result):
-            raise ProcessNotValid(f'The {initial} has not been built!')
+    def _run_build_command(self, repository, command, env, \
+                                                        test_command=None):
+        path = repository._absolute_path
+        staging = self._create_staging_repository(repository)
+
+        if staging is not None:
+            command = staging.set_local_repository(command)
+            test_command = test_command and \
+                                staging.set_local_repository(test_command)
 
-    def _run_process_command(self, command, path):
         try:
-            process = subprocess.run(command, shell=True, check=True, \
-                                        stdout=subprocess.PIPE, cwd=path, \
-                                            universal_newlines=True)
+            with self.timeline.phase(path, self.PHASE_BUILD):
+                self._run_process_command(command, path, env=env)
 
-            logger.info(f'The command: "{command}" to the repository: ' +\
-                                        f'{path} has executed successfully')
-            return process.stdout
-        except subprocess.CalledProcessError as e:
-            raise BuilderProcessException(\
-                f'Failed executing the command: "{command}". '+\
-                                f'to the repository {path} '+\
-                                    f'Exception: {e}')
+            if test_command:
+                with self.timeline.phase(path, self.PHASE_TEST):
+                    self._run_process_command(test_command, path, env=env)
 
+            if staging is not None:
+                with self.timeline.phase(path, self.PHASE_STAGING_MERGE):
+                    staging.merge()
+        finally:
+            if staging is not None:
+                staging.discard()
 
-class ProcessPersonalized(ProcessBuildFull):
-    '''
-    Inherits from the class ProcessBuildFull change the following
-    attributes values:
-    - is_to_reset = False
-    - is_to_update = False
-    - is_build_all = False
-    This object represents the process that the user customize according
-    their needs.
-    '''
+    def _create_staging_repository(self, repository):
+        if not self.is_staging_repository:
+            return None
 
-    def __init__(self):
-        super().__init__()
-        self.is_to_reset = False
-        self.is_to_update = False
-        self.is_build_all = False
-   
+        return StagingRepository(self._get_state_file_path(\
+                                Const.STAGING_DIR, \
+                                    os.path.relpath(repository._absolute_path, \
+                            PathHelper._get_valid_root_path(self.root_path))), \
+                                self.m2_path or PathHelper._get_m2_path())
 
-class ProcessSkipMenu(ProcessBuildFull):
-    '''
-    Inherits from the class ProcessBuildFull in order to represent
-    the process that the user wants just pick wich repository to build
-    using the ProcessBuildFull configuration to build it.
-    '''
-    pass
+    def _check_build(self, repository):
+        head = self._read_head(repository._absolute_path)
+        artifact_key = self._compute_artifact_key(repository)
+        self._get_test_keys(repository)
 
+        self._is_process_to_build(repository, head)
 
-class Repository:
-    '''
-    The Repository object contains the paths and initial values
-    for a valid Git repository.
-    In the instance initiate an absolute path is required and its
-    validation is performed.
-    '''    
+        return head, artifact_key
 
-    def __init__(self, absolute_path):
-        self._initial = None
-        self._is_valid_absolute_path(absolute_path)        
-        self._absolute_path = absolute_path        
-        self._build_initial_value()
+    def _build_reactor(self):
+        pending = list()
+        blocked = self._get_blocked_repositories()
 
-    def _is_valid_absolute_path(self, absolute_path):
-        if not os.path.isdir(absolute_path):
+        for repository in self._graph.topological_order():
+            if repository in blocked or self._journal.is_done(\
+                                        repository, RunJournal.PHASE_BUILD):
+                continue
+
+            try:
+                head, artifact_key = self._check_build(repository)
+
+                if self._restore_artifacts(repository, artifact_key):
+                    self._build_state.record(repository, head, \
+                                    self.build_branch, self.build_command)
+                else:
+                    pending.append((repository, head, artifact_key))
+                    continue
+            except ProcessNotValid as e:
+                logger.info(e)
+
+            self._journal.mark_done(repository, RunJournal.PHASE_BUILD)
+
+        if not pending:
+            return
+
+        reactor = MavenReactor(self._get_state_file_path(Const.REACTOR_DIR), \
+                                            [r for r, _, _ in pending])
+        failed = self._run_reactor(reactor)
+
+        for repository, head, artifact_key in pending:
+            if repository not in failed:
+                self._store_artifacts(repository, artifact_key)
+                self._build_state.record(repository, head, \
+                                    self.build_branch, self.build_command)
+                self._journal.mark_done(repository, RunJournal.PHASE_BUILD)
+
+        failed = failed + [r for r in self._graph.topological_order() \
+                                                            if r in blocked]
+
+        if failed:
             raise BuilderProcessException(\
-                            f"The directory {absolute_path} doesn't exist!!!")
+                'Failed to build the repositories by the Maven reactor: ' +\
+                                    ', '.join([str(r) for r in failed]))
 
-    def _build_initial_value(self):
-        self._initial = self._absolute_path.split('.')[-1].upper()
+    def _get_blocked_repositories(self):
+        blocked = set()
 
-    @property
-    def initial(self):
-        '''Return a short name as a prefix for the object Repository'''
-        return self._initial \
-            if self._initial \
-                else self._build_initial_value()       
+        for result in self._sync_results.values():
+            if result.error is not None:
+                blocked.add(result.repository)
+                blocked.update(self._graph.get_all_downstreams(\
+                                                        result.repository))
 
-    def __str__(self):
-        '''Overwrite the __str__ object returning the _initial attribute'''
-        return self._initial
+        return blocked
 
+    def _run_reactor(self, reactor):
+        command = self._get_backend_command()
 
-class PathHelper:
-    '''
-    This is a util class to handle with path and directory process
-    by static methods.
-    '''
+        if self.build_jobs > 1:
+            command = self._set_maven_threads(command, self.build_jobs)
 
-    @staticmethod
-    def delete_m2():
-        '''
-        Delete all the folders and files from the Maven m2 folder
-        '''
-        m2_path = PathHelper._get_m2_path()
+        command = command + self.MAVEN_REACTOR_OPTS + \
+                                            reactor.write_aggregator_pom()
 
-        PathHelper._validate_m2_path(m2_path)
+        with self.timeline.phase(self._process_lane, \
+                                                        self.PHASE_REACTOR):
+            try:
+                self._run_process_command(command, reactor.reactor_dir, \
+                                                        reactor.read_line)
+            except BuilderProcessException as e:
+                logger.error(e)
+
+        return reactor.get_failed_repositories()
+
+    def _get_backend_command(self, command=None):
+        if self._backend is None:
+            self._backend = BuildBackend.create(self.build_backend)
+
+        command = self._backend.get_command(command or self.build_command)
+
+        if self.m2_path:
+            command = command + self.MAVEN_REPO_LOCAL_OPT + \
+                                                    f'"{self.m2_path}"'
+
+        return command
+
+    def _get_incremental_options(self, repository, head):
+        if not self.is_incremental or self.is_clean_m2:
+            return str()
+
+        built_sha = self._build_state.get_built_sha(repository, \
+                                        self.build_branch, self.build_command)
+
+        if built_sha is None or built_sha == head:
+            return str()
+
+        modules = self._get_changed_modules(repository, built_sha, head)
+
+        if not modules:
+            logger.info(f'The {repository.initial} changes from ' +\
+                    f'{built_sha} to {head} require a full build')
+            return str()
+
+        logger.info(f'The {repository.initial} changes from {built_sha} ' +\
+                f'to {head} affect only the modules: {", ".join(modules)}')
+
+        return self.MAVEN_PROJECTS_OPT + ','.join(modules) + \
+                                                    self.MAVEN_ALSO_MAKE_OPTS
+
+    def _get_changed_modules(self, repository, base_sha, head):
+        changed_files = list()
 
         try:
-            shutil.rmtree(m2_path)
+            self._run_process_command(\
+                f'{self.GIT_DIFF_NAMES_CMD}{base_sha} {head}', \
+                    repository._absolute_path, \
+                        lambda line: changed_files.append(line.strip()))
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return None
+
+        module_paths = sorted([Path(m.path).as_posix() \
+                        for m in repository.modules if m.path], \
+                                                    key=len, reverse=True)
+        modules = set()
+
+        for changed_file in filter(None, changed_files):
+            module = next((m for m in module_paths \
+                            if changed_file.startswith(m + '/')), None)
 
-            logger.info(f"The m2 folder: {m2_path} "+\
-                                        "has been deleted successfully")
-        except OSError:
-            raise BuilderProcessException(\
-                f'Process to delete folders and files from ' + \
-                                f'{m2_path} has failed.')
+            if module is None:
+                return None
 
-    @staticmethod
-    def _get_m2_path():
-        return Path.joinpath(Path.home(), Const.M2_PATH)
+            modules.add(module)
 
-    @staticmethod
-    def _validate_m2_path(m2_path):
-        if not m2_path.is_dir():
-            raise BuilderProcessException(\
-                f'Is not possible to clean the M2 project. The path '+\
-                            f'{m2_path} is not a valid directory')
+        return sorted(modules)
 
-    @staticmethod
-    def fetch_repo_paths(root_path):
-        '''
-        Process the root path and extract all valid repository paths
-        from the root path.
-        '''
-        root_path = PathHelper._get_valid_root_path(root_path)
+    def _create_governor(self):
+        if not self.is_resource_control:
+            return None
 
-        absolute_paths = PathHelper.\
-                        _extract_all_absolute_paths_from_root_path(root_path)
+        return ResourceGovernor(self.max_load, \
+                                M2Evictor.parse_size(self.min_free_memory))
 
-        repo_paths = PathHelper._extract_repo_paths(absolute_paths)
+    def _get_resource_options(self, repository, command):
+        allocation = self._governor.get_allocation(repository) \
+                                                if self._governor else None
 
-        PathHelper._has_valid_repo_paths(repo_paths)
+        if allocation is None:
+            return command, None
 
-        return repo_paths
+        env = None
+        command = self._set_maven_threads(command, allocation.threads)
 
-    @staticmethod
-    def _get_valid_root_path(root_path):
-        return root_path if root_path else os.getcwd()
+        if allocation.heap_size:
+            env = dict(os.environ, MAVEN_OPTS=(os.environ.get(\
+                    self.MAVEN_OPTS_ENV, str()) + self.MAVEN_HEAP_OPT + \
+                                    f'{allocation.heap_size}m').strip())
 
-    @staticmethod
-    def _extract_all_absolute_paths_from_root_path(root_path):
-        return [f.path for f in os.scandir(root_path) if f.is_dir()]
+        logger.info(f'The {repository.initial} is built with ' +\
+                    f'{allocation.threads} threads and ' +\
+                        f'{allocation.heap_size or "the default"} MB of heap')
+        return command, env
 
-    @staticmethod
-    def _extract_repo_paths(absolute_paths):
-        return [a for a in absolute_paths \
-                    for r in Const.REPO_PATHS if a.endswith(r)]
+    def _set_maven_threads(self, command, threads):
+        return self.MAVEN_THREADS_PATTERN.sub('', command) + \
+                                        self.MAVEN_THREADS_OPT + str(threads)
+
+    def _create_artifact_cache(self):
+        if not self.is_artifact_cache:
+            return None
+
+        return ArtifactCache(self._get_state_file_path(\
+                                            Const.ARTIFACT_CACHE_DIR), \
+                        M2Evictor.parse_size(self.artifact_cache_size), \
+                                                                self.m2_path)
+
+    def _compute_artifact_key(self, repository):
+        if self._artifact_cache is None:
+            return None
+
+        path = repository._absolute_path
+        upstream_keys = [self._artifact_keys.get(r) \
+                            for r in self._graph.upstreams(repository)]
+
+        if None in upstream_keys \
+                or self._run_process_command(self.GIT_STATUS_CMD, path):
+            return None
+
+        key = ArtifactCache.compute_key(\
+                    self._run_process_command(self.GIT_TREE_CMD, path), \
+                    [os.path.join(path, m.path, Const.POM_FILE) \
+                                            for m in repository.modules], \
+                    self.build_command, upstream_keys)
+
+        self._artifact_keys[repository] = key
+        return key
+
+    def _restore_artifacts(self, repository, artifact_key):
+        if artifact_key is None:
+            return False
+
+        with self.timeline.phase(repository._absolute_path, \
+                                            self.PHASE_ARTIFACT_CACHE):
+            if not self._artifact_cache.restore(artifact_key):
+                return False
+
+        logger.info(f'The {repository.initial} artifacts have been ' +\
+                        f'restored from the artifact cache {artifact_key}')
+        return True
+
+    def _store_artifacts(self, repository, artifact_key):
+        if artifact_key is not None:
+            self._artifact_cache.store(artifact_key, repository.modules)
+
+    def _create_test_cache(self):
+        if not self.is_test_cache or self.is_reactor or \
+                    self.MAVEN_SKIP_TESTS_PATTERN.search(self.build_command):
+            return None
+
+        return TestResultCache(self._get_state_file_path(\
+                                                    Const.TEST_CACHE_FILE))
+
+    def _get_test_keys(self, repository):
+        if self._test_cache is None:
+            return dict()
+
+        return self._test_keys.get(repository)
+
+    def _get_untested_modules(self, repository):
+        if self._test_cache is None:
+            return None
+
+        keys = self._get_test_keys(repository)
+
+        return [m for m in repository.modules \
+                    if not self._test_cache.is_passed(keys.get(m.coordinate))]
+
+    def _get_test_commands(self, repository, command, untested_modules):
+        tested = len(repository.modules) - len(untested_modules)
+
+        if tested == 0:
+            return command, None
+
+        logger.info(f'The {repository.initial} tests of {tested} modules ' +\
+                    'have already passed with the same sources, ' +\
+                    f'{len(untested_modules)} modules will be tested')
+
+        if not untested_modules:
+            return command + self.MAVEN_SKIP_TESTS_OPT, None
+
+        tested_modules = [m for m in repository.modules \
+                                                if m not in untested_modules]
+
+        return command + self.MAVEN_PROJECTS_OPT + \
+                    ','.join([str(m) for m in tested_modules]) + \
+                                            self.MAVEN_SKIP_TESTS_OPT, \
+                command + self.MAVEN_PROJECTS_OPT + \
+                    ','.join([str(m) for m in untested_modules])
+
+    def _is_process_to_build(self, repository, head):
+        if self.is_to_update \
+                and (not self.is_build_all or not self.is_clean_m2) \
+                and self._build_state.is_built(repository, head, \
+                                    self.build_branch, self.build_command):
+            raise ProcessNotValid(\
+                f'The {repository.initial} has not been built! The ' +\
+                    f'commit {head} has already been built successfully.')
+
+    def _read_head(self, repository_path):
+        return self._run_process_command(self.GIT_HEAD_CMD, \
+                                                    repository_path).strip()
+
+    def _run_process_command(self, command, path, on_line=None, env=None):
+        if self._command_runner is None:
+            self._command_runner = self._create_command_runner()
+
+        phase = self.timeline.get_current_phase() \
+                                        or ' '.join(command.split()[:2])
+        output = self._command_runner.run(command, path, on_line, env, \
+            lambda usage: self.resource_report.record(path, phase, usage))
+
+        logger.info(f'The command: "{command}" to the repository: ' +\
+                                    f'{path} has executed successfully')
+        return output
+
+
+class CommandRunner:
+    '''
+    This object is responsible for run the shell commands of the process
+    streaming theirs output line by line to a log file by repository,
+    stored in the log_dir folder. The log files are named by the path of
+    the repositories relative to the root_path, when it is passed, so the
+    repositories with the same folder name have different log files. Only
+    the last tail_lines lines are kept in memory to be returned and to be
+    shown when the command fails.
+
+    The Maven reactor progress found in the output is logged while the
+    command is still running. When sample_interval is passed the process
+    tree of each command is sampled by a ProcessSampler. When reading the
+    output fails, like when on_line raises, the command is killed and
+    waited before the error is raised.
+    '''
+    LOG_FILE_EXTENSION = '.log'
+    MAVEN_PROGRESS_PATTERN = re.compile(\
+                            r'\[INFO\] Building (.+?)\s+\[(\d+)/(\d+)\]\s*$')
+
+    def __init__(self, log_dir, tail_lines=Const.OUTPUT_TAIL_LINES, \
+                                    sample_interval=None, root_path=None):
+        self._log_dir = log_dir
+        self._root_path = root_path
+        self._tail_lines = tail_lines
+        self._sample_interval = sample_interval
+
+    def run(self, command, path, on_line=None, env=None, on_usage=None):
+        '''
+        Execute the command in the path folder and return the last lines
+        of its output. The callable on_line(line), when passed, receives
+        every output line, and the env dict, when passed, replaces the
+        environment variables of the command. The callable on_usage, when
+        passed, receives the ResourceUsage of the command when it has been
+        sampled. A BuilderProcessException is raised when the command
+        exits with an error.
+        '''
+        tail = collections.deque(maxlen=self._tail_lines)
+        log_path = self.get_log_path(path)
+
+        try:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+
+            with open(log_path, 'a', encoding='utf-8') as log_file:
+                log_file.write(f'$ {command}\n')
+
+                return_code = self._stream(command, path, log_file, tail, \
+                                                    on_line, env, on_usage)
+        except OSError as e:
+            raise BuilderProcessException(\
+                f'Failed executing the command: "{command}". '+\
+                                f'to the repository {path} '+\
+                                    f'Exception: {e}')
+
+        if return_code != 0:
+            raise BuilderProcessException(\
+                f'Failed executing the command: "{command}". '+\
+                    f'to the repository {path} '+\
+                        f'Exception: exit status {return_code}. ' +\
+                            f'See the full output at {log_path}. ' +\
+                                'Last output lines:\n' +\
+                        ''.join(list(tail)[-Const.ERROR_TAIL_LINES:]))
+
+        return ''.join(tail)
+
+    def get_log_path(self, path):
+        '''Return the log file path used for the commands of the path.'''
+        name = os.path.basename(os.path.normpath(path))
+
+        if self._root_path:
+            relative_path = os.path.relpath(path, self._root_path)
+
+            if relative_path != os.curdir \
+                                and not relative_path.startswith(os.pardir):
+                name = relative_path
+
+        return os.path.join(self._log_dir, name + self.LOG_FILE_EXTENSION)
+
+    def _stream(self, command, path, log_file, tail, on_line, env, on_usage):
+        process = subprocess.Popen(command, shell=True, cwd=path, env=env, \
+                                    stdout=subprocess.PIPE, \
+                                        stderr=subprocess.STDOUT, \
+                                            universal_newlines=True, \
+                                                errors='replace')
+        sampler = None
+
+        if self._sample_interval and ProcessSampler.is_supported():
+            sampler = ProcessSampler(process.pid, self._sample_interval)
+            sampler.start()
+
+        try:
+            self._read_output(process, path, log_file, tail, on_line)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            if sampler is not None:
+                usage = sampler.stop()
+
+                if on_usage:
+                    on_usage(usage)
+
+        return process.wait()
+
+    def _read_output(self, process, path, log_file, tail, on_line):
+        with process.stdout:
+            for line in process.stdout:
+                log_file.write(line)
+                tail.append(line)
+
+                if on_line:
+                    on_line(line)
+
+                self._log_progress(path, line)
+
+    def _log_progress(self, path, line):
+        progress = self.MAVEN_PROGRESS_PATTERN.search(line)
+
+        if progress:
+            name, index, total = progress.groups()
+            logger.info(f'Building {name} [{index}/{total}] to the ' +\
+                                                    f'repository: {path}')
+
+
+class ResourceUsage:
+    '''
+    The resources used by a command and its child processes: the peak of
+    the resident memory, the CPU seconds and the bytes read and written.
+    '''
+
+    def __init__(self, peak_rss=0, cpu_seconds=0, read_bytes=0, \
+                                                            write_bytes=0):
+        self.peak_rss = peak_rss
+        self.cpu_seconds = cpu_seconds
+        self.read_bytes = read_bytes
+        self.write_bytes = write_bytes
+
+    def add(self, usage):
+        '''Add the usage of a later command, keeping the highest peak.'''
+        self.peak_rss = max(self.peak_rss, usage.peak_rss)
+        self.cpu_seconds += usage.cpu_seconds
+        self.read_bytes += usage.read_bytes
+        self.write_bytes += usage.write_bytes
+
+
+class ProcessSampler:
+    '''
+    This object is responsible for sample the process tree of a command
+    from /proc each interval seconds, by a daemon thread, while the
+    command is running.
+
+    The resident memory of the tree is summed by sample to find its peak.
+    The CPU time and the I/O bytes of each process include the ones of
+    its finished children, thats are accounted to the parent when they
+    are waited, so the totals are the highest sum seen. The last sample
+    is taken when the command has exited but it is still not waited.
+    '''
+    PROC_PATH = '/proc'
+    STAT_FILE = 'stat'
+    IO_FILE = 'io'
+    TASK_DIR = 'task'
+    CHILDREN_FILE = 'children'
+    READ_BYTES_KEY = 'read_bytes'
+    WRITE_BYTES_KEY = 'write_bytes'
+    PPID_FIELD = 1
+    UTIME_FIELD = 11
+    CSTIME_FIELD = 14
+    RSS_FIELD = 21
+
+    def __init__(self, pid, interval=Const.SAMPLE_INTERVAL):
+        self._pid = pid
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._usage = ResourceUsage()
+        self._is_children_supported = True
+        self._clock_ticks = os.sysconf('SC_CLK_TCK')
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+
+    @staticmethod
+    def is_supported():
+        '''Return True when the /proc file system is available.'''
+        return os.path.isdir(os.path.join(ProcessSampler.PROC_PATH, \
+                                                            str(os.getpid())))
+
+    def start(self):
+        '''Start sampling the process tree.'''
+        self._thread.start()
+
+    def stop(self):
+        '''Stop sampling, take the last sample and return the ResourceUsage.'''
+        self._stopped.set()
+        self._thread.join()
+
+        try:
+            os.waitid(os.P_PID, self._pid, os.WEXITED | os.WNOWAIT)
+        except (AttributeError, ChildProcessError, OSError):
+            pass
+
+        self._sample()
+        return self._usage
+
+    def _run(self):
+        self._sample()
+
+        while not self._stopped.wait(self._interval):
+            self._sample()
+
+    def _sample(self):
+        rss = cpu_ticks = read_bytes = write_bytes = 0
+
+        for pid in self._get_tree():
+            stat = self._read_stat(pid)
+
+            if stat is None:
+                continue
+
+            rss += int(stat[self.RSS_FIELD]) * self._page_size
+            cpu_ticks += sum([int(t) for t in \
+                        stat[self.UTIME_FIELD:self.CSTIME_FIELD + 1]])
+
+            io = self._read_io(pid)
+            read_bytes += io.get(self.READ_BYTES_KEY, 0)
+            write_bytes += io.get(self.WRITE_BYTES_KEY, 0)
+
+        self._usage.peak_rss = max(self._usage.peak_rss, rss)
+        self._usage.cpu_seconds = max(self._usage.cpu_seconds, \
+                                            cpu_ticks / self._clock_ticks)
+        self._usage.read_bytes = max(self._usage.read_bytes, read_bytes)
+        self._usage.write_bytes = max(self._usage.write_bytes, write_bytes)
+
+    def _get_tree(self):
+        if self._is_children_supported:
+            tree = self._get_tree_by_children()
+
+            if tree is not None:
+                return tree
+
+            self._is_children_supported = False
+
+        return self._get_tree_by_parents()
+
+    def _get_tree_by_children(self):
+        tree = list()
+        pending = [self._pid]
+
+        while pending:
+            pid = pending.pop()
+            tree.append(pid)
+            task_path = os.path.join(self.PROC_PATH, str(pid), self.TASK_DIR)
+
+            try:
+                for tid in os.listdir(task_path):
+                    with open(os.path.join(task_path, tid, \
+                                    self.CHILDREN_FILE)) as children_file:
+                        pending.extend([int(c) for c in \
+                                                children_file.read().split()])
+            except FileNotFoundError:
+                if pid == self._pid and os.path.isdir(task_path):
+                    return None
+            except OSError:
+                pass
+
+        return tree
+
+    def _get_tree_by_parents(self):
+        children = dict()
+
+        for name in os.listdir(self.PROC_PATH):
+            if name.isdigit():
+                stat = self._read_stat(int(name))
+
+                if stat is not None:
+                    children.setdefault(int(stat[self.PPID_FIELD]), \
+                                                    list()).append(int(name))
+
+        tree = list()
+        pending = [self._pid]
+
+        while pending:
+            pid = pending.pop()
+            tree.append(pid)
+            pending.extend(children.get(pid, list()))
+
+        return tree
+
+    def _read_stat(self, pid):
+        try:
+            with open(os.path.join(self.PROC_PATH, str(pid), \
+                                                self.STAT_FILE)) as stat_file:
+                return stat_file.read().rsplit(')', 1)[1].split()
+        except (OSError, IndexError):
+            return None
+
+    def _read_io(self, pid):
+        try:
+            with open(os.path.join(self.PROC_PATH, str(pid), \
+                                                    self.IO_FILE)) as io_file:
+                return {k.strip(): int(v) for k, v in \
+                        [l.split(':', 1) for l in io_file if ':' in l]}
+        except (OSError, ValueError):
+            return dict()
+
+
+class ResourceReport:
+    '''
+    This object is responsible for aggregate the ResourceUsage of the
+    commands by repository, named lane, and phase, in order to show them
+    in a table and to write them to a JSON file at the end of the run.
+
+    The instance is thread safe.
+    '''
+    MB = 1024 ** 2
+
+    def __init__(self, root_path=None):
+        self._root_path = root_path
+        self._lock = threading.Lock()
+        self._usages = dict()
+
+    def record(self, lane, phase, usage):
+        '''Add the ResourceUsage of a command to the lane and phase.'''
+        with self._lock:
+            self._usages.setdefault((lane, phase), ResourceUsage()).add(usage)
+
+    def format(self):
+        '''Return a text table with the resources by lane and phase.'''
+        with self._lock:
+            usages = sorted(self._usages.items(), key=lambda u: u[0])
+
+        lines = [f'{"repository":<30} | {"phase":<14} | {"peak RSS":>10} ' +\
+                    f'| {"CPU":>9} | {"read":>10} | {"written":>10}']
+
+        for (lane, phase), usage in usages:
+            lines.append(f'{self._get_lane_name(lane):<30} | ' +\
+                f'{phase:<14} | {usage.peak_rss / self.MB:>7.1f} MB | ' +\
+                    f'{usage.cpu_seconds:>8.2f}s | ' +\
+                        f'{usage.read_bytes / self.MB:>7.1f} MB | ' +\
+                            f'{usage.write_bytes / self.MB:>7.1f} MB')
+
+        return '\n'.join(lines)
+
+    def export(self, file_path):
+        '''Log the table and write the resources to a JSON file.'''
+        with self._lock:
+            content = [dict({'repository': self._get_lane_name(lane), \
+                            'phase': phase}, **vars(usage)) \
+                                for (lane, phase), usage in self._usages.items()]
+
+        logger.info('Build resources summary:\n' + self.format())
+
+        try:
+            PathHelper.write_json(file_path, content)
+
+            logger.info(f'The build resources have been written to {file_path}')
+        except BuilderProcessException as e:
+            logger.warning(e)
+
+    def _get_lane_name(self, lane):
+        if self._root_path and os.path.isabs(lane):
+            return os.path.relpath(lane, self._root_path)
+
+        return os.path.basename(os.path.normpath(lane))
+
+
+class BuildBackend:
+    '''
+    This object represents the tool thats executes the Maven commands of
+    Const.BUILD_CMDS. The default backend runs the plain mvn command, thats
+    starts a new JVM for each build.
+
+    The backends are registered by theirs NAME and created by the create
+    method, thats falls back to the plain mvn backend when the executable
+    of the chosen backend is not available.
+    '''
+    NAME = Const.BUILD_BACKEND_MVN
+    EXECUTABLE = 'mvn'
+    MAVEN_EXECUTABLE = 'mvn'
+
+    def is_available(self):
+        '''Return True if the backend executable is found in the PATH.'''
+        return shutil.which(self.EXECUTABLE) is not None
+
+    def get_command(self, command):
+        '''Return the Maven command adapted to be run by the backend.'''
+        return command
+
+    @staticmethod
+    def create(name):
+        '''
+        Return an instance of the backend registered by the name, or of
+        the plain mvn backend if it is not available.
+        '''
+        backends = {b.NAME: b for b in \
+                        [BuildBackend] + BuildBackend.__subclasses__()}
+
+        if name not in backends:
+            raise BuilderProcessException(\
+                                f"The '{name}' is not a valid build backend.")
+
+        backend = backends[name]()
+
+        if name != Const.BUILD_BACKEND_MVN and not backend.is_available():
+            logger.warning(f'The build backend {name} is not available, ' +\
+                    f'the {Const.BUILD_BACKEND_MVN} backend will be used.')
+            return BuildBackend()
+
+        return backend
+
+
+class MavenDaemonBackend(BuildBackend):
+    '''
+    Inherits from the class BuildBackend to run the Maven commands by the
+    Maven Daemon (mvnd), thats keeps warm JVMs between the builds of the
+    repositories and between the runs.
+    '''
+    NAME = Const.BUILD_BACKEND_MVND
+    EXECUTABLE = 'mvnd'
+
+    def get_command(self, command):
+        '''Return the Maven command using the mvnd executable.'''
+        executable, _, arguments = command.partition(' ')
+
+        if executable != self.MAVEN_EXECUTABLE:
+            return command
+
+        return f'{self.EXECUTABLE} {arguments}'
+
+
+class MavenReactor:
+    '''
+    This object is responsible for generate an aggregator pom.xml in the
+    reactor_dir folder listing the repositories as modules, in order to
+    build all of them by a single Maven execution, and to map the Maven
+    reactor summary back to the result of each repository.
+
+    A repository has been built successfully when all its modules are
+    reported as SUCCESS in the reactor summary. The summary names the
+    projects by theirs name, or artifactId, only, so when modules of
+    several repositories share a name they are successful only when all
+    the projects reported with that name are, and a repository without
+    modules or with a module not reported has failed.
+    '''
+    AGGREGATOR_ARTIFACT_ID = 'multiple-builder-reactor'
+    SUCCESS_STATUS = 'SUCCESS'
+    SUMMARY_PATTERN = re.compile(\
+        r'\[INFO\] (.+?) \.{2,}.*?\b(SUCCESS|FAILURE|SKIPPED)\b')
+    AGGREGATOR_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0"
+         xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+         xsi:schemaLocation="http://maven.apache.org/POM/4.0.0 http://maven.apache.org/xsd/maven-4.0.0.xsd">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>multiple.builder</groupId>
+  <artifactId>{artifact_id}</artifactId>
+  <version>1</version>
+  <packaging>pom</packaging>
+  <modules>
+{modules}
+  </modules>
+</project>
+'''
+
+    def __init__(self, reactor_dir, repositories):
+        self.reactor_dir = reactor_dir
+        self._repositories = list(repositories)
+        self._statuses = collections.defaultdict(list)
+
+    def write_aggregator_pom(self):
+        '''Write the aggregator pom.xml and return its path.'''
+        pom_path = os.path.join(self.reactor_dir, Const.POM_FILE)
+        modules = '\n'.join([f'    <module>{self._get_module_path(r)}</module>' \
+                                                for r in self._repositories])
+
+        try:
+            os.makedirs(self.reactor_dir, exist_ok=True)
+
+            with open(pom_path, 'w', encoding='utf-8') as pom_file:
+                pom_file.write(self.AGGREGATOR_TEMPLATE.format(\
+                    artifact_id=self.AGGREGATOR_ARTIFACT_ID, modules=modules))
+        except OSError as e:
+            raise BuilderProcessException(\
+                f'Failed to write the aggregator POM {pom_path}. ' +\
+                                                        f'Exception: {e}')
+
+        return pom_path
+
+    def read_line(self, line):
+        '''Read a Maven output line storing the reactor summary status.'''
+        summary = self.SUMMARY_PATTERN.search(line)
+
+        if summary:
+            name, status = summary.groups()
+            self._statuses[name.strip()].append(status)
+
+    def get_failed_repositories(self):
+        '''
+        Return the list of repositories without modules or with any
+        module not reported as SUCCESS by the reactor summary.
+        '''
+        names = [[self._get_summary_name(m) for m in r.modules] \
+                                                for r in self._repositories]
+        counts = collections.Counter([n for r in names for n in r])
+
+        return [r for r, modules_names in zip(self._repositories, names) \
+                    if not modules_names or not all([self._is_success(n, \
+                                        counts[n]) for n in modules_names])]
+
+    def _get_module_path(self, repository):
+        return Path(os.path.relpath(repository._absolute_path, \
+                                            self.reactor_dir)).as_posix()
+
+    def _is_success(self, summary_name, modules_count):
+        statuses = self._statuses.get(summary_name, list())
+
+        return summary_name is not None \
+                and len(statuses) >= modules_count \
+                    and all([s == self.SUCCESS_STATUS for s in statuses])
+
+    def _get_summary_name(self, module):
+        for name in (module.name, module.artifact_id):
+            for summary_name in self._statuses:
+                if name and (summary_name == name \
+                        or summary_name.rsplit(' ', 1)[0] == name):
+                    return summary_name
+
+        return None
+
+
+class BuildTimeline:
+    '''
+    This object is responsible for record the start and the duration of
+    the phases executed for each repository, named lanes, in order to
+    export them as a Chrome trace-event JSON file, thats can be opened by
+    chrome://tracing or Perfetto, and to summarize them in a table.
+
+    The repository lanes are named by theirs path relative to the
+    root_path, when it is passed, or by theirs folder name otherwise.
+    The instance is thread safe.
+    '''
+    PROCESS_LANE = 'multiple_builder'
+    TOTAL_COLUMN = 'total'
+
+    def __init__(self, root_path=None):
+        self._root_path = root_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._lanes = dict()
+        self._events = list()
+
+    @contextlib.contextmanager
+    def phase(self, lane, name):
+        '''
+        Context manager thats records the time spent in its block as the
+        phase name of the lane. The phase is recorded even when the block
+        raises an error.
+        '''
+        start = time.monotonic()
+        parent = self.get_current_phase()
+        self._local.phase = name
+
+        try:
+            yield
+        finally:
+            self._local.phase = parent
+            self.record(lane, name, start, time.monotonic())
+
+    def get_current_phase(self):
+        '''Return the name of the phase running in this thread or None.'''
+        return getattr(self._local, 'phase', None)
+
+    def record(self, lane, name, start, end):
+        '''Record a phase of the lane by its time.monotonic() interval.'''
+        with self._lock:
+            self._lanes.setdefault(lane, len(self._lanes) + 1)
+            self._events.append((lane, name, start, end))
+
+    def get_events(self):
+        '''Return a list of (lane, phase name, start, end) recorded.'''
+        with self._lock:
+            return list(self._events)
+
+    def export_chrome_trace(self, file_path):
+        '''Write the recorded phases in the Chrome trace-event format.'''
+        with self._lock:
+            trace_events = [{
+                'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid,
+                'args': {'name': self._get_lane_name(lane)}
+            } for lane, tid in self._lanes.items()]
+
+            trace_events.extend([{
+                'name': name, 'cat': name.split()[0], 'ph': 'X', 'pid': 1,
+                'tid': self._lanes[lane],
+                'ts': int((start - self._start) * 1000000),
+                'dur': int((end - start) * 1000000)
+            } for lane, name, start, end in self._events])
+
+        try:
+            PathHelper.write_json(file_path, {'traceEvents': trace_events, \
+                                                'displayTimeUnit': 'ms'})
+
+            logger.info(f'The build timeline has been written to {file_path}')
+        except BuilderProcessException as e:
+            logger.warning(e)
+
+    def format_summary(self):
+        '''
+        Return a text table with the seconds spent in each phase by lane
+        and the total wall time of the recorded phases.
+        '''
+        durations = dict()
+        phases = list()
+
+        for lane, name, start, end in self.get_events():
+            lane_durations = durations.setdefault(lane, dict())
+            lane_durations[name] = lane_durations.get(name, 0) + end - start
+
+            if name not in phases:
+                phases.append(name)
+
+        rows = [[self._get_lane_name(lane)] + \
+                    [self._format_seconds(d[p]) if p in d else '-' \
+                                                        for p in phases] + \
+                    [self._format_seconds(sum(d.values()))] \
+                                            for lane, d in durations.items()]
+
+        return self._format_table(\
+                    ['repository'] + phases + [self.TOTAL_COLUMN], rows) + \
+                        f'\nWall time: {self._get_wall_time():.2f}s'
+
+    def _get_lane_name(self, lane):
+        if self._root_path and os.path.isabs(lane):
+            return os.path.relpath(lane, self._root_path)
+
+        return os.path.basename(os.path.normpath(lane))
+
+    def _get_wall_time(self):
+        events = self.get_events()
+
+        if not events:
+            return 0
+
+        return max([e[3] for e in events]) - min([e[2] for e in events])
+
+    def _format_seconds(self, seconds):
+        return f'{seconds:.2f}s'
+
+    def _format_table(self, header, rows):
+        widths = [max([len(r[i]) for r in [header] + rows]) \
+                                            for i in range(len(header))]
+        lines = [' | '.join([c.ljust(w) for c, w in zip(r, widths)]) \
+                                                    for r in [header] + rows]
+        lines.insert(1, '-+-'.join(['-' * w for w in widths]))
+
+        return '\n'.join(lines)
+
+
+class BuildStateStore:
+    '''
+    This object is responsible for persist in a JSON file the state of
+    the last successful build of each repository: the HEAD commit SHA,
+    the branch and the build command used. It is used to skip the builds
+    of repositories that have not changed since then.
+
+    The instance is thread safe and the file is rewritten atomically on
+    every record.
+    '''
+    SHA_KEY = 'sha'
+    BRANCH_KEY = 'branch'
+    COMMAND_KEY = 'command'
+    BUILT_AT_KEY = 'built_at'
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._states = self._load()
+
+    def is_built(self, repository, sha, branch, command):
+        '''
+        Return True if the repository has been built successfully with
+        the same HEAD commit SHA, branch and build command.
+        '''
+        state = self._states.get(self._get_key(repository), dict())
+
+        return state.get(self.SHA_KEY) == sha \
+                    and state.get(self.BRANCH_KEY) == branch \
+                        and state.get(self.COMMAND_KEY) == command
+
+    def get_built_sha(self, repository, branch, command):
+        '''
+        Return the HEAD commit SHA of the last successful build of the
+        repository with the same branch and build command, or None.
+        '''
+        state = self._states.get(self._get_key(repository), dict())
+
+        if state.get(self.BRANCH_KEY) == branch \
+                and state.get(self.COMMAND_KEY) == command:
+            return state.get(self.SHA_KEY)
+
+        return None
+
+    def record(self, repository, sha, branch, command):
+        '''Store the state of a successful build of the repository.'''
+        with self._lock:
+            self._states[self._get_key(repository)] = {
+                self.SHA_KEY: sha,
+                self.BRANCH_KEY: branch,
+                self.COMMAND_KEY: command,
+                self.BUILT_AT_KEY: time.time()
+            }
+
+            PathHelper.write_json(self._file_path, self._states)
+
+    def _get_key(self, repository):
+        return os.path.abspath(repository._absolute_path)
+
+    def _load(self):
+        try:
+            return PathHelper.read_json(self._file_path)
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return dict()
+
+
+class BuildHistory:
+    '''
+    This object is responsible for persist in a JSON file the duration
+    of the phases of each repository, like the Git commands and the Maven
+    build, as an exponential moving average of the runs, in order to
+    estimate the time a repository takes to be synchronized and built.
+
+    The repositories without history are estimated by the average of
+    the known ones. The instance is thread safe.
+    '''
+    SMOOTHING = 0.5
+    DEFAULT_ESTIMATE = 1.0
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._history = self._load()
+
+    def estimate(self, repository):
+        '''Return the estimated seconds of all phases of the repository.'''
+        with self._lock:
+            phases = self._history.get(self._get_key(repository))
+
+            if phases:
+                return sum(phases.values())
+
+            known = [sum(p.values()) for p in self._history.values() if p]
+
+        return sum(known) / len(known) if known else self.DEFAULT_ESTIMATE
+
+    def record(self, repositories, events):
+        '''
+        Update the history of the repositories with the (lane, phase
+        name, start, end) events of a BuildTimeline, whose lanes are the
+        repositories paths.
+        '''
+        durations = dict()
+
+        for lane, name, start, end in events:
+            lane_durations = durations.setdefault(lane, dict())
+            lane_durations[name] = lane_durations.get(name, 0) + end - start
+
+        with self._lock:
+            for repository in repositories:
+                phases = self._history.setdefault(\
+                                        self._get_key(repository), dict())
+
+                for name, duration in durations.get(\
+                                    repository._absolute_path, {}).items():
+                    phases[name] = duration if name not in phases else \
+                        phases[name] + (duration - phases[name]) * \
+                                                        self.SMOOTHING
+
+            try:
+                PathHelper.write_json(self._file_path, self._history)
+            except BuilderProcessException as e:
+                logger.warning(e)
+
+    def _get_key(self, repository):
+        return os.path.abspath(repository._absolute_path)
+
+    def _load(self):
+        try:
+            return PathHelper.read_json(self._file_path)
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return dict()
+
+
+class BuildPlan:
+    '''
+    This object is responsible for predict the order and the time of a
+    build, simulating the scheduler with the estimated seconds of each
+    repository: up to jobs repositories at same time, each one starting
+    after the repositories it depends on, the longest critical path first.
+    '''
+
+    def __init__(self, graph, estimate, jobs=Const.BUILD_JOBS):
+        self._graph = graph
+        self._estimate = estimate
+        self._jobs = max(1, int(jobs))
+
+    def simulate(self):
+        '''
+        Return a list of (repository, start, end, critical path) in the
+        predicted start order, with the seconds since the build start.
+        '''
+        critical_paths = self._graph.get_critical_paths(self._estimate)
+        pending = sorted(self._graph.topological_order(), \
+                                        key=lambda r: -critical_paths[r])
+        finished = dict()
+        running = list()
+        plan = list()
+        now = 0
+
+        while pending or running:
+            ready = [r for r in pending if self._graph.upstreams(r) \
+                    <= set(finished)][:self._jobs - len(running)]
+
+            for repository in ready:
+                pending.remove(repository)
+                end = now + self._estimate(repository)
+                running.append((end, repository))
+                plan.append((repository, now, end, \
+                                            critical_paths[repository]))
+
+            running.sort(key=lambda r: r[0])
+            now, repository = running.pop(0)
+            finished[repository] = now
+
+        return plan
+
+    def format(self):
+        '''Return a text table with the predicted order and time.'''
+        plan = self.simulate()
+        lines = [f'{"#":>4} | {"repository":<30} | {"start":>9} | ' +\
+                                    f'{"end":>9} | {"critical path":>13}']
+
+        for index, (repository, start, end, critical_path) in \
+                                                    enumerate(plan, 1):
+            name = os.path.basename(os.path.normpath(\
+                                                repository._absolute_path))
+            lines.append(f'{index:>4} | {name:<30} | {start:>8.2f}s | ' +\
+                            f'{end:>8.2f}s | {critical_path:>12.2f}s')
+
+        eta = max([p[2] for p in plan], default=0)
+        return '\n'.join(lines) + f'\nEstimated time: {eta:.2f}s'
+
+
+class BranchWorktrees:
+    '''
+    This object is responsible for the persistent Git worktrees of the
+    branches built at same time. Each repository gets a worktree by
+    branch inside the worktrees folder of the branch, detached at the
+    origin branch head, and each branch has its own local Maven
+    repository. The worktrees already created are reused, so the build
+    outputs are kept between the runs. The build state of each branch,
+    like its logs, journal and history, is kept in the branches folder
+    of the root state folder, by branch name.
+
+    The Git commands are executed by the run_command(command, path)
+    callable and timed in the timeline, as the others process commands.
+    '''
+    GIT_FETCH_BRANCH_CMD = \
+                'git fetch origin +refs/heads/{0}:refs/remotes/origin/{0}'
+    GIT_WORKTREE_PRUNE_CMD = 'git worktree prune'
+    GIT_WORKTREE_ADD_CMD = 'git worktree add --detach "{0}" origin/{1}'
+    PHASE_GIT_WORKTREE = 'git worktree'
+    BRANCH_FOLDER_PATTERN = re.compile(r'[^\w.-]')
+
+    def __init__(self, root_path, branches, run_command, timeline, \
+                                                        jobs=Const.SYNC_JOBS):
+        self._root_path = root_path
+        self._branches = list(branches)
+        self._run_command = run_command
+        self._timeline = timeline
+        self._jobs = max(1, jobs)
+
+    def create(self, repositories):
+        '''
+        Create concurrently the missing worktrees of the repositories and
+        return a dict with the list of worktree Repository by branch, in
+        the same order of the repositories.
+        '''
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            repositories_worktrees = list(executor.map(\
+                            self._create_repository_worktrees, repositories))
+
+        return {b: [w[i] for w in repositories_worktrees] \
+                                    for i, b in enumerate(self._branches)}
+
+    def get_branch_path(self, branch):
+        '''Return the folder with the worktrees of the branch.'''
+        return os.path.join(self._root_path, Const.STATE_DIR, \
+                        Const.WORKTREES_DIR, self._get_branch_folder(branch))
+
+    def get_m2_path(self, branch):
+        '''Return the local Maven repository folder of the branch.'''
+        return os.path.join(self._root_path, Const.STATE_DIR, \
+                        Const.BRANCH_M2_DIR, self._get_branch_folder(branch))
+
+    def get_state_path(self, branch):
+        '''Return the build state folder of the branch.'''
+        return os.path.join(self._root_path, Const.STATE_DIR, \
+                        Const.BRANCHES_DIR, self._get_branch_folder(branch))
+
+    def _create_repository_worktrees(self, repository):
+        return [self._create_worktree(repository, b) for b in self._branches]
+
+    def _create_worktree(self, repository, branch):
+        repository_path = repository._absolute_path
+        worktree_path = os.path.join(self.get_branch_path(branch), \
+                            os.path.relpath(repository_path, self._root_path))
+
+        if os.path.exists(os.path.join(worktree_path, Const.GIT_DIR)):
+            logger.info(f'The worktree {worktree_path} of the branch ' +\
+                                        f'{branch} has been reused')
+            return Repository(worktree_path)
+
+        with self._timeline.phase(repository_path, self.PHASE_GIT_WORKTREE):
+            self._run_command(self.GIT_WORKTREE_PRUNE_CMD, repository_path)
+            self._run_command(self.GIT_FETCH_BRANCH_CMD.format(branch), \
+                                                            repository_path)
+            self._run_command(self.GIT_WORKTREE_ADD_CMD.format(\
+                                worktree_path, branch), repository_path)
+
+        return Repository(worktree_path)
+
+    def _get_branch_folder(self, branch):
+        return self.BRANCH_FOLDER_PATTERN.sub('_', branch)
+
+
+class StagingRepository:
+    '''
+    This object is responsible for the staging local Maven repository of
+    a single build, thats receives the installed and the downloaded
+    artifacts while the shared local repository is only read, by the
+    maven.repo.local.tail option of Maven 3.9 or newer.
+
+    When the build succeeds the staging files are merged into the shared
+    repository, each one copied to a temporary file and renamed over the
+    target, with the POM files renamed last, so the concurrent builds
+    never see a partial artifact. The failed downloads markers and the
+    resolver temporary files are not merged.
+
+    The maven-metadata XML files, the _remote.repositories and the
+    resolver-status.properties files also hold the state written by the
+    others builds, so when they already exist in the shared repository
+    they are merged instead of replaced: the versions and the snapshot
+    versions of both metadata are kept, and the properties of both files
+    are kept, the staging ones winning.
+    '''
+    REPO_LOCAL_PATTERN = re.compile(\
+                        r'\s-Dmaven\.repo\.local(\.tail)?=("[^"]*"|\S+)')
+    REPO_LOCAL_OPT = ' -Dmaven.repo.local='
+    REPO_LOCAL_TAIL_OPT = ' -Dmaven.repo.local.tail='
+    POM_EXTENSION = '.pom'
+    SKIPPED_EXTENSIONS = ('.lastUpdated', '.part', '.lock', '.tmp')
+    METADATA_PATTERN = re.compile(r'^maven-metadata.*\.xml$')
+    PROPERTIES_FILES = ('_remote.repositories', 'resolver-status.properties')
+    VERSIONING_TAG = 'versioning'
+    VERSIONS_TAG = 'versions'
+    VERSION_TAG = 'version'
+    SNAPSHOT_VERSIONS_TAG = 'snapshotVersions'
+    SNAPSHOT_KEY_TAGS = ('classifier', 'extension')
+    LAST_UPDATED_TAG = 'lastUpdated'
+    _merge_lock = threading.Lock()
+
+    def __init__(self, staging_path, shared_path):
+        self._staging_path = staging_path
+        self._shared_path = str(shared_path)
+
+    def set_local_repository(self, command):
+        '''
+        Return the Maven command using the staging repository as the
+        local repository and the shared repository as its read-only tail.
+        The files left by an interrupted build are deleted.
+        '''
+        self.discard()
+        os.makedirs(self._staging_path, exist_ok=True)
+
+        return self.REPO_LOCAL_PATTERN.sub('', command) + \
+                    f'{self.REPO_LOCAL_OPT}"{self._staging_path}"' + \
+                        f'{self.REPO_LOCAL_TAIL_OPT}"{self._shared_path}"'
+
+    def merge(self):
+        '''Merge the staging files into the shared repository.'''
+        files = self._list_files()
+        files.sort(key=lambda f: f.endswith(self.POM_EXTENSION))
+
+        try:
+            for relative_path in files:
+                self._merge_file(relative_path)
+        except OSError as e:
+            raise BuilderProcessException(\
+                f'Failed to merge the staging repository ' +\
+                    f'{self._staging_path} into {self._shared_path}. ' +\
+                                                        f'Exception: {e}')
+
+        logger.info(f'{len(files)} files of the staging repository ' +\
+            f'{self._staging_path} have been merged into {self._shared_path}')
+
+    def discard(self):
+        '''Delete the staging repository.'''
+        shutil.rmtree(self._staging_path, ignore_errors=True)
+
+    def _list_files(self):
+        files = list()
+
+        for folder, _, file_names in os.walk(self._staging_path):
+            files.extend([os.path.relpath(os.path.join(folder, f), \
+                        self._staging_path) for f in file_names \
+                            if not f.endswith(self.SKIPPED_EXTENSIONS)])
+
+        return files
+
+    def _merge_file(self, relative_path):
+        source = os.path.join(self._staging_path, relative_path)
+        target = os.path.join(self._shared_path, relative_path)
+
+        if self._is_same_file(source, target):
+            return
+
+        name = os.path.basename(relative_path)
+
+        if name in self.PROPERTIES_FILES or self.METADATA_PATTERN.match(name):
+            with self._merge_lock:
+                if os.path.isfile(target):
+                    return self._write_file(target, \
+                        self._merge_properties(source, target) \
+                            if name in self.PROPERTIES_FILES \
+                                else self._merge_metadata(source, target))
+
+                self._copy_file(source, target)
+        else:
+            self._copy_file(source, target)
+
+    def _copy_file(self, source, target):
+        temp_path = f'{target}.{threading.get_ident()}.tmp'
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        try:
+            shutil.copy2(source, temp_path)
+            os.replace(temp_path, target)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _write_file(self, target, content):
+        temp_path = f'{target}.{threading.get_ident()}.tmp'
+
+        try:
+            with open(temp_path, 'wb') as temp_file:
+                temp_file.write(content)
+
+            os.replace(temp_path, target)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _merge_properties(self, source, target):
+        properties = dict()
+        comments = list()
+
+        for file_path in (target, source):
+            comments = list()
+
+            with open(file_path, encoding='utf-8') as properties_file:
+                for line in properties_file.read().splitlines():
+                    if not line.strip() or line.lstrip().startswith('#'):
+                        comments.append(line)
+                    else:
+                        key, _, value = line.partition('=')
+                        properties[key] = value
+
+        return '\n'.join(comments + [f'{k}={v}' \
+                        for k, v in properties.items()] + ['']).encode()
+
+    def _merge_metadata(self, source, target):
+        try:
+            staged = self._parse_metadata(source)
+            shared = self._parse_metadata(target)
+        except ElementTree.ParseError as e:
+            logger.warning(f'Failed to merge the Maven metadata {target}, ' +\
+                            f'it has been replaced. Exception: {e}')
+            with open(source, 'rb') as source_file:
+                return source_file.read()
+
+        staged_versioning = staged.find(self.VERSIONING_TAG)
+        shared_versioning = shared.find(self.VERSIONING_TAG)
+
+        if staged_versioning is not None and shared_versioning is not None:
+            self._merge_versions(staged_versioning, shared_versioning)
+            self._merge_snapshot_versions(staged_versioning, \
+                                                        shared_versioning)
+            last_updated = max([v.findtext(self.LAST_UPDATED_TAG, '') \
+                        for v in (staged_versioning, shared_versioning)])
+
+            if last_updated:
+                self._get_child(staged_versioning, \
+                                self.LAST_UPDATED_TAG).text = last_updated
+
+        return ElementTree.tostring(staged, encoding='UTF-8', \
+                                                    xml_declaration=True)
+
+    def _merge_versions(self, staged_versioning, shared_versioning):
+        versions = [v.text for v in shared_versioning.findall(\
+                                    f'{self.VERSIONS_TAG}/{self.VERSION_TAG}')]
+        versions += [v.text for v in staged_versioning.findall(\
+                                    f'{self.VERSIONS_TAG}/{self.VERSION_TAG}') \
+                                                    if v.text not in versions]
+
+        if not versions:
+            return
+
+        versions_element = self._get_child(staged_versioning, \
+                                                        self.VERSIONS_TAG)
+        versions_element.clear()
+
+        for version in versions:
+            ElementTree.SubElement(versions_element, \
+                                            self.VERSION_TAG).text = version
+
+    def _merge_snapshot_versions(self, staged_versioning, shared_versioning):
+        shared_snapshots = shared_versioning.find(self.SNAPSHOT_VERSIONS_TAG)
+
+        if shared_snapshots is None:
+            return
+
+        snapshots = self._get_child(staged_versioning, \
+                                                self.SNAPSHOT_VERSIONS_TAG)
+        keys = set([self._get_snapshot_key(s) for s in snapshots])
+
+        for snapshot in shared_snapshots:
+            if self._get_snapshot_key(snapshot) not in keys:
+                snapshots.append(snapshot)
+
+    def _get_snapshot_key(self, snapshot):
+        return tuple([snapshot.findtext(t, '') for t in self.SNAPSHOT_KEY_TAGS])
+
+    def _get_child(self, element, tag):
+        child = element.find(tag)
+
+        if child is None:
+            child = ElementTree.SubElement(element, tag)
+
+        return child
+
+    def _parse_metadata(self, file_path):
+        metadata = ElementTree.parse(file_path).getroot()
+        namespace = None
+
+        for element in metadata.iter():
+            if isinstance(element.tag, str) and '}' in element.tag:
+                namespace, element.tag = element.tag[1:].split('}', 1)
+
+        if namespace:
+            metadata.set('xmlns', namespace)
+
+        return metadata
+
+    def _is_same_file(self, source, target):
+        try:
+            source_stat = os.stat(source)
+            target_stat = os.stat(target)
+        except OSError:
+            return False
+
+        return source_stat.st_size == target_stat.st_size \
+                    and source_stat.st_mtime == target_stat.st_mtime
+
+
+class ArtifactCache:
+    '''
+    This object is responsible for store the artifacts installed in the
+    Maven m2 folder by a repository build, addressed by a key computed
+    from the repository sources, POMs, build command and the keys of the
+    upstream repositories. When a key is found the artifacts are copied
+    back to the m2 folder instead of building the repository.
+
+    The least recently used entries are evicted when the cache is bigger
+    than max_size bytes. The instance is thread safe.
+    '''
+    ENTRY_FILE = 'entry.json'
+    ENTRY_M2_DIR = 'm2'
+    SIZE_KEY = 'size'
+
+    def __init__(self, cache_dir, max_size, m2_path=None):
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._m2_path = Path(m2_path) if m2_path \
+                            else PathHelper._get_m2_path()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def compute_key(tree_sha, pom_paths, command, upstream_keys):
+        '''
+        Return the SHA-256 key for the Git tree SHA of the sources, the
+        content of the POM files, the build command and the keys of the
+        upstream repositories.
+        '''
+        digest = hashlib.sha256()
+        digest.update(tree_sha.strip().encode())
+        digest.update(command.encode())
+
+        for pom_path in sorted(pom_paths):
+            with open(pom_path, 'rb') as pom_file:
+                digest.update(pom_file.read())
+
+        for upstream_key in sorted(upstream_keys):
+            digest.update(upstream_key.encode())
+
+        return digest.hexdigest()
+
+    def restore(self, key):
+        '''
+        Copy the artifacts stored by the key to the m2 folder. Return True
+        when the key has been found or False otherwise.
+        '''
+        entry_path = os.path.join(self._cache_dir, key)
+
+        with self._lock:
+            if not os.path.isdir(entry_path):
+                return False
+
+            try:
+                shutil.copytree(os.path.join(entry_path, self.ENTRY_M2_DIR), \
+                                        self._m2_path, dirs_exist_ok=True)
+                os.utime(entry_path)
+            except OSError as e:
+                logger.warning(f'Failed to restore the artifact cache ' +\
+                                        f'{entry_path}. Exception: {e}')
+                return False
+
+        return True
+
+    def store(self, key, modules):
+        '''
+        Copy the installed artifacts of the MavenModule list from the m2
+        folder to the cache with the key, evicting old entries if needed.
+        '''
+        artifact_paths = self._get_artifact_paths(modules)
+
+        if not artifact_paths:
+            return
+
+        entry_path = os.path.join(self._cache_dir, key)
+        temp_path = f'{entry_path}.{threading.get_ident()}.tmp'
+
+        try:
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+            size = 0
+            for relative_path in artifact_paths:
+                shutil.copytree(self._m2_path.joinpath(relative_path), \
+                    os.path.join(temp_path, self.ENTRY_M2_DIR, relative_path))
+                size += PathHelper.get_size(\
+                                    self._m2_path.joinpath(relative_path))
+
+            PathHelper.write_json(os.path.join(temp_path, self.ENTRY_FILE), \
+                                                        {self.SIZE_KEY: size})
+
+            with self._lock:
+                shutil.rmtree(entry_path, ignore_errors=True)
+                os.replace(temp_path, entry_path)
+
+                self._evict()
+        except (OSError, BuilderProcessException) as e:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            logger.warning(f'Failed to store the artifact cache ' +\
+                                        f'{entry_path}. Exception: {e}')
+
+    def _get_artifact_paths(self, modules):
+        paths = [Path(*m.group_id.split('.'), m.artifact_id, m.version) \
+                    for m in modules \
+                        if m.group_id and m.artifact_id and m.version]
+
+        if len(paths) != len(modules) or '${' in ''.join(map(str, paths)) \
+                or not all([self._m2_path.joinpath(p).is_dir() \
+                                                        for p in paths]):
+            return list()
+
+        return paths
+
+    def _evict(self):
+        entries = list()
+
+        for entry in os.scandir(self._cache_dir):
+            entry_file = os.path.join(entry.path, self.ENTRY_FILE)
+
+            if entry.is_dir() and os.path.isfile(entry_file):
+                try:
+                    size = PathHelper.read_json(entry_file)[self.SIZE_KEY]
+                except (BuilderProcessException, KeyError, TypeError) as e:
+                    logger.warning(f'The artifact cache {entry.path} is ' +\
+                                        f'broken, it has been removed: {e}')
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    continue
+
+                entries.append((entry.stat().st_mtime, size, entry.path))
+
+        total = sum([size for _, size, _ in entries])
+
+        for _, size, entry_path in sorted(entries):
+            if total <= self._max_size:
+                break
+
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total -= size
+
+
+class TestResultCache:
+    '''
+    This object is responsible for persist in a JSON file the keys of
+    the Maven modules whose tests have passed. A key is computed from the
+    Git SHAs of the module sources, test sources and POMs, the build
+    command and the keys of the modules it depends on, so a module is
+    tested again when any of them changes.
+
+    Only the max_size most recent keys are kept. The instance is thread
+    safe and the file is rewritten atomically on every record.
+    '''
+
+    def __init__(self, file_path, max_size=Const.TEST_CACHE_SIZE):
+        self._file_path = file_path
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._passed = self._load()
+
+    @staticmethod
+    def compute_key(tree_shas, command, upstream_keys):
+        '''
+        Return the SHA-256 key for the Git SHAs of the module files, None
+        when a file doesn't exist, the build command and the keys of the
+        modules it depends on.
+        '''
+        digest = hashlib.sha256()
+        digest.update(command.encode())
+
+        for tree_sha in tree_shas:
+            digest.update(str(tree_sha).encode())
+
+        for upstream_key in sorted(upstream_keys):
+            digest.update(upstream_key.encode())
+
+        return digest.hexdigest()
+
+    def is_passed(self, key):
+        '''Return True if the tests of the module key have passed.'''
+        with self._lock:
+            return key is not None and key in self._passed
+
+    def record(self, keys):
+        '''Store the keys of the modules whose tests have passed.'''
+        with self._lock:
+            now = time.time()
+            self._passed.update({k: now for k in keys})
+
+            if len(self._passed) > self._max_size:
+                self._passed = dict(sorted(self._passed.items(), \
+                        key=lambda item: item[1])[-self._max_size:])
+
+            PathHelper.write_json(self._file_path, self._passed)
+
+    def _load(self):
+        try:
+            return PathHelper.read_json(self._file_path)
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return dict()
+
+
+class ModuleTestKeys:
+    '''
+    This object is responsible for compute the TestResultCache keys of
+    the Maven modules of the repositories of a DependencyGraph. The Git
+    SHAs of the POMs and src folders of all the modules of a repository
+    are read by a single git ls-tree command, and the key of a module
+    includes the keys of the modules it depends on, from the same
+    repository or built by another repository.
+
+    A repository with uncommitted changes or depending on a module
+    without key has no keys, so its modules are always tested. The keys
+    of each repository are computed once, and the Git commands are
+    executed by the run_command(command, path, on_line) callable.
+
+    The instance is thread safe: the keys are computed outside the lock
+    and stored only once complete, so a build never reads the keys of a
+    repository whose computation is still running in another build.
+    '''
+    GIT_STATUS_CMD = 'git status --porcelain'
+    GIT_LS_TREE_CMD = 'git ls-tree HEAD -- '
+    MODULE_SOURCES_DIR = 'src'
+
+    def __init__(self, graph, command, run_command):
+        self._graph = graph
+        self._command = command
+        self._run_command = run_command
+        self._lock = threading.Lock()
+        self._keys = dict()
+
+    def get(self, repository):
+        '''
+        Return a dict with the key by (groupId, artifactId) of the modules
+        of the repository thats have a key.
+        '''
+        return self._get(repository, set())
+
+    def _get(self, repository, pending):
+        with self._lock:
+            if repository in self._keys:
+                return self._keys[repository]
+
+        if repository in pending:
+            return dict()
+
+        pending.add(repository)
+        keys = self._compute_keys(repository, pending)
+
+        with self._lock:
+            return self._keys.setdefault(repository, keys)
+
+    def _compute_keys(self, repository, pending):
+        path = repository._absolute_path
+
+        if self._run_command(self.GIT_STATUS_CMD, path):
+            return dict()
+
+        trees = self._read_module_trees(repository)
+        modules = {m.coordinate: m for m in repository.modules}
+        keys = dict()
+
+        for module in repository.modules:
+            self._compute_module_key(module, modules, trees, keys, pending)
+
+        return {c: k for c, k in keys.items() if k is not None}
+
+    def _compute_module_key(self, module, modules, trees, keys, pending):
+        if module.coordinate in keys:
+            return keys[module.coordinate]
+
+        keys[module.coordinate] = None
+        upstream_keys = list()
+
+        for dependency in module.dependencies:
+            if dependency in modules:
+                upstream_keys.append(self._compute_module_key(\
+                        modules[dependency], modules, trees, keys, pending))
+                continue
+
+            producer = self._graph.get_producer(dependency)
+
+            if producer is not None:
+                upstream_keys.append(\
+                            self._get(producer, pending).get(dependency))
+
+        if None in upstream_keys:
+            return None
+
+        keys[module.coordinate] = TestResultCache.compute_key(\
+                    [trees.get(p) for p in self._get_module_tree_paths(\
+                                        module.path)], \
+                                            self._command, upstream_keys)
+        return keys[module.coordinate]
+
+    def _read_module_trees(self, repository):
+        paths = sorted(set([p for m in repository.modules \
+                            for p in self._get_module_tree_paths(m.path)]))
+        lines = list()
+
+        self._run_command(self.GIT_LS_TREE_CMD + \
+                            ' '.join([f'"{p}"' for p in paths]), \
+                                repository._absolute_path, \
+                                    lambda line: lines.append(line.strip()))
+
+        return {l.partition('\t')[2]: l.partition('\t')[0].split()[-1] \
+                                                        for l in lines if l}
+
+    def _get_module_tree_paths(self, module_path):
+        module_folder = Path(module_path or '.')
+
+        return [Const.POM_FILE] + [(module_folder / p).as_posix() \
+                        for p in (Const.POM_FILE, self.MODULE_SOURCES_DIR)]
+
+
+class RunJournal:
+    '''
+    This object is responsible for persist in a JSON file which phases of
+    each repository have been finished by the current run, in order to
+    resume an interrupted or failed run from the first unfinished phase.
+
+    The steps of the run thats are not related to a repository, like the
+    .m2 folder clean, are recorded too, so a resumed run doesn't repeat
+    them and loses the artifacts installed by the finished builds.
+
+    The journal of the last run is only resumed when is_to_resume is True
+    and the run options, like the branch and the build command, are the
+    same. Otherwise a new journal is started. The instance is thread safe.
+    '''
+    PHASE_PREPARE = 'prepare'
+    PHASE_UPDATE = 'update'
+    PHASE_BUILD = 'build'
+    STEP_CLEAN_M2 = 'clean m2'
+    OPTIONS_KEY = 'options'
+    REPOSITORIES_KEY = 'repositories'
+    STEPS_KEY = 'steps'
+    FINISHED_KEY = 'finished'
+
+    def __init__(self, file_path, options, is_to_resume=False):
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._journal = self._load(options, is_to_resume)
+
+        self._save()
+
+    def is_done(self, repository, phase):
+        '''Return True if the phase of the repository has been finished.'''
+        with self._lock:
+            return phase in self._journal[self.REPOSITORIES_KEY].get(\
+                                            self._get_key(repository), list())
+
+    def mark_done(self, repository, phase):
+        '''Record the phase of the repository as finished.'''
+        with self._lock:
+            phases = self._journal[self.REPOSITORIES_KEY].setdefault(\
+                                            self._get_key(repository), list())
+
+            if phase not in phases:
+                phases.append(phase)
+
+            self._save()
+
+    def is_step_done(self, step):
+        '''Return True if the step of the run has been finished.'''
+        with self._lock:
+            return step in self._journal.get(self.STEPS_KEY, list())
+
+    def mark_step_done(self, step):
+        '''Record the step of the run as finished.'''
+        with self._lock:
+            steps = self._journal.setdefault(self.STEPS_KEY, list())
+
+            if step not in steps:
+                steps.append(step)
+
+            self._save()
+
+    def finish(self):
+        '''Record the run as finished, so it won't be resumed anymore.'''
+        with self._lock:
+            self._journal[self.FINISHED_KEY] = True
+            self._save()
+
+    def _get_key(self, repository):
+        return os.path.abspath(repository._absolute_path)
+
+    def _load(self, options, is_to_resume):
+        new_journal = {self.OPTIONS_KEY: options, self.REPOSITORIES_KEY: {}, \
+                                                        self.STEPS_KEY: []}
+
+        if not is_to_resume:
+            return new_journal
+
+        try:
+            journal = PathHelper.read_json(self._file_path)
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return new_journal
+
+        if journal.get(self.FINISHED_KEY):
+            logger.info('The last run has been finished, nothing to resume')
+            return new_journal
+
+        if journal.get(self.OPTIONS_KEY) != options:
+            logger.warning('The last run has not been resumed because it ' +\
+                    'has a different branch, build command or m2 clean')
+            return new_journal
+
+        logger.info(f'Resuming the last run from the journal {self._file_path}')
+        return journal
+
+    def _save(self):
+        try:
+            PathHelper.write_json(self._file_path, self._journal)
+        except BuilderProcessException as e:
+            logger.warning(e)
+
+
+class SyncResult:
+    '''
+    The SyncResult object stores the outcome of the Git commands executed
+    to synchronize a Repository: the error raised, if any.
+    '''
+
+    def __init__(self, repository, error=None):
+        self.repository = repository
+        self.error = error
+
+
+class ProcessPersonalized(ProcessBuildFull):
+    '''
+    Inherits from the class ProcessBuildFull change the following
+    attributes values:
+    - is_to_reset = False
+    - is_to_update = False
+    - is_build_all = False
+    This object represents the process that the user customize according
+    their needs.
+    '''
+
+    def __init__(self):
+        super().__init__()
+        self.is_to_reset = False
+        self.is_to_update = False
+        self.is_build_all = False
+   
+
+class ProcessSkipMenu(ProcessBuildFull):
+    '''
+    Inherits from the class ProcessBuildFull in order to represent
+    the process that the user wants just pick wich repository to build
+    using the ProcessBuildFull configuration to build it.
+    '''
+    pass
+
+
+class Repository:
+    '''
+    The Repository object contains the paths and initial values
+    for a valid Git repository.
+    In the instance initiate an absolute path is required and its
+    validation is performed.
+    '''    
+
+    def __init__(self, absolute_path):
+        self._initial = None
+        self._modules = None
+        self._is_valid_absolute_path(absolute_path)
+        self._absolute_path = absolute_path
+        self._build_initial_value()
+
+    def _is_valid_absolute_path(self, absolute_path):
+        if not os.path.isdir(absolute_path):
+            raise BuilderProcessException(\
+                            f"The directory {absolute_path} doesn't exist!!!")
+
+    def _build_initial_value(self):
+        self._initial = self._absolute_path.split('.')[-1].upper()
+
+    @property
+    def initial(self):
+        '''Return a short name as a prefix for the object Repository'''
+        return self._initial \
+            if self._initial \
+                else self._build_initial_value()
+
+    @property
+    def modules(self):
+        '''
+        Return the list of MavenModule read from the repository pom.xml
+        files. The POMs are read only once by Repository instance.
+        '''
+        if self._modules is None:
+            self._modules = PomReader.read_modules(self._absolute_path)
+
+        return self._modules
+
+    @property
+    def artifacts(self):
+        '''Return a set of (groupId, artifactId) built by the repository.'''
+        return set([m.coordinate for m in self.modules])
+
+    @property
+    def dependencies(self):
+        '''
+        Return a set of (groupId, artifactId) that the repository modules
+        depend on, excluding the artifacts built by the repository itself.
+        '''
+        return set([d for m in self.modules \
+                        for d in m.dependencies]) - self.artifacts
+
+    def refresh(self):
+        '''Forget the modules read, so the pom.xml files are read again.'''
+        self._modules = None
+
+    def __str__(self):
+        '''Overwrite the __str__ object returning the _initial attribute'''
+        return self._initial
+
+
+class MavenModule:
+    '''
+    The MavenModule object represents a Maven project declared by a
+    pom.xml file inside a Repository, with its coordinates and the
+    coordinates of the artifacts it depends on.
+    '''
+
+    def __init__(self, group_id, artifact_id, version, path):
+        self.group_id = group_id
+        self.artifact_id = artifact_id
+        self.version = version
+        self.path = path
+        self.name = None
+        self.dependencies = set()
+
+    @property
+    def coordinate(self):
+        '''Return the (groupId, artifactId) tuple of the module.'''
+        return (self.group_id, self.artifact_id)
+
+    def __str__(self):
+        '''Overwrite the __str__ object returning groupId:artifactId'''
+        return f'{self.group_id}:{self.artifact_id}'
+
+
+class PomReader:
+    '''
+    This is a util class to read the Maven pom.xml files of a repository
+    by static methods. Only the information required to build the
+    dependency graph between repositories is read.
+    '''
+    PROPERTY_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+    @staticmethod
+    def read_modules(repository_path):
+        '''
+        Return a list of MavenModule for the root pom.xml of the
+        repository and all its aggregated modules. An empty list is
+        returned when the repository has no pom.xml.
+        '''
+        modules = list()
+        PomReader._read_module(repository_path, str(), modules)
+
+        return modules
+
+    @staticmethod
+    def _read_module(repository_path, module_path, modules):
+        pom_path = os.path.join(repository_path, module_path, Const.POM_FILE)
+
+        if not os.path.isfile(pom_path):
+            return
+
+        try:
+            project = PomReader._parse(pom_path)
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return
+
+        module = PomReader._create_module(project, module_path)
+        modules.append(module)
+
+        for child in project.findall('modules/module'):
+            child_path = os.path.normpath(\
+                                os.path.join(module_path, child.text.strip()))
+            PomReader._read_module(repository_path, child_path, modules)
+
+    @staticmethod
+    def _parse(pom_path):
+        try:
+            project = ElementTree.parse(pom_path).getroot()
+        except (ElementTree.ParseError, OSError) as e:
+            raise BuilderProcessException(\
+                f'Failed to read the POM file {pom_path}. Exception: {e}')
+
+        for element in project.iter():
+            if isinstance(element.tag, str) and '}' in element.tag:
+                element.tag = element.tag.split('}', 1)[1]
+
+        return project
+
+    @staticmethod
+    def _create_module(project, module_path):
+        parent_group_id = project.findtext('parent/groupId')
+        parent_version = project.findtext('parent/version')
+
+        properties = {
+            'project.parent.groupId': parent_group_id,
+            'project.parent.version': parent_version
+        }
+        properties.update(PomReader._read_properties(project))
+
+        group_id = project.findtext('groupId') or parent_group_id
+        version = project.findtext('version') or parent_version
+
+        properties['project.groupId'] = group_id
+        properties['project.version'] = version
+
+        module = MavenModule(PomReader._resolve(group_id, properties), \
+                    PomReader._resolve(project.findtext('artifactId'), \
+                                                            properties), \
+                    PomReader._resolve(version, properties), \
+                    str() if module_path == '.' else module_path)
+
+        module.name = PomReader._resolve(project.findtext('name'), properties)
+
+        if project.find('parent') is not None:
+            module.dependencies.add((\
+                PomReader._resolve(parent_group_id, properties), \
+                PomReader._resolve(project.findtext('parent/artifactId'), \
+                                                            properties)))
+
+        for dependency in project.findall('dependencies/dependency'):
+            module.dependencies.add((\
+                PomReader._resolve(dependency.findtext('groupId'), \
+                                                            properties), \
+                PomReader._resolve(dependency.findtext('artifactId'), \
+                                                            properties)))
+
+        return module
+
+    @staticmethod
+    def _read_properties(project):
+        properties = project.find('properties')
+
+        if properties is None:
+            return dict()
+
+        return {p.tag: p.text for p in properties \
+                    if isinstance(p.tag, str)}
+
+    @staticmethod
+    def _resolve(value, properties):
+        if value is None:
+            return None
+
+        return PomReader.PROPERTY_PATTERN.sub(\
+            lambda m: properties.get(m.group(1)) or m.group(0), value.strip())
+
+
+class DependencyGraph:
+    '''
+    The DependencyGraph object represents the build order constraints
+    between the repositories. A repository depends on another when one of
+    its modules depends on an artifact built by the other repository.
+
+    The repositories argument are the ones that will be built and the
+    known_repositories are all the repositories found in the root path,
+    used to find the repositories thats build the artifacts. Only the
+    groupId:artifactId pairs declared by a module of a known repository
+    are resolved, all the others dependencies are external artifacts,
+    like the ones downloaded from a Maven repository manager.
+
+    A dependency thats is not resolved but whose artifactId, or its prefix
+    before a hyphen like sample_1 of sample_1-core, is one of the
+    repository_names, the Const.REPO_PATHS by default, is taken as a
+    repository missing in the root path and raises a
+    BuilderProcessException. The names are literal, the discovery include
+    patterns are not used since a glob or a regular expression also
+    matches the external artifacts. The others inter-repo dependencies
+    thats can't be resolved are not detected and left to Maven.
+    '''
+
+    def __init__(self, repositories, known_repositories=None, \
+                                                repository_names=None):
+        self.repositories = list(repositories)
+        self._known_repositories = list(known_repositories) \
+                                        if known_repositories \
+                                            else self.repositories
+        self._repository_names = set(repository_names \
+                                            if repository_names is not None \
+                                                    else Const.REPO_PATHS)
+        self._upstreams = {r: set() for r in self.repositories}
+        self._downstreams = {r: set() for r in self.repositories}
+        self._producers = self._map_artifact_producers()
+
+        self._build_edges()
+        self._order = self._build_topological_order()
+
+    def upstreams(self, repository):
+        '''Return the set of repositories that the repository depends on.'''
+        return self._upstreams[repository]
+
+    def downstreams(self, repository):
+        '''Return the set of repositories that depend on the repository.'''
+        return self._downstreams[repository]
+
+    def get_all_downstreams(self, repository):
+        '''
+        Return the set of repositories that depend on the repository
+        directly or through others repositories.
+        '''
+        downstreams = set()
+        pending = [repository]
+
+        while pending:
+            for downstream in self._downstreams[pending.pop()]:
+                if downstream not in downstreams:
+                    downstreams.add(downstream)
+                    pending.append(downstream)
+
+        return downstreams
+
+    def get_critical_paths(self, estimate):
+        '''
+        Return a dict with the estimated seconds of the longest path from
+        each repository to the end of the build, the repository included,
+        where estimate(repository) returns the seconds of a repository.
+        '''
+        critical_paths = dict()
+
+        for repository in reversed(self._order):
+            critical_paths[repository] = estimate(repository) + \
+                max([critical_paths[d] for d in \
+                            self._downstreams[repository]], default=0)
+
+        return critical_paths
+
+    def get_producer(self, artifact):
+        '''
+        Return the known repository thats builds the (groupId, artifactId)
+        artifact or None when it is an external artifact.
+        '''
+        return self._producers.get(artifact)
+
+    def topological_order(self):
+        '''
+        Return a list of repositories where each repository comes after
+        all the repositories it depends on.
+        '''
+        return list(self._order)
+
+    def _build_edges(self):
+        for repository in self.repositories:
+            for dependency in sorted(repository.dependencies, key=str):
+                producer = self._producers.get(dependency)
+
+                if producer is None:
+                    self._has_not_missing_repository(repository, dependency)
+                elif producer in self._upstreams:
+                    self._upstreams[repository].add(producer)
+                    self._downstreams[producer].add(repository)
+
+    def _has_not_missing_repository(self, repository, dependency):
+        group_id, artifact_id = dependency
+        parts = artifact_id.split('-')
+
+        if any(['-'.join(parts[:i]) in self._repository_names \
+                                    for i in range(1, len(parts) + 1)]):
+            raise BuilderProcessException(\
+                f'The {repository} depends on {group_id}:{artifact_id}, ' +\
+                    'thats matches the repositories names but is not ' +\
+                        'built by any repository found in the root path.')
+
+    def _map_artifact_producers(self):
+        producers = dict()
+
+        for repository in self._known_repositories:
+            for artifact in repository.artifacts:
+                if producers.get(artifact, repository) is not repository:
+                    raise BuilderProcessException(\
+                        f'The artifact {":".join(artifact)} is built by '+\
+                            f'both {producers[artifact]} and {repository}.')
+
+                producers[artifact] = repository
+
+        return producers
+
+    def _build_topological_order(self):
+        in_degrees = {r: len(self._upstreams[r]) for r in self.repositories}
+        ready = [r for r in self.repositories if in_degrees[r] == 0]
+        order = list()
+
+        while ready:
+            repository = ready.pop(0)
+            order.append(repository)
+
+            for downstream in self.repositories:
+                if downstream in self._downstreams[repository]:
+                    in_degrees[downstream] -= 1
+
+                    if in_degrees[downstream] == 0:
+                        ready.append(downstream)
+
+        self._has_not_cycles(order)
+
+        return order
+
+    def _has_not_cycles(self, order):
+        cycle = [str(r) for r in self.repositories if r not in order]
+
+        if cycle:
+            raise BuilderProcessException(\
+                'Found a dependency cycle between the repositories: ' +\
+                                                        ', '.join(cycle))
+
+
+class BuildScheduler:
+    '''
+    This object is responsible for run a task for each repository of a
+    DependencyGraph using a pool of threads. A repository is only
+    started when all the repositories it depends on have finished
+    successfully and no more than max_workers tasks run at same time.
+
+    When the scheduler runs waiting for releases, a repository is also
+    only started after another stage has released it by the release
+    method, so the scheduler can consume the repositories produced by
+    a previous stage while it is still running.
+
+    When a task fails no new repository is started, the running ones
+    are waited and the first error found is raised. When is_keep_going is
+    True only the repositories thats depend on the failed one are skipped
+    and all the failed repositories are reported at the end.
+
+    When a ResourceGovernor is passed, new repositories are only started
+    while it admits them, and each started repository gets its share of
+    the host resources from it.
+
+    When the priorities dict is passed the ready repositories with the
+    highest priority, like the longest critical path, are started first.
+    '''
+    RELEASED_EVENT = 'released'
+    FINISHED_EVENT = 'finished'
+
+    def __init__(self, graph, max_workers=Const.BUILD_JOBS, \
+                        is_keep_going=False, governor=None, priorities=None):
+        self._graph = graph
+        self._max_workers = max(1, int(max_workers))
+        self._is_keep_going = is_keep_going
+        self._governor = governor
+        self._priorities = priorities or dict()
+        self._events = queue.Queue()
+
+    def release(self, repository, error=None):
+        '''
+        Allow the repository to be started. When an error is passed the
+        repository is considered failed and no new repository is started.
+        This method is thread safe.
+        '''
+        self._events.put((self.RELEASED_EVENT, repository, error))
+
+    def run(self, task, is_to_wait_release=False):
+        '''Execute the callable task(repository) for all repositories.'''
+        pending = sorted(self._graph.topological_order(), \
+                                key=lambda r: -self._priorities.get(r, 0))
+        released = set() if is_to_wait_release else set(pending)
+        finished = set()
+        running = 0
+        errors = list()
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while pending or running:
+                is_admitted = self._governor is None \
+                                        or self._governor.is_admissible()
+                ready = self._pop_ready(pending, released, finished, \
+                    self._max_workers - running if is_admitted else 0)
+
+                if ready and self._governor is not None:
+                    self._governor.allocate(ready)
+
+                for repository in ready:
+                    self._submit(executor, task, repository)
+                    running += 1
+
+                try:
+                    event, repository, exception = self._events.get(\
+                            timeout=None if is_admitted \
+                                    else ResourceGovernor.POLL_SECONDS)
+                except queue.Empty:
+                    continue
+
+                if event == self.FINISHED_EVENT:
+                    running -= 1
+
+                    if self._governor is not None:
+                        self._governor.release(repository)
+
+                if exception is not None:
+                    errors.append((repository, exception))
+                    self._skip_failed(repository, exception, pending)
+                elif event == self.FINISHED_EVENT:
+                    finished.add(repository)
+                else:
+                    released.add(repository)
+
+        self._raise_errors(errors)
+
+    def _skip_failed(self, repository, exception, pending):
+        if not self._is_keep_going:
+            pending.clear()
+            return
+
+        logger.error(exception)
+        downstreams = self._graph.get_all_downstreams(repository)
+
+        if repository in pending:
+            pending.remove(repository)
+
+        for skipped in [r for r in pending if r in downstreams]:
+            pending.remove(skipped)
+            logger.warning(f'The {skipped} has been skipped because it ' +\
+                                        f'depends on the failed {repository}')
+
+    def _raise_errors(self, errors):
+        if not errors:
+            return
+
+        if not self._is_keep_going:
+            raise errors[0][1]
+
+        raise BuilderProcessException('Failed to build the repositories: ' +\
+                                ', '.join([str(r) for r, _ in errors]))
+
+    def _pop_ready(self, pending, released, finished, slots):
+        ready = [r for r in pending if r in released \
+                    and self._graph.upstreams(r) <= finished][:slots]
+
+        for repository in ready:
+            pending.remove(repository)
+
+        return ready
+
+    def _submit(self, executor, task, repository):
+        future = executor.submit(task, repository)
+        future.add_done_callback(lambda f: self._events.put(\
+                        (self.FINISHED_EVENT, repository, f.exception())))
+
+
+class ResourceAllocation:
+    '''
+    The share of the host resources given to a build: the number of
+    Maven threads and the heap size in MB, None when the available memory
+    is unknown.
+    '''
+
+    def __init__(self, threads, heap_size=None):
+        self.threads = threads
+        self.heap_size = heap_size
+
+
+class ResourceGovernor:
+    '''
+    This object is responsible for the admission control of the builds
+    running at same time, based on the host cores and memory.
+
+    A new build is admitted while the 1 minute load average is below
+    max_load, by default the number of cores, and the available memory
+    is above min_free_memory bytes. The first build is always admitted.
+    Each admitted build receives the cores not used by the running builds
+    divided by the builds started together, and the same division of the
+    available memory above min_free_memory as heap.
+
+    The load average and the available memory are read from the OS when
+    supported, otherwise they aren't checked. The instance is thread safe.
+    '''
+    POLL_SECONDS = 2
+    HEAP_RATIO = 0.5
+    MIN_HEAP_SIZE = 256
+    MEMINFO_PATH = '/proc/meminfo'
+    MEMINFO_AVAILABLE = 'MemAvailable:'
+    MB = 1024 ** 2
+
+    def __init__(self, max_load=None, min_free_memory=0, cpu_count=None):
+        self._cpu_count = cpu_count or os.cpu_count() or 1
+        self._max_load = max_load or self._cpu_count
+        self._min_free_memory = min_free_memory
+        self._lock = threading.Lock()
+        self._allocations = dict()
+        self._held_back = False
+
+    def is_admissible(self):
+        '''
+        Return True when a new build can be started, False when the load
+        average or the available memory have crossed the thresholds.
+        '''
+        with self._lock:
+            if not self._allocations:
+                return True
+
+        load = self._read_load()
+        available = self._read_available_memory()
+        is_admissible = (load is None or load < self._max_load) and \
+            (available is None or available > self._min_free_memory)
+
+        with self._lock:
+            if not is_admissible and not self._held_back:
+                logger.info('New builds have been held back, load ' +\
+                    f'average: {load}, available memory: ' +\
+                        f'{available // self.MB if available else None} MB')
+
+            self._held_back = not is_admissible
+
+        return is_admissible
+
+    def allocate(self, keys):
+        '''
+        Reserve the same ResourceAllocation for each build key of the list
+        of builds started together.
+        '''
+        available = self._read_available_memory()
+
+        with self._lock:
+            free_cores = self._cpu_count - sum([a.threads \
+                                        for a in self._allocations.values()])
+            heap_size = None
+
+            if available is not None:
+                heap_size = max(self.MIN_HEAP_SIZE, int((available - \
+                    self._min_free_memory) * self.HEAP_RATIO / len(keys) / \
+                                                                    self.MB))
+
+            for key in keys:
+                self._allocations[key] = ResourceAllocation(\
+                            max(1, free_cores // len(keys)), heap_size)
+
+    def get_allocation(self, key):
+        '''Return the ResourceAllocation of the build key or None.'''
+        with self._lock:
+            return self._allocations.get(key)
+
+    def release(self, key):
+        '''Give back the resources reserved by the build key.'''
+        with self._lock:
+            self._allocations.pop(key, None)
+
+    def _read_load(self):
+        try:
+            return os.getloadavg()[0]
+        except (AttributeError, OSError):
+            return None
+
+    def _read_available_memory(self):
+        try:
+            with open(self.MEMINFO_PATH) as meminfo:
+                for line in meminfo:
+                    if line.startswith(self.MEMINFO_AVAILABLE):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+
+        return None
+
+
+class PathHelper:
+    '''
+    This is a util class to handle with path and directory process
+    by static methods.
+    '''
+
+    @staticmethod
+    def delete_m2(m2_path=None):
+        '''
+        Delete all the folders and files from the Maven m2 folder, or
+        from the m2_path local repository when it is passed.
+        '''
+        m2_path = Path(m2_path) if m2_path else PathHelper._get_m2_path()
+
+        PathHelper._validate_m2_path(m2_path)
+
+        try:
+            shutil.rmtree(m2_path)
+
+            logger.info(f"The m2 folder: {m2_path} "+\
+                                        "has been deleted successfully")
+        except OSError:
+            raise BuilderProcessException(\
+                f'Process to delete folders and files from ' + \
+                                f'{m2_path} has failed.')
+
+    @staticmethod
+    def _get_m2_path():
+        return Path.joinpath(Path.home(), Const.M2_PATH)
+
+    @staticmethod
+    def _validate_m2_path(m2_path):
+        if not m2_path.is_dir():
+            raise BuilderProcessException(\
+                f'Is not possible to clean the M2 project. The path '+\
+                            f'{m2_path} is not a valid directory')
+
+    @staticmethod
+    def create_run_id():
+        '''
+        Return a unique id for the files of a run: the local time followed
+        by the microseconds and the process id, e.g.:
+        20261016-210245-123456-4321.
+        '''
+        now = time.time()
+
+        return time.strftime('%Y%m%d-%H%M%S', time.localtime(now)) + \
+                        f'-{int(now * 1000000) % 1000000:06d}-{os.getpid()}'
+
+    @staticmethod
+    def read_json(file_path, default=None):
+        '''
+        Return the content of a JSON file or the default value, an empty
+        dict if not passed, when the file doesn't exist.
+        '''
+        if not os.path.isfile(file_path):
+            return dict() if default is None else default
+
+        try:
+            with open(file_path, encoding='utf-8') as json_file:
+                return json.load(json_file)
+        except (OSError, ValueError) as e:
+            raise BuilderProcessException(\
+                f'Failed to read the file {file_path}. Exception: {e}')
+
+    @staticmethod
+    def write_json(file_path, content):
+        '''
+        Write the content to a JSON file atomically, creating the parent
+        folders if required.
+        '''
+        temp_path = f'{file_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            with open(temp_path, 'w', encoding='utf-8') as json_file:
+                json.dump(content, json_file, indent=2, sort_keys=True)
+
+            os.replace(temp_path, file_path)
+        except OSError as e:
+            raise BuilderProcessException(\
+                f'Failed to write the file {file_path}. Exception: {e}')
+
+    @staticmethod
+    def get_size(path):
+        '''Return the total size in bytes of the files inside the path.'''
+        return sum([f.stat().st_size for f in Path(path).rglob('*') \
+                                                        if f.is_file()])
+
+    @staticmethod
+    def fetch_repo_paths(root_path, include=None, exclude=None, \
+                            max_depth=Const.DISCOVERY_MAX_DEPTH, \
+                                is_to_rescan=False):
+        '''
+        Process the root path and extract all valid repository paths
+        from the root path, searching recursively up to max_depth folders
+        for Git work trees with a pom.xml file thats match the include
+        patterns, Const.REPO_PATHS by default, and don't match the exclude
+        patterns.
+
+        The found paths are stored in an index file refreshed only when a
+        scanned folder has changed, unless is_to_rescan is True.
+        '''
+        root_path = os.path.abspath(PathHelper._get_valid_root_path(root_path))
+
+        finder = RepositoryFinder(include, exclude, max_depth, \
+                    os.path.join(root_path, Const.STATE_DIR, \
+                                                    Const.REPO_INDEX_FILE))
+
+        repo_paths = finder.find(root_path, is_to_rescan)
+
+        PathHelper._has_valid_repo_paths(repo_paths)
+
+        return repo_paths
+
+    @staticmethod
+    def _get_valid_root_path(root_path):
+        return root_path if root_path else os.getcwd()
+
+    @staticmethod
+    def _has_valid_repo_paths(repo_paths):
+        if len(repo_paths) == 0:
+            raise BuilderProcessException(\
+                f'Failed to read the repositories directories.'+\
+                    'Please make sure you had cloned the GIT repositories ' +\
+                            'or pass a manifest to clone them by --bootstrap.')
+
+
+class RepositoryBootstrapper:
+    '''
+    This object is responsible for clone concurrently the repositories
+    listed in a JSON manifest thats are missing in the root path, e.g.:
+    {"repositories": [{"path": "sample_1", "url": "git@host:sample_1.git",
+    "branch": "master"}], "reference": "/cache/objects.git",
+    "filter": "blob:none", "depth": 50}
+
+    The clones borrow the objects of the reference repository, when it
+    exists, by the Git alternates, and are partial by the filter and/or
+    shallow by the depth. The reference, filter and depth passed to the
+    instance override the manifest ones. The repositories already cloned
+    are not fetched, they get the reference as an alternate and the filter
+    as theirs origin promisor filter, so the next updates move fewer bytes.
+    The depth is used only by the new clones, so the history of the
+    repositories already cloned is never made shallow.
+    '''
+    REPOSITORIES_KEY = 'repositories'
+    PATH_KEY = 'path'
+    URL_KEY = 'url'
+    BRANCH_KEY = 'branch'
+    REFERENCE_KEY = 'reference'
+    FILTER_KEY = 'filter'
+    DEPTH_KEY = 'depth'
+    GIT_CLONE_CMD = 'git clone'
+    GIT_PROMISOR_CMD = 'git config remote.origin.promisor true'
+    GIT_FILTER_CMD = 'git config remote.origin.partialclonefilter'
+    GIT_OBJECTS_PATH_CMD = 'git rev-parse --git-path objects'
+    OBJECTS_DIR = 'objects'
+    ALTERNATES_FILE = os.path.join('info', 'alternates')
+    LOGS_NAME = 'bootstrap-'
+
+    def __init__(self, root_path, manifest_path, reference=None, \
+                    clone_filter=None, depth=None, jobs=Const.SYNC_JOBS):
+        self._root_path = os.path.abspath(\
+                                PathHelper._get_valid_root_path(root_path))
+        self._manifest = self.read_manifest(manifest_path)
+        self._reference = reference or self._manifest.get(self.REFERENCE_KEY)
+        self._filter = clone_filter or self._manifest.get(self.FILTER_KEY)
+        self._depth = depth or self._manifest.get(self.DEPTH_KEY)
+        self._jobs = max(1, int(jobs))
+        self._command_runner = CommandRunner(os.path.join(self._root_path, \
+                Const.STATE_DIR, Const.LOGS_DIR, \
+                            self.LOGS_NAME + PathHelper.create_run_id()), \
+                                                    root_path=self._root_path)
+
+    @staticmethod
+    def read_manifest(manifest_path):
+        '''
+        Return the content of the manifest file. A BuilderProcessException
+        is raised when it is not a JSON object with a list of repositories,
+        each one with a path and an url.
+        '''
+        manifest = PathHelper.read_json(manifest_path)
+        entries = manifest.get(RepositoryBootstrapper.REPOSITORIES_KEY, \
+                            list()) if isinstance(manifest, dict) else None
+
+        if not isinstance(entries, list):
+            raise BuilderProcessException(f'The bootstrap manifest ' +\
+                f'{manifest_path} must be an object with a list of ' +\
+                                                            'repositories.')
+
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not all([isinstance(\
+                    entry.get(k), str) and entry.get(k) for k in (\
+                        RepositoryBootstrapper.PATH_KEY, \
+                                        RepositoryBootstrapper.URL_KEY)]):
+                raise BuilderProcessException(f'The repository {index} ' +\
+                    f'of the bootstrap manifest {manifest_path} must have ' +\
+                                                    'a path and an url.')
+
+        return manifest
+
+    @staticmethod
+    def read_repository_names(manifest_path):
+        '''
+        Return the folder names of the repositories listed in the manifest.
+        '''
+        entries = RepositoryBootstrapper.read_manifest(manifest_path).get(\
+                            RepositoryBootstrapper.REPOSITORIES_KEY, list())
+
+        return [os.path.basename(os.path.normpath(\
+                    e[RepositoryBootstrapper.PATH_KEY])) for e in entries]
+
+    def bootstrap(self):
+        '''
+        Clone the missing repositories and set the fetch options of the
+        cloned ones. A BuilderProcessException listing the repositories
+        paths thats have failed is raised at the end.
+        '''
+        entries = self._manifest.get(self.REPOSITORIES_KEY, list())
+
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            failed = [p for p in executor.map(self._bootstrap_entry, \
+                                                            entries) if p]
+
+        if failed:
+            raise BuilderProcessException(\
+                'Failed to bootstrap the repositories: ' + ', '.join(failed))
+
+    def _bootstrap_entry(self, entry):
+        path = os.path.join(self._root_path, entry[self.PATH_KEY])
+
+        try:
+            if os.path.exists(os.path.join(path, Const.GIT_DIR)):
+                self._update_clone(path)
+            else:
+                self._clone(path, entry[self.URL_KEY], \
+                                                entry.get(self.BRANCH_KEY))
+        except BuilderProcessException as e:
+            logger.error(e)
+            return path
+
+        return None
+
+    def _clone(self, path, url, branch):
+        is_created = not os.path.exists(path)
+        options = self._get_clone_options()
+
+        if self._reference:
+            options += f' --reference-if-able "{self._reference}"'
+
+        if branch:
+            options += f' --branch {branch}'
+
+        os.makedirs(path, exist_ok=True)
+
+        try:
+            self._run(f'{self.GIT_CLONE_CMD}{options} "{url}" .', path)
+        except BuilderProcessException:
+            if is_created:
+                shutil.rmtree(path, ignore_errors=True)
+            raise
+
+    def _update_clone(self, path):
+        if self._reference:
+            self._add_alternate(path)
+
+        if self._filter and not self._has_filter(path):
+            self._run(self.GIT_PROMISOR_CMD, path)
+            self._run(f'{self.GIT_FILTER_CMD} {self._filter}', path)
+
+    def _has_filter(self, path):
+        try:
+            return self._command_runner.run(self.GIT_FILTER_CMD, \
+                                                path).strip() == self._filter
+        except BuilderProcessException:
+            return False
+
+    def _add_alternate(self, path):
+        reference_objects = os.path.join(self._reference, self.OBJECTS_DIR)
+
+        if not os.path.isdir(reference_objects):
+            reference_objects = os.path.join(self._reference, \
+                                            Const.GIT_DIR, self.OBJECTS_DIR)
+
+        if not os.path.isdir(reference_objects):
+            logger.warning(f'The reference {self._reference} has not ' +\
+                                            'been found, it has been ignored')
+            return
+
+        alternates_path = os.path.join(path, self._run(\
+                    self.GIT_OBJECTS_PATH_CMD, path).strip(), \
+                                                    self.ALTERNATES_FILE)
+
+        try:
+            alternates = open(alternates_path).read().split() \
+                            if os.path.isfile(alternates_path) else list()
+
+            if os.path.abspath(reference_objects) not in alternates:
+                os.makedirs(os.path.dirname(alternates_path), exist_ok=True)
+
+                with open(alternates_path, 'a') as alternates_file:
+                    alternates_file.write(\
+                                os.path.abspath(reference_objects) + '\n')
+        except OSError as e:
+            raise BuilderProcessException(f'Failed to add the reference ' +\
+                f'{self._reference} to the repository {path}. Exception: {e}')
+
+    def _get_clone_options(self):
+        options = str()
+
+        if self._filter:
+            options += f' --filter={self._filter}'
+
+        if self._depth:
+            options += f' --depth={self._depth}'
+
+        return options
+
+    def _run(self, command, path):
+        output = self._command_runner.run(command, path)
+
+        logger.info(f'The command: "{command}" to the repository: ' +\
+                                    f'{path} has executed successfully')
+        return output
+
+
+class RepositoryFinder:
+    '''
+    This object is responsible for find the repositories inside a root
+    path recursively. A repository is a Git work tree with a pom.xml file
+    whose folder matches the include patterns and doesn't match the
+    exclude patterns. The folders of a repository are not searched.
+
+    A pattern can be a folder name suffix like the Const.REPO_PATHS, a
+    glob like "core-*" matched against the folder name, or the relative
+    path when it has a "/", or a regular expression prefixed by "re:"
+    searched in the relative path. All the patterns are compiled once.
+
+    The found repositories and the modification time of every scanned
+    folder are stored in the index file, so the next search reuses them
+    while no scanned folder has changed and the indexed repositories still
+    have theirs .git and pom.xml. The repositories folders are not tracked,
+    since the builds change them on every run.
+    '''
+    REGEX_PREFIX = 're:'
+    GLOB_CHARS = set('*?[')
+    INDEX_VERSION = 2
+
+    def __init__(self, include=None, exclude=None, \
+                    max_depth=Const.DISCOVERY_MAX_DEPTH, index_path=None):
+        self._include = list(include) if include else list(Const.REPO_PATHS)
+        self._exclude = list(exclude) if exclude else list()
+        self._max_depth = max_depth
+        self._index_path = index_path
+        self._include_matchers = self._compile(self._include)
+        self._exclude_matchers = self._compile(self._exclude)
+
+    def find(self, root_path, is_to_rescan=False):
+        '''
+        Return the sorted list of the repositories absolute paths found
+        inside the root path.
+        '''
+        index = None if is_to_rescan else self._load_index(root_path)
+
+        if index is not None:
+            return index
+
+        folders = dict()
+        repositories = set()
+        self._scan(root_path, root_path, 0, folders, repositories)
+
+        repositories = sorted(repositories)
+        self._save_index(root_path, folders, repositories)
+
+        return repositories
+
+    def _compile(self, patterns):
+        suffixes = [p for p in patterns if not p.startswith(\
+                        self.REGEX_PREFIX) and not self.GLOB_CHARS & set(p)]
+        globs = [p for p in patterns if self.GLOB_CHARS & set(p) \
+                                and not p.startswith(self.REGEX_PREFIX)]
+        regexes = [p[len(self.REGEX_PREFIX):] for p in patterns \
+                                        if p.startswith(self.REGEX_PREFIX)]
+
+        matchers = list()
+
+        if suffixes:
+            matchers.append((False, re.compile('(?:' + \
+                        '|'.join(map(re.escape, suffixes)) + r')\Z').search))
+
+        for is_path, group in ((False, [g for g in globs if '/' not in g]), \
+                                    (True, [g for g in globs if '/' in g])):
+            if group:
+                matchers.append((is_path, re.compile('|'.join(\
+                                    map(fnmatch.translate, group))).match))
+
+        if regexes:
+            matchers.append((True, re.compile('|'.join(\
+                                    [f'(?:{r})' for r in regexes])).search))
+
+        return matchers
+
+    def _matches(self, matchers, name, relative_path):
+        return any([matcher(relative_path if is_path else name) \
+                                            for is_path, matcher in matchers])
+
+    def _scan(self, root_path, folder, depth, folders, repositories):
+        try:
+            folders[folder] = os.stat(folder).st_mtime_ns
+            entries = [e for e in os.scandir(folder) if e.is_dir() \
+                            and e.name not in Const.DISCOVERY_SKIP_DIRS]
+        except OSError as e:
+            logger.warning(f'Failed to read the folder {folder}. ' +\
+                                                        f'Exception: {e}')
+            return
+
+        for entry in entries:
+            relative_path = Path(os.path.relpath(entry.path, \
+                                                    root_path)).as_posix()
+
+            if self._is_repository(entry.path):
+                if self._matches(self._include_matchers, entry.name, \
+                                                        relative_path) \
+                    and not self._matches(self._exclude_matchers, \
+                                            entry.name, relative_path):
+                    repositories.add(entry.path)
+            elif depth + 1 < self._max_depth \
+                    and not self._matches(self._exclude_matchers, \
+                                            entry.name, relative_path):
+                self._scan(root_path, entry.path, depth + 1, folders, \
+                                                                repositories)
+
+    def _is_repository(self, path):
+        return os.path.exists(os.path.join(path, Const.GIT_DIR)) \
+                and os.path.isfile(os.path.join(path, Const.POM_FILE))
+
+    def _get_index_options(self, root_path):
+        return {
+            'version': self.INDEX_VERSION,
+            'root_path': root_path,
+            'include': self._include,
+            'exclude': self._exclude,
+            'max_depth': self._max_depth
+        }
+
+    def _load_index(self, root_path):
+        if not self._index_path:
+            return None
+
+        try:
+            index = PathHelper.read_json(self._index_path)
+        except BuilderProcessException as e:
+            logger.warning(e)
+            return None
+
+        if index.get('options') != self._get_index_options(root_path):
+            return None
+
+        for folder, mtime in index.get('folders', dict()).items():
+            try:
+                if os.stat(folder).st_mtime_ns != mtime:
+                    return None
+            except OSError:
+                return None
+
+        repositories = index.get('repositories')
+
+        if not isinstance(repositories, list) \
+                or not all([self._is_repository(r) for r in repositories]):
+            return None
+
+        return repositories
+
+    def _save_index(self, root_path, folders, repositories):
+        if not self._index_path:
+            return
+
+        try:
+            PathHelper.write_json(self._index_path, {
+                'options': self._get_index_options(root_path),
+                'folders': folders,
+                'repositories': repositories
+            })
+        except BuilderProcessException as e:
+            logger.warning(e)
+
+
+class M2Evictor:
+    '''
+    This object is responsible for remove only part of the Maven m2
+    folder instead of deleting it entirely, keeping the third-party
+    dependencies that would have to be downloaded again.
+
+    Two eviction ways are available: by the artifacts built by the
+    repositories or by the least recently used artifact versions until
+    the folder fits a size budget. Both log the bytes freed and the
+    time taken.
+    '''
+    SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, \
+                    'T': 1024 ** 4}
+    SIZE_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*$', \
+                                                            re.IGNORECASE)
+
+    def __init__(self, m2_path=None):
+        self._m2_path = Path(m2_path) if m2_path \
+                            else PathHelper._get_m2_path()
+
+    def evict_artifacts(self, artifacts):
+        '''
+        Delete all versions of the (groupId, artifactId) artifacts from
+        the m2 folder and return the number of bytes freed.
+        '''
+        PathHelper._validate_m2_path(self._m2_path)
+        start = time.monotonic()
+        freed = 0
+
+        for group_id, artifact_id in sorted(artifacts, key=str):
+            if group_id and artifact_id:
+                freed += self._delete(self._m2_path.joinpath(\
+                                    *group_id.split('.'), artifact_id))
+
+        self._log_eviction(Const.M2_EVICT_PROJECT, freed, start)
+        return freed
+
+    def evict_lru(self, budget):
+        '''
+        Delete the least recently accessed artifact versions from the m2
+        folder until its size fits the budget in bytes and return the
+        number of bytes freed.
+        '''
+        PathHelper._validate_m2_path(self._m2_path)
+        start = time.monotonic()
+        freed = 0
+
+        versions = self._scan_versions()
+        total = sum([size for _, size, _ in versions])
+
+        for _, size, path in sorted(versions):
+            if total - freed <= budget:
+                break
+
+            freed += self._delete(path)
+
+        self._log_eviction(Const.M2_EVICT_LRU, freed, start)
+        return freed
+
+    @staticmethod
+    def parse_size(size):
+        '''
+        Return the number of bytes of a size text like 512M or 10G.
+        A ValueError is raised when the text is not a valid size.
+        '''
+        if isinstance(size, int):
+            return size
+
+        match = M2Evictor.SIZE_PATTERN.match(str(size))
+
+        if not match:
+            raise ValueError(f'The {size} is not a valid size.')
+
+        value, unit = match.groups()
+        return int(float(value) * M2Evictor.SIZE_UNITS[unit.upper()])
+
+    def _scan_versions(self):
+        versions = list()
+
+        for folder, folders, files in os.walk(self._m2_path):
+            if folders or not files:
+                continue
+
+            last_access, size = 0, 0
+
+            for name in files:
+                stat = os.stat(os.path.join(folder, name))
+                last_access = max(last_access, stat.st_atime, stat.st_mtime)
+                size += stat.st_size
+
+            versions.append((last_access, size, Path(folder)))
+
+        return versions
+
+    def _delete(self, path):
+        if not path.is_dir():
+            return 0
+
+        size = PathHelper.get_size(path)
+
+        try:
+            shutil.rmtree(path)
+        except OSError:
+            raise BuilderProcessException(\
+                f'Process to delete folders and files from ' + \
+                                f'{path} has failed.')
+
+        self._delete_empty_parents(path.parent)
+        return size
+
+    def _delete_empty_parents(self, path):
+        while path != self._m2_path and self._m2_path in path.parents:
+            try:
+                path.rmdir()
+            except OSError:
+                break
+
+            path = path.parent
 
-    @staticmethod
-    def _has_valid_repo_paths(repo_paths):
-        if len(repo_paths) == 0:
-            raise BuilderProcessException(\
-                f'Failed to read the repositories directories.'+\
-                    'Please make sure you had cloned the GIT repositories.')
+    def _log_eviction(self, mode, freed, start):
+        logger.info(f'The m2 folder: {self._m2_path} has been evicted by '+\
+                    f'the {mode} mode: {freed} bytes ' +\
+                    f'({freed / 1024 ** 2:.1f} MB) freed ' +\
+                        f'in {time.monotonic() - start:.2f} seconds')
 
 
 class MultipleBuilderCLI:
@@ -455,6 +4174,340 @@ class MultipleBuilderCLI:
                                 else False
 
 
+class BuildReport:
+    '''
+    This object represents the result of a build executed by the
+    run_build function: the repositories selected to build, the error
+    thats has stopped the build, if any, the wall time in seconds and the
+    timeline and resource report of the build phases.
+    '''
+
+    def __init__(self, repositories=None, exception=None, duration=0, \
+                                    summary=None, timeline=None, \
+                                                    resource_report=None):
+        self.repositories = repositories or list()
+        self.exception = exception
+        self.duration = duration
+        self.summary = summary
+        self.timeline = timeline
+        self.resource_report = resource_report
+
+    @property
+    def is_success(self):
+        '''Returns True if the build has finished without error.'''
+        return self.exception is None
+
+    @property
+    def error(self):
+        '''Return the message of the error thats stopped the build or None.'''
+        return str(self.exception) if self.exception is not None else None
+
+
+class BuildConfigLoader:
+    '''
+    This object is responsible for read a BuildConfig from a JSON file or,
+    when the file has the .toml extension, from a TOML file. The keys can
+    be written with hyphens, as the command options, or with underscores.
+
+    The values are validated as the command options are: by the types of
+    the BuildConfig keys, the sizes like 10G and the allowed choices. A
+    single text is accepted for the keys thats are lists of texts.
+    '''
+    TOML_EXTENSION = '.toml'
+    SIZE_KEYS = ('m2_budget', 'artifact_cache_size', 'min_free_memory')
+    CHOICES = {
+        'm2_evict': Const.M2_EVICT_MODES,
+        'prepare': Const.PREPARE_MODES,
+        'backend': Const.BUILD_BACKENDS
+    }
+    TYPE_NAMES = {bool: 'a boolean', int: 'an integer', float: 'a number', \
+                    Text: 'a text', List[Text]: 'a list of texts'}
+
+    @staticmethod
+    def load(file_path):
+        '''
+        Return the BuildConfig read from the file. A file thats can't be
+        read or has an invalid key raises a BuilderProcessException.
+        '''
+        content = BuildConfigLoader._read_file(file_path)
+
+        if not isinstance(content, dict):
+            raise BuilderProcessException(\
+                    f'The config file {file_path} must contain a table.')
+
+        return BuildConfigLoader.validate(\
+                    {k.replace('-', '_'): v for k, v in content.items()}, \
+                                            f'the config file {file_path}')
+
+    @staticmethod
+    def validate(config, source='the build config'):
+        '''
+        Return a copy of the BuildConfig with the values normalized. An
+        unknown key or an invalid value raises a BuilderProcessException.
+        '''
+        unknown = [k for k in config if k not in BuildConfig.__annotations__]
+
+        if unknown:
+            raise BuilderProcessException(\
+                    f'Unknown keys in {source}: ' + ', '.join(unknown))
+
+        return BuildConfig(**{k: BuildConfigLoader._validate_value(\
+                                    k, v, source) for k, v in config.items()})
+
+    @staticmethod
+    def _validate_value(key, value, source):
+        if value is None:
+            return None
+
+        if key in BuildConfigLoader.SIZE_KEYS:
+            return BuildConfigLoader._validate_size(key, value, source)
+
+        value_type = BuildConfig.__annotations__[key]
+
+        if value_type == List[Text] and isinstance(value, str):
+            value = [value]
+
+        if not BuildConfigLoader._is_type(value, value_type):
+            raise BuilderProcessException(f'The {key} of {source} must be ' +\
+                            f'{BuildConfigLoader.TYPE_NAMES[value_type]}, ' +\
+                                                        f'not {value!r}.')
+
+        choices = BuildConfigLoader.CHOICES.get(key)
+
+        if choices and value not in choices:
+            raise BuilderProcessException(f'The {key} of {source} must ' +\
+                        f'be one of {", ".join(choices)}, not {value!r}.')
+
+        return float(value) if value_type is float else value
+
+    @staticmethod
+    def _is_type(value, value_type):
+        if value_type == List[Text]:
+            return isinstance(value, list) \
+                        and all([isinstance(v, str) for v in value])
+
+        if value_type is float:
+            return isinstance(value, (int, float)) \
+                                        and not isinstance(value, bool)
+
+        if value_type is int:
+            return isinstance(value, int) and not isinstance(value, bool)
+
+        return isinstance(value, value_type)
+
+    @staticmethod
+    def _validate_size(key, value, source):
+        try:
+            if isinstance(value, bool):
+                raise ValueError(f'The {value} is not a valid size.')
+
+            M2Evictor.parse_size(value)
+        except ValueError as e:
+            raise BuilderProcessException(f'The {key} of {source} is ' +\
+                                                    f'invalid. Exception: {e}')
+
+        return value
+
+    @staticmethod
+    def _read_file(file_path):
+        if not os.path.isfile(file_path):
+            raise BuilderProcessException(\
+                            f'The config file {file_path} does not exist.')
+
+        if not file_path.endswith(BuildConfigLoader.TOML_EXTENSION):
+            return PathHelper.read_json(file_path)
+
+        if tomllib is None:
+            raise BuilderProcessException(\
+                'The TOML config files require Python 3.11 or newer, ' +\
+                                            'use a JSON config file instead.')
+
+        try:
+            with open(file_path, 'rb') as toml_file:
+                return tomllib.load(toml_file)
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            raise BuilderProcessException(\
+                        f'Failed to read the config file {file_path}: {e}')
+
+
+class BuildRunner:
+    '''
+    This object is responsible for run a build described by a BuildConfig
+    without any user interaction: it bootstraps and discovers the
+    repositories, creates the process according to the config keys and
+    builds or watches the repositories. When the discovered repositories
+    are passed they are not bootstrapped and discovered again.
+
+    The process is a ProcessSkipMenu when skip_menu is set, a
+    ProcessPersonalized when any of the menu keys is set and build_full
+    is not, or a ProcessBuildFull otherwise. The config keys not set keep
+    the process default values.
+    '''
+    MENU_KEYS = ('build_command', 'is_to_reset', 'is_to_update', \
+                                            'build_branch', 'is_build_all')
+    PROCESS_ATTRIBUTES = {
+        'repos_directory': 'root_path',
+        'clean_m2': 'is_clean_m2',
+        'm2_evict': 'm2_evict_mode',
+        'm2_budget': 'm2_budget',
+        'prepare': 'prepare_mode',
+        'reactor': 'is_reactor',
+        'backend': 'build_backend',
+        'incremental': 'is_incremental',
+        'resume': 'is_to_resume',
+        'keep_going': 'is_keep_going',
+        'probe': 'is_to_probe',
+        'branch': 'build_branches',
+        'plan': 'is_plan',
+        'watch_interval': 'watch_interval',
+        'watch_max_interval': 'watch_max_interval',
+        'sample_resources': 'is_resource_sampling',
+        'sample_interval': 'sample_interval',
+        'staging_repo': 'is_staging_repository',
+        'resource_control': 'is_resource_control',
+        'max_load': 'max_load',
+        'min_free_memory': 'min_free_memory',
+        'artifact_cache': 'is_artifact_cache',
+        'artifact_cache_size': 'artifact_cache_size',
+        'test_cache': 'is_test_cache',
+        'jobs': 'build_jobs',
+        'sync_jobs': 'sync_jobs',
+        'pipeline': 'is_pipeline',
+        'build_command': 'build_command',
+        'build_branch': 'build_branch',
+        'is_to_reset': 'is_to_reset',
+        'is_to_update': 'is_to_update',
+        'is_build_all': 'is_build_all'
+    }
+
+    def __init__(self, config, repositories=None):
+        self._config = config
+        self._repositories = repositories
+
+    def run(self):
+        '''
+        Validate the config and build the repositories, or watch them
+        when watch is set, and return a BuildReport. A config error or a
+        BuilderProcessException is reported instead of raised, the others
+        errors and the interruptions are raised.
+        '''
+        start = time.monotonic()
+        report = BuildReport()
+
+        try:
+            self._config = BuildConfigLoader.validate(self._config)
+            repositories = self._repositories \
+                        if self._repositories is not None \
+                                    else self.create_repositories()
+            process = self.create_process(repositories)
+            report.repositories = process.repositories
+
+            try:
+                if self._config.get('watch'):
+                    process.watch_repositories()
+                else:
+                    process.build_repositories()
+            finally:
+                report.timeline = process.timeline
+                report.resource_report = process.resource_report
+
+                if not process.is_plan:
+                    report.summary = process.timeline.format_summary()
+        except BuilderProcessException as e:
+            report.exception = e
+        finally:
+            report.duration = time.monotonic() - start
+
+        return report
+
+    def create_repositories(self):
+        '''
+        Return a list of Repository instances created from the valid
+        repository paths found in the repos_directory, after cloning
+        the missing repositories of the bootstrap manifest.
+        '''
+        self._bootstrap_repositories()
+
+        repositories = list()
+
+        for path in PathHelper.fetch_repo_paths(\
+                        self._config.get('repos_directory'), \
+                        self._config.get('include'), \
+                        self._config.get('exclude'), \
+                        self._config.get('max_depth', \
+                                                Const.DISCOVERY_MAX_DEPTH), \
+                        self._config.get('rescan', False)):
+            try:
+                repositories.append(Repository(path))
+            except BuilderProcessException as e:
+                logger.warning(e)
+
+        return repositories
+
+    def _bootstrap_repositories(self):
+        if not self._config.get('bootstrap'):
+            return
+
+        RepositoryBootstrapper(self._config.get('repos_directory'), \
+                    self._config['bootstrap'], \
+                        self._config.get('reference'), \
+                            self._config.get('filter'), \
+                                self._config.get('depth'), \
+                    self._config.get('sync_jobs', Const.SYNC_JOBS)).bootstrap()
+
+    def create_process(self, repositories):
+        '''
+        Using a list of discovered repositories create an instance of
+        ProcessBuildFull according to the config and return it. Only the
+        repositories named by the repositories key are built, or all of
+        them when it is not set.
+        '''
+        process = self._create_process_type()
+
+        for key, attribute in self.PROCESS_ATTRIBUTES.items():
+            if key in self._config:
+                setattr(process, attribute, self._config[key])
+
+        process.discovered_repositories = repositories
+        process.repositories = self._filter_repositories(repositories)
+        process.repository_names = self._get_repository_names()
+
+        return process
+
+    def _create_process_type(self):
+        if self._config.get('skip_menu'):
+            return ProcessSkipMenu()
+
+        if not self._config.get('build_full') and \
+                            any([k in self._config for k in self.MENU_KEYS]):
+            return ProcessPersonalized()
+
+        return ProcessBuildFull()
+
+    def _get_repository_names(self):
+        names = list(Const.REPO_PATHS)
+
+        if self._config.get('bootstrap'):
+            names += RepositoryBootstrapper.read_repository_names(\
+                                                    self._config['bootstrap'])
+
+        return names
+
+    def _filter_repositories(self, repositories):
+        names = self._config.get('repositories')
+
+        if names is None:
+            return repositories
+
+        return [repository for repository in repositories \
+                    if any([self._is_repository_name(repository, name) \
+                                                        for name in names])]
+
+    def _is_repository_name(self, repository, name):
+        return name.upper() == repository.initial or \
+                name == os.path.basename(repository._absolute_path)
+
+
 class MultipleBuilderCLIController:
     '''
     The controller class responsible for request the information to user
@@ -466,89 +4519,62 @@ class MultipleBuilderCLIController:
     is also initiate:
     - MultipleBuilderCLI
     - CommandArgsProcess
+
+    The discovered_repositories attribute keeps the repositories found to
+    show the menu, None when the menu is not shown, so they can be built
+    without being bootstrapped and discovered again.
     '''
 
-    def __init__(self):
+    def __init__(self, args=None):
         self._cli = MultipleBuilderCLI()
-        self._command_args  = CommandArgsProcessor()
+        self._command_args  = CommandArgsProcessor(args)
+        self.discovered_repositories = None
 
-    def create_process(self, repositories):
+    def create_config(self):
         '''
-        Using a list for respositories create an instance of 
-        ProcessBuildFull according to the user preferences and return it. 
+        Return the BuildConfig of the command arguments completed with
+        the user answers to the menu questions thats are not answered by
+        the config file yet, according to the user preferences.
         '''
-        process = None
+        config = self._command_args.to_config()
 
         if self._command_args.is_build_full():
-            process = ProcessBuildFull()
-            process.repositories = repositories
-        elif self._command_args.is_to_skip_menu():
-            process = ProcessSkipMenu()
-            self._setup_personalized_repository(process, repositories)
-        else:
-            process = ProcessPersonalized()
-            self._setup_personalized_repository(process, repositories)
-            self._set_personalized_process_values(process)
-
-        process.is_clean_m2 = self._command_args.is_to_clean_m2()
-
-        return process
+            return config
 
-    def _setup_personalized_repository(self, process, repositories):
-        repositories_initial = self._get_repositories_initial(repositories)
-        
-        user_response = self._cli.request_user_repositories(\
-                                                    repositories_initial)
-                                                    
-        process.repositories = self._filter_repositories_user_response(\
-                                                        user_response, \
-                                                            repositories)
+        if 'repositories' not in config:
+            config['repositories'] = self._request_repositories(config)
 
-    def _get_repositories_initial(self, repositories):
-        return [r.initial for r in repositories]
+        if not self._command_args.is_to_skip_menu():
+            self._set_personalized_config_values(config)
 
-    def _filter_repositories_user_response(self, choices, repositories):
-        return [repository for repository in repositories \
-                        for choice in choices \
-                            if choice.endswith(repository.initial)]
-    
-    def _set_personalized_process_values(self, process):
-        process.build_command = self._cli.request_type_build_comands()
+        return config
 
-        process.is_to_reset = self._cli.request_is_to_reset()
-        process.is_to_update = self._cli.request_is_to_update()
-        process.build_branch = self._cli.request_branch_to_build()
+    def _request_repositories(self, config):
+        self.discovered_repositories = \
+                                BuildRunner(config).create_repositories()
+        repositories_initial = self._get_repositories_initial(\
+                                                self.discovered_repositories)
 
-        self._set_is_to_build_all(process)   
-    
-    def _set_is_to_build_all(self, process):
-        if process.is_to_update:
-            process.is_build_all = self._cli.request_is_to_build_all()
+        return list(self._cli.request_user_repositories(repositories_initial))
 
-    def create_repositories(self):
-        '''
-        Return a list of Repository instances created according 
-        to the user preferences based on valid repository paths.
-        '''
-        repositories_paths = self._get_repositories_paths()
+    def _get_repositories_initial(self, repositories):
+        return [r.initial for r in repositories]
 
-        return self._initiate_repositories(repositories_paths)
-   
-    def _get_repositories_paths(self):
-        paths_from_command_args = self._command_args.repos_directory
+    def _set_personalized_config_values(self, config):
+        requests = (('build_command', self._cli.request_type_build_comands), \
+                    ('is_to_reset', self._cli.request_is_to_reset), \
+                    ('is_to_update', self._cli.request_is_to_update), \
+                    ('build_branch', self._cli.request_branch_to_build))
 
-        return PathHelper.fetch_repo_paths(paths_from_command_args)
+        for key, request in requests:
+            if key not in config:
+                config[key] = request()
 
-    def _initiate_repositories(self, repositories_paths):
-        repositories = list()
+        self._set_is_to_build_all(config)
 
-        for path in repositories_paths:
-            try:
-                repositories.append(Repository(path))
-            except BuilderProcessException as e:
-                logger.warning(e)
-        
-        return repositories
+    def _set_is_to_build_all(self, config):
+        if config['is_to_update'] and 'is_build_all' not in config:
+            config['is_build_all'] = self._cli.request_is_to_build_all()
 
 
 class CommandArgument(TypedDict, total=False):
@@ -561,11 +4587,81 @@ class CommandArgument(TypedDict, total=False):
                 a command method identify.
         action: The action for the CommandArgument.
         help: Text description that helps the usage of the command.
+        type: The callable used to convert the CommandArgument value.
+        default: The value used when the CommandArgument is not passed.
+        choices: The allowed values for the CommandArgument.
     '''
     flag: Text
     name: Text
     action: Text
     help: Text
+    type: Callable
+    default: Any
+    choices: Tuple
+
+
+class BuildConfig(TypedDict, total=False):
+    '''
+    The configuration of a build executed by the run_build function, read
+    from a JSON or TOML file by the BuildConfigLoader or created by the
+    caller. The keys are the command options long names, plus the
+    questions of the menu.
+
+    Attributes:
+        repositories: The repositories to build, by theirs exact
+                initials or folder names. All the discovered repositories
+                are built when it is not set.
+        build_command: One of the Maven commands of Const.BUILD_CMDS.
+        build_branch: The branch to reset, checkout and update.
+        is_to_reset: Reset the repositories before the update.
+        is_to_update: Update the repositories by Git.
+        is_build_all: Build the repositories even when not changed.
+        The others keys: The same values of the command options.
+    '''
+    repositories: List[Text]
+    build_command: Text
+    build_branch: Text
+    is_to_reset: bool
+    is_to_update: bool
+    is_build_all: bool
+    build_full: bool
+    skip_menu: bool
+    repos_directory: Text
+    include: List[Text]
+    exclude: List[Text]
+    max_depth: int
+    rescan: bool
+    bootstrap: Text
+    reference: Text
+    filter: Text
+    depth: int
+    branch: List[Text]
+    clean_m2: bool
+    m2_evict: Text
+    m2_budget: Text
+    prepare: Text
+    jobs: int
+    sync_jobs: int
+    pipeline: bool
+    reactor: bool
+    backend: Text
+    incremental: bool
+    resume: bool
+    keep_going: bool
+    probe: bool
+    plan: bool
+    watch: bool
+    watch_interval: float
+    watch_max_interval: float
+    sample_resources: bool
+    sample_interval: float
+    staging_repo: bool
+    resource_control: bool
+    max_load: float
+    min_free_memory: Text
+    artifact_cache: bool
+    artifact_cache_size: Text
+    test_cache: bool
 
 
 class CommandArgsProcessor:
@@ -575,6 +4671,7 @@ class CommandArgsProcessor:
     parameters passed when the process is executed.
     '''
     ACTION_STORE_TRUE = "store_true"
+    ACTION_APPEND = "append"
     ARGUMENT_PARSER_DESCRIPTION = \
                         ">>>>> Options to update and build projects! <<<<<"
 
@@ -590,6 +4687,20 @@ class CommandArgsProcessor:
     CLEAN_M2_NAME = "--clean-m2"
     CLEAN_M2_HELP = "Delete all folders and files from .m2 folder."
 
+    M2_EVICT_NAME = "--m2-evict"
+    M2_EVICT_HELP = "How the .m2 folder is cleaned when -c is passed: " +\
+                f"'{Const.M2_EVICT_ALL}' deletes everything, " +\
+                f"'{Const.M2_EVICT_PROJECT}' deletes only the artifacts " +\
+                "built by the found repositories and " +\
+                f"'{Const.M2_EVICT_LRU}' deletes the least recently used " +\
+                "artifacts until the folder fits the --m2-budget size. " +\
+                f"Default: {Const.M2_EVICT_ALL}."
+
+    M2_BUDGET_NAME = "--m2-budget"
+    M2_BUDGET_HELP = "The maximum size of the .m2 folder used by the " +\
+                f"'{Const.M2_EVICT_LRU}' eviction, e.g.: 512M or 10G. " +\
+                f"Default: {Const.M2_BUDGET}."
+
     REPOS_DIR_FLAG = "-d"
     REPOS_DIR_NAME = "--repos-directory"
     REPOS_DIR_HELP = "Add your repositories absolute path. If this \
@@ -597,18 +4708,237 @@ class CommandArgsProcessor:
                         will be consider as the root path to find the \
                         repositories folder."
 
+    CONFIG_NAME = "--config"
+    CONFIG_HELP = "Read the options and the menu answers from a JSON \
+                or a TOML (.toml) config file. The keys are the long \
+                options names, and the command line options override \
+                them. The menu questions answered by the file are not \
+                asked."
+
+    ARTIFACT_CACHE_NAME = "--artifact-cache"
+    ARTIFACT_CACHE_HELP = "Store the artifacts installed by each \
+                repository build in a local cache addressed by its sources, \
+                POMs, build command and upstream repositories. A repository \
+                found in the cache has its artifacts copied to the .m2 \
+                folder instead of being built."
+
+    ARTIFACT_CACHE_SIZE_NAME = "--artifact-cache-size"
+    ARTIFACT_CACHE_SIZE_HELP = "The maximum size of the artifact cache, \
+                e.g.: 512M or 10G. Default: " +\
+                f"{Const.ARTIFACT_CACHE_SIZE}."
+
+    TEST_CACHE_NAME = "--test-cache"
+    TEST_CACHE_HELP = "Record the Maven modules whose tests have passed by \
+                a key of theirs sources, test sources, POMs and upstream \
+                modules. The tests run only for the modules whose key has \
+                changed, the others modules are installed with -DskipTests."
+
+    WATCH_NAME = "--watch"
+    WATCH_HELP = "Keep running after the build, reading the remote branch \
+                head of the repositories by 'git ls-remote' periodically \
+                and synchronizing and building only the repositories thats \
+                have moved, in dependency order, until CTRL+C."
+
+    WATCH_INTERVAL_NAME = "--watch-interval"
+    WATCH_INTERVAL_HELP = "Seconds between the remotes polls of the \
+                --watch mode. Default: " + f"{Const.WATCH_INTERVAL}."
+
+    WATCH_MAX_INTERVAL_NAME = "--watch-max-interval"
+    WATCH_MAX_INTERVAL_HELP = "Maximum seconds between the remotes polls, \
+                thats are doubled while nothing moves or a build fails. \
+                Default: " + f"{Const.WATCH_MAX_INTERVAL}."
+
+    SAMPLE_RESOURCES_NAME = "--sample-resources"
+    SAMPLE_RESOURCES_HELP = "Sample the processes of every Git and Maven \
+                command from /proc and report the peak RSS, the CPU seconds \
+                and the bytes read and written by repository and phase at \
+                the end of the run."
+
+    SAMPLE_INTERVAL_NAME = "--sample-interval"
+    SAMPLE_INTERVAL_HELP = "Seconds between the samples of the \
+                --sample-resources option. Default: " +\
+                f"{Const.SAMPLE_INTERVAL}."
+
+    PLAN_NAME = "--plan"
+    PLAN_HELP = "Show the predicted build order and time, estimated from \
+                the duration of the previous runs, without executing \
+                anything."
+
+    STAGING_REPOSITORY_NAME = "--staging-repo"
+    STAGING_REPOSITORY_HELP = "Install each build into its own staging \
+                local Maven repository, reading the shared one as a \
+                read-only tail (Maven 3.9 or newer), and merge it into the \
+                shared repository only when the build succeeds."
+
+    RESOURCE_CONTROL_NAME = "--resource-control"
+    RESOURCE_CONTROL_HELP = "Divide the host cores and memory among the \
+                builds running at same time, by the Maven -T option and the \
+                MAVEN_OPTS heap of each build, and hold back new builds \
+                while the load average or the available memory cross the \
+                --max-load and --min-free-memory thresholds."
+
+    MAX_LOAD_NAME = "--max-load"
+    MAX_LOAD_HELP = "The 1 minute load average above which new builds are \
+                held back. Default: the number of cores."
+
+    MIN_FREE_MEMORY_NAME = "--min-free-memory"
+    MIN_FREE_MEMORY_HELP = "The available memory below which new builds \
+                are held back, e.g.: 512M or 2G. Default: " +\
+                f"{Const.MIN_FREE_MEMORY}."
+
+    BOOTSTRAP_NAME = "--bootstrap"
+    BOOTSTRAP_HELP = "JSON manifest with the repositories to clone at same \
+                time when they are missing in the repositories directory, \
+                e.g.: {\"repositories\": [{\"path\": \"sample_1\", \
+                \"url\": \"git@host:sample_1.git\"}]}. The repositories \
+                already cloned get the same reference and filter."
+
+    REFERENCE_NAME = "--reference"
+    REFERENCE_HELP = "Repository whose objects are shared with the \
+                bootstrapped repositories by the Git alternates."
+
+    FILTER_NAME = "--filter"
+    FILTER_HELP = "Partial clone filter of the bootstrapped repositories, \
+                e.g.: blob:none."
+
+    DEPTH_NAME = "--depth"
+    DEPTH_HELP = "Shallow clone depth of the missing repositories cloned \
+                by --bootstrap. The repositories already cloned keep \
+                theirs history."
+
+    BRANCH_NAME = "--branch"
+    BRANCH_HELP = "Branch to build, thats can be repeated. Each branch is \
+                built in a persistent Git worktree by repository, inside \
+                the .multiple_builder folder, with its own local Maven \
+                repository, and the branches are built at same time. The \
+                worktrees are reused between the runs."
+
+    INCLUDE_NAME = "--include"
+    INCLUDE_HELP = "Pattern of the repositories folders to build, thats \
+                can be repeated: a folder name suffix, a glob like 'core-*' \
+                or a regular expression prefixed by 're:'. Default: " +\
+                f"{', '.join(Const.REPO_PATHS)}."
+
+    EXCLUDE_NAME = "--exclude"
+    EXCLUDE_HELP = "Pattern of the folders to skip when searching the \
+                repositories, thats can be repeated, in the same format \
+                of --include."
+
+    MAX_DEPTH_NAME = "--max-depth"
+    MAX_DEPTH_HELP = "How many folders deep the repositories are searched \
+                inside the root path. Default: " +\
+                f"{Const.DISCOVERY_MAX_DEPTH}."
+
+    RESCAN_NAME = "--rescan"
+    RESCAN_HELP = "Search the repositories again ignoring the index of \
+                the repositories found by the previous runs."
+
+    PREPARE_NAME = "--prepare"
+    PREPARE_HELP = "How the repositories are prepared before the update: " +\
+                f"'{Const.PREPARE_FULL}' always runs 'git clean -fxd', " +\
+                "checkout and reset, deleting the build outputs, and " +\
+                f"'{Const.PREPARE_PRESERVE}' checks the work tree first, " +\
+                "deletes only untracked files thats are not ignored and " +\
+                "skips the checkout and the reset when the branch and the " +\
+                f"commit are already right. Default: {Const.PREPARE_FULL}."
+
+    REACTOR_NAME = "--reactor"
+    REACTOR_HELP = "Build all the repositories by a single Maven execution \
+                over a generated aggregator POM, letting the Maven reactor \
+                order and parallelize the build with -T set by -j when it \
+                is greater than 1."
+
+    BACKEND_NAME = "--backend"
+    BACKEND_HELP = "The tool thats runs the Maven commands: " +\
+                f"'{Const.BUILD_BACKEND_MVN}' starts a new JVM by build and " +\
+                f"'{Const.BUILD_BACKEND_MVND}' reuses the warm JVMs of the " +\
+                "Maven Daemon, falling back to " +\
+                f"'{Const.BUILD_BACKEND_MVN}' when it is not installed. " +\
+                f"Default: {Const.BUILD_BACKEND_MVN}."
+
+    INCREMENTAL_NAME = "--incremental"
+    INCREMENTAL_HELP = "Build only the Maven modules changed since the last \
+                successful build of each repository, and the modules they \
+                depend on or thats depend on them, using '-pl <modules> -am \
+                -amd'. Changes outside the modules, like the root pom.xml, \
+                and the -c option fall back to the full build."
+
+    RESUME_NAME = "--resume"
+    RESUME_HELP = "Resume the last run from the first unfinished phase \
+                (prepare, update or build) of each repository, skipping \
+                the phases already finished by it."
+
+    KEEP_GOING_FLAG = "-k"
+    KEEP_GOING_NAME = "--keep-going"
+    KEEP_GOING_HELP = "Keep building the others repositories when a \
+                repository fails, skipping only the ones thats depend on \
+                it. All the failures are reported at the end."
+
+    PROBE_NAME = "--probe"
+    PROBE_HELP = "Read the remote branch head of all the repositories by \
+                'git ls-remote' at same time before the sync stage, and \
+                clean, checkout, reset and pull only the repositories thats \
+                are not at the remote head, at the build branch and without \
+                local changes."
+
+    JOBS_FLAG = "-j"
+    JOBS_NAME = "--jobs"
+    JOBS_HELP = "Number of repositories built at same time. The \
+                repositories are ordered by the dependencies found in \
+                theirs pom.xml files and a repository only starts after \
+                the ones it depends on have been built. Default: " +\
+                f"{Const.BUILD_JOBS}."
+
+    SYNC_JOBS_FLAG = "-sj"
+    SYNC_JOBS_NAME = "--sync-jobs"
+    SYNC_JOBS_HELP = "Number of repositories synchronized by Git at same \
+                time before the build starts. Default: " +\
+                f"{Const.SYNC_JOBS}."
+
+    PIPELINE_FLAG = "-p"
+    PIPELINE_NAME = "--pipeline"
+    PIPELINE_HELP = "Start to build each repository as soon as it has \
+                been synchronized by Git, while the others repositories \
+                are still being synchronized. The -sj and -j options \
+                limit each stage separately."
+
     SKIP_MENU_FLAG = "-sm"
     SKIP_MENU_NAME = "--skip-menu"
     SKIP_MENU_HELP = "This option allow to select which repository must be \
                     updated, but all the others menu questions is skipped."
 
-    def __init__(self):
+    def __init__(self, args=None):
         parser = self._initiate_parser()
 
         arg_list = self._create_arguments()
 
         self._populate_args(arg_list, parser)
-        self._parsed_args = parser.parse_args()
+        config_lists = self._set_config_defaults(parser, args, \
+                                        self._get_append_names(arg_list))
+        self._parsed_args = parser.parse_args(args)
+        self._set_config_lists(config_lists)
+
+    def _set_config_defaults(self, parser, args, append_names):
+        config_path = parser.parse_known_args(args)[0].config
+
+        if not config_path:
+            return dict()
+
+        config = BuildConfigLoader.load(config_path)
+        config_lists = {k: config.pop(k) for k in append_names \
+                                                            if k in config}
+        parser.set_defaults(**config)
+
+        return config_lists
+
+    def _get_append_names(self, arg_list):
+        return [arg['name'].lstrip('-').replace('-', '_') for arg in arg_list \
+                                if arg.get('action') == self.ACTION_APPEND]
+
+    def _set_config_lists(self, config_lists):
+        for key, value in config_lists.items():
+            if getattr(self._parsed_args, key) is None:
+                setattr(self._parsed_args, key, value)
 
     def _initiate_parser(self):
         return argparse.ArgumentParser(description=\
@@ -631,6 +4961,200 @@ class CommandArgsProcessor:
             help = self.CLEAN_M2_HELP
         )
 
+        m2_evict = CommandArgument(
+            name = self.M2_EVICT_NAME,
+            choices = Const.M2_EVICT_MODES,
+            default = Const.M2_EVICT_ALL,
+            help = self.M2_EVICT_HELP
+        )
+
+        m2_budget = CommandArgument(
+            name = self.M2_BUDGET_NAME,
+            type = self._parse_size,
+            default = Const.M2_BUDGET,
+            help = self.M2_BUDGET_HELP
+        )
+
+        artifact_cache = CommandArgument(
+            name = self.ARTIFACT_CACHE_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.ARTIFACT_CACHE_HELP
+        )
+
+        test_cache = CommandArgument(
+            name = self.TEST_CACHE_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.TEST_CACHE_HELP
+        )
+
+        artifact_cache_size = CommandArgument(
+            name = self.ARTIFACT_CACHE_SIZE_NAME,
+            type = self._parse_size,
+            default = Const.ARTIFACT_CACHE_SIZE,
+            help = self.ARTIFACT_CACHE_SIZE_HELP
+        )
+
+        watch = CommandArgument(
+            name = self.WATCH_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.WATCH_HELP
+        )
+
+        watch_interval = CommandArgument(
+            name = self.WATCH_INTERVAL_NAME,
+            type = float,
+            default = Const.WATCH_INTERVAL,
+            help = self.WATCH_INTERVAL_HELP
+        )
+
+        watch_max_interval = CommandArgument(
+            name = self.WATCH_MAX_INTERVAL_NAME,
+            type = float,
+            default = Const.WATCH_MAX_INTERVAL,
+            help = self.WATCH_MAX_INTERVAL_HELP
+        )
+
+        sample_resources = CommandArgument(
+            name = self.SAMPLE_RESOURCES_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.SAMPLE_RESOURCES_HELP
+        )
+
+        sample_interval = CommandArgument(
+            name = self.SAMPLE_INTERVAL_NAME,
+            type = float,
+            default = Const.SAMPLE_INTERVAL,
+            help = self.SAMPLE_INTERVAL_HELP
+        )
+
+        plan = CommandArgument(
+            name = self.PLAN_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.PLAN_HELP
+        )
+
+        staging_repository = CommandArgument(
+            name = self.STAGING_REPOSITORY_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.STAGING_REPOSITORY_HELP
+        )
+
+        resource_control = CommandArgument(
+            name = self.RESOURCE_CONTROL_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.RESOURCE_CONTROL_HELP
+        )
+
+        max_load = CommandArgument(
+            name = self.MAX_LOAD_NAME,
+            type = float,
+            help = self.MAX_LOAD_HELP
+        )
+
+        min_free_memory = CommandArgument(
+            name = self.MIN_FREE_MEMORY_NAME,
+            type = self._parse_size,
+            default = Const.MIN_FREE_MEMORY,
+            help = self.MIN_FREE_MEMORY_HELP
+        )
+
+        bootstrap = CommandArgument(
+            name = self.BOOTSTRAP_NAME,
+            help = self.BOOTSTRAP_HELP
+        )
+
+        reference = CommandArgument(
+            name = self.REFERENCE_NAME,
+            help = self.REFERENCE_HELP
+        )
+
+        clone_filter = CommandArgument(
+            name = self.FILTER_NAME,
+            help = self.FILTER_HELP
+        )
+
+        depth = CommandArgument(
+            name = self.DEPTH_NAME,
+            type = int,
+            help = self.DEPTH_HELP
+        )
+
+        branch = CommandArgument(
+            name = self.BRANCH_NAME,
+            action = self.ACTION_APPEND,
+            help = self.BRANCH_HELP
+        )
+
+        include = CommandArgument(
+            name = self.INCLUDE_NAME,
+            action = self.ACTION_APPEND,
+            help = self.INCLUDE_HELP
+        )
+
+        exclude = CommandArgument(
+            name = self.EXCLUDE_NAME,
+            action = self.ACTION_APPEND,
+            help = self.EXCLUDE_HELP
+        )
+
+        max_depth = CommandArgument(
+            name = self.MAX_DEPTH_NAME,
+            type = int,
+            default = Const.DISCOVERY_MAX_DEPTH,
+            help = self.MAX_DEPTH_HELP
+        )
+
+        rescan = CommandArgument(
+            name = self.RESCAN_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.RESCAN_HELP
+        )
+
+        prepare = CommandArgument(
+            name = self.PREPARE_NAME,
+            choices = Const.PREPARE_MODES,
+            default = Const.PREPARE_FULL,
+            help = self.PREPARE_HELP
+        )
+
+        reactor = CommandArgument(
+            name = self.REACTOR_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.REACTOR_HELP
+        )
+
+        backend = CommandArgument(
+            name = self.BACKEND_NAME,
+            choices = Const.BUILD_BACKENDS,
+            default = Const.BUILD_BACKEND_MVN,
+            help = self.BACKEND_HELP
+        )
+
+        incremental = CommandArgument(
+            name = self.INCREMENTAL_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.INCREMENTAL_HELP
+        )
+
+        resume = CommandArgument(
+            name = self.RESUME_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.RESUME_HELP
+        )
+
+        keep_going = CommandArgument(
+            flag = self.KEEP_GOING_FLAG,
+            name = self.KEEP_GOING_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.KEEP_GOING_HELP
+        )
+
+        probe = CommandArgument(
+            name = self.PROBE_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.PROBE_HELP
+        )
+
         skip_menu = CommandArgument(
             flag = self.SKIP_MENU_FLAG,
             name = self.SKIP_MENU_NAME,
@@ -644,37 +5168,110 @@ class CommandArgsProcessor:
             help = self.REPOS_DIR_HELP
         )
 
+        config = CommandArgument(
+            name = self.CONFIG_NAME,
+            help = self.CONFIG_HELP
+        )
+
+        jobs = CommandArgument(
+            flag = self.JOBS_FLAG,
+            name = self.JOBS_NAME,
+            type = int,
+            default = Const.BUILD_JOBS,
+            help = self.JOBS_HELP
+        )
+
+        sync_jobs = CommandArgument(
+            flag = self.SYNC_JOBS_FLAG,
+            name = self.SYNC_JOBS_NAME,
+            type = int,
+            default = Const.SYNC_JOBS,
+            help = self.SYNC_JOBS_HELP
+        )
+
+        pipeline = CommandArgument(
+            flag = self.PIPELINE_FLAG,
+            name = self.PIPELINE_NAME,
+            action = self.ACTION_STORE_TRUE,
+            help = self.PIPELINE_HELP
+        )
+
         arg_list.append(build_full)
         arg_list.append(clean_m2)
+        arg_list.append(m2_evict)
+        arg_list.append(m2_budget)
+        arg_list.append(prepare)
         arg_list.append(skip_menu)
         arg_list.append(repos_dir)
+        arg_list.append(config)
+        arg_list.append(bootstrap)
+        arg_list.append(reference)
+        arg_list.append(clone_filter)
+        arg_list.append(depth)
+        arg_list.append(branch)
+        arg_list.append(include)
+        arg_list.append(exclude)
+        arg_list.append(max_depth)
+        arg_list.append(rescan)
+        arg_list.append(jobs)
+        arg_list.append(sync_jobs)
+        arg_list.append(probe)
+        arg_list.append(watch)
+        arg_list.append(watch_interval)
+        arg_list.append(watch_max_interval)
+        arg_list.append(plan)
+        arg_list.append(sample_resources)
+        arg_list.append(sample_interval)
+        arg_list.append(staging_repository)
+        arg_list.append(resource_control)
+        arg_list.append(max_load)
+        arg_list.append(min_free_memory)
+        arg_list.append(pipeline)
+        arg_list.append(reactor)
+        arg_list.append(backend)
+        arg_list.append(incremental)
+        arg_list.append(resume)
+        arg_list.append(keep_going)
+        arg_list.append(artifact_cache)
+        arg_list.append(artifact_cache_size)
+        arg_list.append(test_cache)
 
         return arg_list
 
+    def _parse_size(self, size):
+        try:
+            M2Evictor.parse_size(size)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(e)
+
+        return size
+
     def _populate_args(self, arg_list, parser):
         for arg in arg_list:
-            parser.add_argument(arg.get('flag'),
-                        arg.get('name'),
-                        action=arg.get('action', None),
-                        help=arg.get('help'))
+            names = [arg.get(k) for k in ('flag', 'name') if arg.get(k)]
+            options = {k: v for k, v in arg.items() \
+                            if k not in ('flag', 'name')}
+
+            parser.add_argument(*names, **options)
     
+    def to_config(self):
+        '''
+        Return a BuildConfig with the values of all the command options
+        and of the config file keys.
+        '''
+        config = vars(self._parsed_args).copy()
+        config.pop('config')
+
+        return BuildConfig(**config)
+
     def is_build_full(self):
         '''Returns True if the build must be full or False is not.'''
         return self._parsed_args.build_full
 
-    def is_to_clean_m2(self):
-        '''Returns True for to clean the Maven m2 folder or False is not.'''
-        return self._parsed_args.clean_m2
-
     def is_to_skip_menu(self):
         '''Returns True for to skip the menu or False is not.'''
         return self._parsed_args.skip_menu
 
-    @property
-    def repos_directory(self):
-        '''Return the absolute path passed by with the parameter -d.'''
-        return self._parsed_args.repos_directory
-
 
 def setup_logger():
     global logger
@@ -683,17 +5280,40 @@ def setup_logger():
     logger = logging.getLogger(__name__)
 
 
+def run_build(config, repositories=None):
+    '''
+    Run a build described by the BuildConfig without any user interaction
+    and return its BuildReport, so the builds can be executed one after
+    the other by the same Python process. A BuilderProcessException is
+    reported in the BuildReport instead of raised.
+
+    The repositories are the list of Repository already discovered, when
+    passed they are not bootstrapped and discovered again.
+
+    The logging is not configured, when the module logger is not set yet
+    the messages follow the caller logging configuration.
+    '''
+    global logger
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    return BuildRunner(config, repositories).run()
+
+
 def start_build():
     try:
         setup_logger()
 
         cli_controller = MultipleBuilderCLIController()
 
-        repositories = cli_controller.create_repositories()
-        
-        process = cli_controller.create_process(repositories)
+        config = cli_controller.create_config()
+        report = run_build(config, cli_controller.discovered_repositories)
+
+        if report.summary is not None:
+            logger.info('Build phases summary:\n' + report.summary)
 
-        process.build_repositories()
+        if not report.is_success:
+            logger.error(report.exception, exc_info=report.exception)
 
     except KeyboardInterrupt:
         logger.info(f'The process has finished by CTRL+C.')
@@ -0,0 +1,51 @@
+import logging
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import multiple_builder
+
+multiple_builder.logger = logging.getLogger('multiple_builder')
+
+POM_TEMPLATE = '''<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>{group_id}</groupId>
+  <artifactId>{artifact_id}</artifactId>
+  <version>1.0</version>
+  <dependencies>{dependencies}</dependencies>
+</project>
+'''
+
+DEPENDENCY_TEMPLATE = '''
+    <dependency>
+      <groupId>{group_id}</groupId>
+      <artifactId>{artifact_id}</artifactId>
+    </dependency>'''
+
+
+def write_pom(path, artifact_id, dependencies=(), group_id='com.acme'):
+    os.makedirs(path, exist_ok=True)
+
+    with open(os.path.join(path, 'pom.xml'), 'w') as pom_file:
+        pom_file.write(POM_TEMPLATE.format(group_id=group_id, \
+            artifact_id=artifact_id, dependencies=''.join(\
+                [DEPENDENCY_TEMPLATE.format(group_id=g, artifact_id=a) \
+                                                for g, a in dependencies])))
+
+
+@pytest.fixture
+def make_repository(tmp_path):
+    '''
+    Return a function thats creates a Repository folder named by the
+    artifact with a pom.xml depending on the (groupId, artifactId) pairs.
+    '''
+    def make(artifact_id, dependencies=(), group_id='com.acme', folder=None):
+        path = os.path.join(str(tmp_path), folder or artifact_id)
+        write_pom(path, artifact_id, dependencies, group_id)
+
+        return multiple_builder.Repository(path)
+
+    return make
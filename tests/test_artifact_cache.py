@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from multiple_builder import ArtifactCache, MavenModule
+
+
+@pytest.fixture
+def m2_path(tmp_path):
+    return tmp_path / 'm2'
+
+
+def install(m2_path, artifact_id, content='jar'):
+    folder = m2_path / 'com' / 'acme' / artifact_id / '1.0'
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / f'{artifact_id}-1.0.jar').write_text(content)
+
+    return MavenModule('com.acme', artifact_id, '1.0', str(folder))
+
+
+def test_stored_artifacts_are_restored(tmp_path, m2_path):
+    cache = ArtifactCache(str(tmp_path / 'cache'), 1024, str(m2_path))
+    cache.store('key', [install(m2_path, 'core', 'built')])
+    jar = m2_path / 'com' / 'acme' / 'core' / '1.0' / 'core-1.0.jar'
+    jar.unlink()
+
+    assert cache.restore('key')
+    assert jar.read_text() == 'built'
+    assert not cache.restore('other')
+
+
+def test_artifacts_not_installed_are_not_stored(tmp_path, m2_path):
+    cache = ArtifactCache(str(tmp_path / 'cache'), 1024, str(m2_path))
+    module = MavenModule('com.acme', 'core', '1.0', str(tmp_path))
+
+    cache.store('key', [module])
+
+    assert not cache.restore('key')
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, m2_path):
+    cache = ArtifactCache(str(tmp_path / 'cache'), 10, str(m2_path))
+    cache.store('old', [install(m2_path, 'core', 'x' * 6)])
+    os.utime(str(tmp_path / 'cache' / 'old'), (0, 0))
+
+    cache.store('new', [install(m2_path, 'api', 'y' * 6)])
+
+    assert not cache.restore('old')
+    assert cache.restore('new')
+
+
+def test_broken_entry_is_removed_on_store(tmp_path, m2_path):
+    cache = ArtifactCache(str(tmp_path / 'cache'), 1024, str(m2_path))
+    broken = tmp_path / 'cache' / 'broken'
+    broken.mkdir(parents=True)
+    (broken / ArtifactCache.ENTRY_FILE).write_text('{not json')
+
+    cache.store('key', [install(m2_path, 'core')])
+
+    assert cache.restore('key')
+    assert not broken.exists()
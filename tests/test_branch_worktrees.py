@@ -0,0 +1,128 @@
+import os
+import subprocess
+
+import pytest
+
+from multiple_builder import Const, ProcessBuildFull
+
+GIT_ENV = {
+    'GIT_AUTHOR_NAME': 'test', 'GIT_AUTHOR_EMAIL': 'test@local',
+    'GIT_COMMITTER_NAME': 'test', 'GIT_COMMITTER_EMAIL': 'test@local'
+}
+
+
+def run_git(args, cwd):
+    return subprocess.run(['git'] + args, cwd=cwd, check=True, \
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, \
+                        universal_newlines=True, \
+                            env=dict(os.environ, **GIT_ENV)).stdout.strip()
+
+
+@pytest.fixture
+def core(make_repository, tmp_path):
+    '''
+    Return the core Repository cloned from a bare origin with a master
+    and a develop branch, thats has one more commit.
+    '''
+    repository = make_repository('core')
+    origin_path = str(tmp_path / 'origins' / 'core.git')
+    path = repository._absolute_path
+
+    run_git(['init', '-q', '--bare', '-b', 'master', origin_path], tmp_path)
+    run_git(['init', '-q', '-b', 'master'], path)
+    run_git(['add', '-A'], path)
+    run_git(['commit', '-q', '-m', 'Initial commit'], path)
+    run_git(['remote', 'add', 'origin', origin_path], path)
+    run_git(['push', '-q', '-u', 'origin', 'master'], path)
+    run_git(['checkout', '-q', '-b', 'develop'], path)
+    (tmp_path / 'core' / 'README.md').write_text('develop')
+    run_git(['add', '-A'], path)
+    run_git(['commit', '-q', '-m', 'Develop commit'], path)
+    run_git(['push', '-q', 'origin', 'develop'], path)
+    run_git(['checkout', '-q', 'master'], path)
+
+    return repository
+
+
+@pytest.fixture
+def process(tmp_path, core):
+    process = ProcessBuildFull()
+    process.root_path = str(tmp_path)
+    process.repositories = [core]
+    process.build_branches = ['master', 'develop']
+    process._run_id = 'test'
+
+    return process
+
+
+def test_worktrees_are_created_at_the_origin_branch_head(process, core):
+    worktrees = process._create_branch_worktrees()
+
+    branches_repositories = worktrees.create([core])
+
+    for branch in process.build_branches:
+        worktree, = branches_repositories[branch]
+        assert worktree._absolute_path == os.path.join(\
+                                    worktrees.get_branch_path(branch), 'core')
+        assert run_git(['rev-parse', 'HEAD'], worktree._absolute_path) == \
+            run_git(['rev-parse', 'origin/' + branch], core._absolute_path)
+
+    assert os.path.isfile(os.path.join(\
+                    branches_repositories['develop'][0]._absolute_path, \
+                                                            'README.md'))
+
+
+def test_existing_worktrees_are_reused(process, core):
+    commands = list()
+    worktrees = process._create_branch_worktrees()
+    worktree_path = worktrees.create([core])['develop'][0]._absolute_path
+    output_path = os.path.join(worktree_path, 'target', 'core.jar')
+    os.makedirs(os.path.dirname(output_path))
+    open(output_path, 'w').close()
+
+    worktrees._run_command = lambda command, path: commands.append(command)
+    worktree, = worktrees.create([core])['develop']
+
+    assert commands == []
+    assert worktree._absolute_path == worktree_path
+    assert os.path.isfile(output_path)
+
+
+def test_branch_process_builds_the_worktrees_with_its_own_m2(process, \
+                                        core, make_repository, tmp_path):
+    other = make_repository('other')
+    process.discovered_repositories = [core, other]
+    process.build_jobs = 3
+    worktrees = process._create_branch_worktrees()
+    branches_repositories = worktrees.create([core])
+
+    processes = [process._create_branch_process(b, worktrees, \
+                branches_repositories[b]) for b in process.build_branches]
+
+    for branch, branch_process in zip(process.build_branches, processes):
+        assert branch_process.build_branch == branch
+        assert branch_process.build_branches is None
+        assert branch_process.root_path == worktrees.get_branch_path(branch)
+        assert branch_process._get_state_file_path(Const.BUILD_STATE_FILE) \
+                == os.path.join(str(tmp_path), Const.STATE_DIR, \
+                    Const.BRANCHES_DIR, branch, Const.BUILD_STATE_FILE)
+        assert branch_process.repositories == branches_repositories[branch]
+        assert branch_process.discovered_repositories == \
+                                        branches_repositories[branch] + [other]
+        assert branch_process.m2_path == worktrees.get_m2_path(branch)
+        assert os.path.isdir(branch_process.m2_path)
+        assert branch_process._is_worktree
+
+    assert processes[0].m2_path != processes[1].m2_path
+    assert [p.build_jobs for p in processes] == [2, 1]
+    assert [p.sync_jobs for p in processes] == [2, 2]
+    assert process.build_branch == Const.BUILD_BRANCH
+    assert process.repositories == [core]
+    assert process.m2_path is None
+
+
+def test_branch_folder_names_are_sanitized(process):
+    worktrees = process._create_branch_worktrees()
+
+    assert os.path.basename(worktrees.get_branch_path('release/1.2')) == \
+                                                                'release_1.2'
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from multiple_builder import BuilderProcessException, BuildBackend, Const, \
+                                        MavenDaemonBackend, ProcessBuildFull
+
+
+@pytest.fixture
+def mvnd_path(tmp_path, monkeypatch):
+    '''Put a fake mvnd executable in the PATH.'''
+    mvnd_path = tmp_path / MavenDaemonBackend.EXECUTABLE
+    mvnd_path.write_text('#!/bin/sh\n')
+    mvnd_path.chmod(0o755)
+    monkeypatch.setenv('PATH', str(tmp_path))
+
+    return mvnd_path
+
+
+def test_mvnd_backend_is_created_when_available(mvnd_path):
+    assert type(BuildBackend.create(Const.BUILD_BACKEND_MVND)) is \
+                                                        MavenDaemonBackend
+
+
+def test_mvnd_backend_falls_back_to_mvn(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', str(tmp_path))
+
+    assert type(BuildBackend.create(Const.BUILD_BACKEND_MVND)) is BuildBackend
+
+
+def test_mvn_backend_is_created_even_when_not_found(tmp_path, monkeypatch):
+    monkeypatch.setenv('PATH', str(tmp_path))
+
+    backend = BuildBackend.create(Const.BUILD_BACKEND_MVN)
+
+    assert type(backend) is BuildBackend
+    assert backend.get_command(Const.BUILD_CMDS[3]) == Const.BUILD_CMDS[3]
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(BuilderProcessException, match='gradle'):
+        BuildBackend.create('gradle')
+
+
+@pytest.mark.parametrize('command, expected', [
+    ('mvn clean install -T 4', 'mvnd clean install -T 4'),
+    ('mvn surefire:test -pl core', 'mvnd surefire:test -pl core'),
+    ('mvnw clean install', 'mvnw clean install'),
+    ('yes y | git clean -fxd', 'yes y | git clean -fxd')
+])
+def test_mvnd_command_replaces_only_the_mvn_executable(command, expected):
+    assert MavenDaemonBackend().get_command(command) == expected
+
+
+def test_process_builds_by_the_backend_command(mvnd_path):
+    process = ProcessBuildFull()
+    process.build_backend = Const.BUILD_BACKEND_MVND
+    process.m2_path = os.path.join('branch', 'm2')
+
+    assert process._get_backend_command() == 'mvnd clean install' + \
+                ProcessBuildFull.MAVEN_REPO_LOCAL_OPT + f'"{process.m2_path}"'
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from multiple_builder import BuilderProcessException, BuildConfigLoader, \
+                                            CommandArgsProcessor, run_build
+
+
+def test_validate_normalizes_the_values():
+    config = BuildConfigLoader.validate({'branch': 'release/1.2', \
+            'include': ['core-*'], 'max_load': 4, 'jobs': 2, \
+            'm2_budget': '5G', 'min_free_memory': 1024, 'prepare': 'preserve', \
+                                                    'repos_directory': None})
+
+    assert config == {'branch': ['release/1.2'], 'include': ['core-*'], \
+            'max_load': 4.0, 'jobs': 2, 'm2_budget': '5G', \
+                'min_free_memory': 1024, 'prepare': 'preserve', \
+                                                    'repos_directory': None}
+
+
+@pytest.mark.parametrize('config, message', [
+    ({'unknown': 1}, 'Unknown keys'),
+    ({'m2_budget': 'big'}, 'm2_budget'),
+    ({'artifact_cache_size': '10X'}, 'artifact_cache_size'),
+    ({'min_free_memory': True}, 'min_free_memory'),
+    ({'prepare': 'partial'}, 'prepare'),
+    ({'m2_evict': 'some'}, 'm2_evict'),
+    ({'backend': 'gradle'}, 'backend'),
+    ({'jobs': '4'}, 'jobs'),
+    ({'jobs': True}, 'jobs'),
+    ({'pipeline': 'yes'}, 'pipeline'),
+    ({'branch': ['master', 1]}, 'branch')
+])
+def test_validate_invalid_values_raise(config, message):
+    with pytest.raises(BuilderProcessException, match=message):
+        BuildConfigLoader.validate(config)
+
+
+def test_load_validates_the_file(tmp_path):
+    file_path = tmp_path / 'build.json'
+    file_path.write_text(json.dumps({'sync-jobs': 8, 'backend': 'mvnd'}))
+
+    assert BuildConfigLoader.load(str(file_path)) == \
+                                        {'sync_jobs': 8, 'backend': 'mvnd'}
+
+    file_path.write_text(json.dumps({'backend': 'ant'}))
+
+    with pytest.raises(BuilderProcessException, match=str(file_path)):
+        BuildConfigLoader.load(str(file_path))
+
+
+def test_run_build_reports_the_invalid_config():
+    report = run_build({'m2_budget': 'big'})
+
+    assert not report.is_success
+    assert 'm2_budget' in report.error
+
+
+def test_command_line_lists_replace_the_config_file_lists(tmp_path):
+    file_path = tmp_path / 'build.json'
+    file_path.write_text(json.dumps({'branch': ['release'], \
+                            'include': ['core-*'], 'exclude': ['legacy*']}))
+
+    config = CommandArgsProcessor(['--config', str(file_path), \
+                    '--branch', 'dev', '--include', 'api']).to_config()
+
+    assert config['branch'] == ['dev']
+    assert config['include'] == ['api']
+    assert config['exclude'] == ['legacy*']
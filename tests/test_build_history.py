@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from multiple_builder import BuildHistory, DependencyGraph, ProcessBuildFull
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    return os.path.join(str(tmp_path), 'history.json')
+
+
+def record(history, repository, phases):
+    history.record([repository], [(repository._absolute_path, name, 0, \
+                                    seconds) for name, seconds in phases])
+
+
+def test_record_updates_the_moving_average_of_each_phase(file_path, \
+                                                            make_repository):
+    core = make_repository('core')
+    history = BuildHistory(file_path)
+
+    record(history, core, [('git pull', 2), ('maven build', 10)])
+    assert history.estimate(core) == pytest.approx(12)
+
+    record(history, core, [('maven build', 4), ('maven build', 2)])
+    assert history.estimate(core) == pytest.approx(2 + 8)
+
+    assert BuildHistory(file_path).estimate(core) == pytest.approx(10)
+
+
+def test_repository_without_history_gets_the_average(file_path, \
+                                                            make_repository):
+    core = make_repository('core')
+    api = make_repository('api')
+    tool = make_repository('tool')
+    history = BuildHistory(file_path)
+
+    assert history.estimate(tool) == BuildHistory.DEFAULT_ESTIMATE
+
+    record(history, core, [('maven build', 10)])
+    record(history, api, [('maven build', 4)])
+
+    assert history.estimate(tool) == pytest.approx(7)
+
+
+def test_corrupt_history_file_is_ignored(file_path, make_repository):
+    with open(file_path, 'w') as history_file:
+        history_file.write('{not json')
+
+    history = BuildHistory(file_path)
+
+    assert history.estimate(make_repository('core')) == \
+                                                BuildHistory.DEFAULT_ESTIMATE
+
+
+def test_builds_are_ordered_by_the_estimated_critical_path(tmp_path, \
+                                                            make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    tool = make_repository('tool')
+    process = ProcessBuildFull()
+    process.root_path = str(tmp_path)
+    process._graph = DependencyGraph([tool, api, core])
+    process._history = BuildHistory(str(tmp_path / 'history.json'))
+    record(process._history, core, [('maven build', 1)])
+    record(process._history, api, [('maven build', 5)])
+    record(process._history, tool, [('maven build', 4)])
+
+    assert process._graph.get_critical_paths(process._history.estimate) == \
+                                                    {core: 6, api: 5, tool: 4}
+    assert process._get_priority_order() == [core, api, tool]
@@ -0,0 +1,38 @@
+import pytest
+
+from multiple_builder import BuildPlan, DependencyGraph
+
+
+def test_simulate_follows_the_dependencies_and_the_jobs(make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    tool = make_repository('tool')
+    seconds = {core: 2, api: 3, tool: 4}
+
+    plan = BuildPlan(DependencyGraph([tool, api, core]), seconds.get, \
+                                                            2).simulate()
+
+    assert plan == [(core, 0, 2, 5), (tool, 0, 4, 4), (api, 2, 5, 3)]
+
+
+def test_simulate_serial_starts_the_longest_critical_path_first(\
+                                                        make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    tool = make_repository('tool')
+    seconds = {core: 1, api: 3, tool: 2}
+
+    plan = BuildPlan(DependencyGraph([tool, api, core]), seconds.get, \
+                                                            1).simulate()
+
+    assert [p[0] for p in plan] == [core, api, tool]
+    assert plan[-1][2] == pytest.approx(6)
+
+
+def test_format_shows_the_estimated_time(make_repository):
+    core = make_repository('core')
+
+    text = BuildPlan(DependencyGraph([core]), lambda r: 1.5).format()
+
+    assert 'core' in text
+    assert text.endswith('Estimated time: 1.50s')
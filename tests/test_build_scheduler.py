@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from multiple_builder import BuilderProcessException, BuildScheduler, \
+                                                        DependencyGraph
+
+
+@pytest.fixture
+def diamond(make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    cli = make_repository('cli', [('com.acme', 'core')])
+    web = make_repository('web', [('com.acme', 'api'), ('com.acme', 'cli')])
+
+    return core, api, cli, web
+
+
+class Recorder:
+    '''Task thats records the start and the end of each repository.'''
+
+    def __init__(self, failed=(), seconds=0.01):
+        self.failed = set(failed)
+        self.seconds = seconds
+        self.events = list()
+        self._lock = threading.Lock()
+
+    def __call__(self, repository):
+        self._record('start', repository)
+        time.sleep(self.seconds)
+
+        if repository in self.failed:
+            raise BuilderProcessException(f'{repository} has failed')
+
+        self._record('end', repository)
+
+    def started(self):
+        return [r for event, r in self.events if event == 'start']
+
+    def index(self, event, repository):
+        return self.events.index((event, repository))
+
+    def _record(self, event, repository):
+        with self._lock:
+            self.events.append((event, repository))
+
+
+def test_repositories_start_after_theirs_upstreams(diamond):
+    core, api, cli, web = diamond
+    task = Recorder()
+
+    BuildScheduler(DependencyGraph([web, cli, api, core]), 4).run(task)
+
+    assert set(task.started()) == {core, api, cli, web}
+
+    for upstream, downstream in ((core, api), (core, cli), (api, web), \
+                                                            (cli, web)):
+        assert task.index('end', upstream) < task.index('start', downstream)
+
+
+def test_independent_repositories_run_at_same_time(diamond):
+    core, api, cli, _ = diamond
+    task = Recorder(seconds=0.1)
+
+    BuildScheduler(DependencyGraph([core, api, cli]), 2).run(task)
+
+    assert task.index('start', cli) < task.index('end', api)
+    assert task.index('start', api) < task.index('end', cli)
+
+
+def test_priorities_start_first(make_repository):
+    first, second, third = [make_repository(n) for n in ('a', 'b', 'c')]
+    task = Recorder()
+
+    BuildScheduler(DependencyGraph([first, second, third]), 1, \
+            priorities={first: 1, second: 3, third: 2}).run(task)
+
+    assert task.started() == [second, third, first]
+
+
+def test_failure_stops_the_build(diamond):
+    core, api, cli, web = diamond
+    task = Recorder(failed=[core])
+
+    with pytest.raises(BuilderProcessException, match='has failed'):
+        BuildScheduler(DependencyGraph([core, api, cli, web]), 2).run(task)
+
+    assert task.started() == [core]
+
+
+def test_keep_going_skips_only_the_dependents(diamond, make_repository):
+    core, api, cli, web = diamond
+    tool = make_repository('tool')
+    task = Recorder(failed=[api])
+
+    with pytest.raises(BuilderProcessException) as error:
+        BuildScheduler(DependencyGraph([core, api, cli, web, tool]), 2, \
+                                        is_keep_going=True).run(task)
+
+    assert str(error.value) == f'Failed to build the repositories: {api}'
+    assert set(task.started()) == {core, api, cli, tool}
+
+
+def test_released_repositories_are_waited(diamond):
+    core, api, cli, web = diamond
+    scheduler = BuildScheduler(DependencyGraph([core, api]), 2)
+    task = Recorder()
+
+    timer = threading.Timer(0.05, scheduler.release, [api])
+    timer.start()
+    scheduler.release(core)
+    scheduler.run(task, is_to_wait_release=True)
+    timer.join()
+
+    assert task.started() == [core, api]
+
+
+def test_released_with_error_skips_the_dependents(diamond):
+    core, api, cli, web = diamond
+    scheduler = BuildScheduler(DependencyGraph([core, api, cli]), 2, \
+                                                        is_keep_going=True)
+    task = Recorder()
+
+    scheduler.release(core, BuilderProcessException('sync failed'))
+    scheduler.release(api)
+    scheduler.release(cli)
+
+    with pytest.raises(BuilderProcessException, match='Failed to build'):
+        scheduler.run(task, is_to_wait_release=True)
+
+    assert task.started() == []
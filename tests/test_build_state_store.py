@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from multiple_builder import BuildStateStore, ProcessBuildFull, \
+                                        ProcessNotValid, ProcessPersonalized
+
+
+def test_is_built_matches_the_sha_branch_and_command(tmp_path, \
+                                                        make_repository):
+    repository = make_repository('core')
+    store = BuildStateStore(os.path.join(str(tmp_path), 'state.json'))
+
+    assert not store.is_built(repository, 'a1', 'master', 'mvn install')
+
+    store.record(repository, 'a1', 'master', 'mvn install')
+
+    assert store.is_built(repository, 'a1', 'master', 'mvn install')
+    assert not store.is_built(repository, 'b2', 'master', 'mvn install')
+    assert not store.is_built(repository, 'a1', 'develop', 'mvn install')
+    assert not store.is_built(repository, 'a1', 'master', 'mvn package')
+
+
+def test_states_are_persisted(tmp_path, make_repository):
+    repository = make_repository('core')
+    file_path = os.path.join(str(tmp_path), 'state.json')
+    BuildStateStore(file_path).record(repository, 'a1', 'master', 'mvn')
+
+    store = BuildStateStore(file_path)
+
+    assert store.is_built(repository, 'a1', 'master', 'mvn')
+    assert store.get_built_sha(repository, 'master', 'mvn') == 'a1'
+    assert store.get_built_sha(repository, 'develop', 'mvn') is None
+
+
+def test_corrupt_state_file_is_ignored(tmp_path, make_repository):
+    file_path = os.path.join(str(tmp_path), 'state.json')
+
+    with open(file_path, 'w') as state_file:
+        state_file.write('{not json')
+
+    store = BuildStateStore(file_path)
+
+    assert not store.is_built(make_repository('core'), 'a1', 'master', 'mvn')
+
+
+def create_process(tmp_path, repository, is_to_update, \
+                                            process_class=ProcessPersonalized):
+    process = process_class()
+    process.is_to_update = is_to_update
+    process._build_state = BuildStateStore(\
+                                    os.path.join(str(tmp_path), 'state.json'))
+    process._build_state.record(repository, 'a1', process.build_branch, \
+                                                    process.build_command)
+    return process
+
+
+def test_updated_repository_already_built_is_skipped(tmp_path, \
+                                                        make_repository):
+    repository = make_repository('core')
+    process = create_process(tmp_path, repository, is_to_update=True)
+
+    with pytest.raises(ProcessNotValid):
+        process._is_process_to_build(repository, 'a1')
+
+    process._is_process_to_build(repository, 'b2')
+
+
+def test_repository_not_updated_is_always_built(tmp_path, make_repository):
+    repository = make_repository('core')
+    process = create_process(tmp_path, repository, is_to_update=False)
+
+    process._is_process_to_build(repository, 'a1')
+
+
+def test_build_all_with_clean_m2_is_never_skipped(tmp_path, make_repository):
+    repository = make_repository('core')
+    process = create_process(tmp_path, repository, is_to_update=True, \
+                                            process_class=ProcessBuildFull)
+    process.is_clean_m2 = True
+
+    process._is_process_to_build(repository, 'a1')
@@ -0,0 +1,72 @@
+import json
+import os
+
+import pytest
+
+from multiple_builder import BuildTimeline
+
+
+@pytest.fixture
+def timeline(tmp_path):
+    '''Return a timeline with two lanes started at the second 100.'''
+    timeline = BuildTimeline(str(tmp_path))
+    timeline._start = 100
+    core = os.path.join(str(tmp_path), 'group', 'core')
+
+    timeline.record(BuildTimeline.PROCESS_LANE, 'clean m2', 100, 101)
+    timeline.record(core, 'git pull', 101, 101.5)
+    timeline.record(core, 'maven build', 101.5, 104)
+    timeline.record(core, 'maven build', 104, 105)
+
+    return timeline
+
+
+def test_export_chrome_trace_names_the_lanes_and_the_phases(timeline, \
+                                                                tmp_path):
+    file_path = str(tmp_path / 'traces' / 'run.json')
+
+    timeline.export_chrome_trace(file_path)
+
+    with open(file_path) as trace_file:
+        trace = json.load(trace_file)
+
+    assert trace['displayTimeUnit'] == 'ms'
+    assert trace['traceEvents'][:2] == [
+        {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1, \
+                        'args': {'name': BuildTimeline.PROCESS_LANE}},
+        {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 2, \
+                        'args': {'name': os.path.join('group', 'core')}}]
+    assert trace['traceEvents'][2:4] == [
+        {'name': 'clean m2', 'cat': 'clean', 'ph': 'X', 'pid': 1, 'tid': 1, \
+                                                    'ts': 0, 'dur': 1000000},
+        {'name': 'git pull', 'cat': 'git', 'ph': 'X', 'pid': 1, 'tid': 2, \
+                                            'ts': 1000000, 'dur': 500000}]
+    assert len(trace['traceEvents']) == 6
+
+
+def test_format_summary_sums_the_phases_by_lane(timeline):
+    lines = timeline.format_summary().splitlines()
+
+    assert [c.strip() for c in lines[0].split(' | ')] == ['repository', \
+                            'clean m2', 'git pull', 'maven build', 'total']
+    assert [c.strip() for c in lines[2].split(' | ')] == \
+                [BuildTimeline.PROCESS_LANE, '1.00s', '-', '-', '1.00s']
+    assert [c.strip() for c in lines[3].split(' | ')] == \
+            [os.path.join('group', 'core'), '-', '0.50s', '3.50s', '4.00s']
+    assert lines[-1] == 'Wall time: 5.00s'
+
+
+def test_phase_records_the_block_even_when_it_raises(tmp_path):
+    timeline = BuildTimeline()
+
+    with pytest.raises(ValueError):
+        with timeline.phase('core', 'maven build'):
+            with timeline.phase('core', 'maven test'):
+                assert timeline.get_current_phase() == 'maven test'
+
+            assert timeline.get_current_phase() == 'maven build'
+            raise ValueError()
+
+    assert timeline.get_current_phase() is None
+    assert [e[:2] for e in timeline.get_events()] == \
+                            [('core', 'maven test'), ('core', 'maven build')]
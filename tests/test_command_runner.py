@@ -0,0 +1,47 @@
+import os
+import time
+
+from multiple_builder import BuilderProcessException, CommandRunner
+
+import pytest
+
+
+def test_log_files_are_named_by_the_path_relative_to_the_root(tmp_path):
+    root = str(tmp_path)
+    runner = CommandRunner(os.path.join(root, 'logs'), root_path=root)
+
+    assert runner.get_log_path(os.path.join(root, 'groupA', 'core')) != \
+                    runner.get_log_path(os.path.join(root, 'groupB', 'core'))
+    assert runner.get_log_path(os.path.join(root, 'groupA', 'core')) == \
+                    os.path.join(root, 'logs', 'groupA', 'core.log')
+    assert runner.get_log_path(os.path.join(str(tmp_path.parent), 'other')) \
+                                == os.path.join(root, 'logs', 'other.log')
+
+
+def test_run_writes_the_output_to_the_log_file(tmp_path):
+    root = str(tmp_path)
+    repository_path = os.path.join(root, 'group', 'core')
+    os.makedirs(repository_path)
+    runner = CommandRunner(os.path.join(root, 'logs'), root_path=root)
+
+    assert runner.run('echo built', repository_path) == 'built\n'
+
+    with pytest.raises(BuilderProcessException, match='exit status 3'):
+        runner.run('exit 3', repository_path)
+
+    with open(runner.get_log_path(repository_path)) as log_file:
+        assert log_file.read() == '$ echo built\nbuilt\n$ exit 3\n'
+
+
+def test_failed_output_reading_kills_the_command(tmp_path):
+    runner = CommandRunner(str(tmp_path / 'logs'), sample_interval=0.1)
+
+    def on_line(line):
+        raise ValueError(f'Unexpected line: {line}')
+
+    start = time.monotonic()
+
+    with pytest.raises(ValueError, match='started'):
+        runner.run('echo started; sleep 30', str(tmp_path), on_line)
+
+    assert time.monotonic() - start < 10
@@ -0,0 +1,145 @@
+import json
+
+import pytest
+
+from multiple_builder import BuilderProcessException, BuildRunner, \
+                                                            DependencyGraph
+
+
+def test_repository_depends_on_the_repository_building_its_dependency(\
+                                                        make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    web = make_repository('web', [('com.acme', 'api'), ('com.acme', 'core')])
+
+    graph = DependencyGraph([web, api, core])
+
+    assert graph.upstreams(web) == {api, core}
+    assert graph.downstreams(core) == {api, web}
+    assert graph.get_all_downstreams(core) == {api, web}
+    assert graph.topological_order() == [core, api, web]
+
+
+def test_external_dependencies_are_not_edges(make_repository):
+    core = make_repository('core', [('com.acme', 'commons-util'), \
+                                    ('org.junit', 'junit')])
+
+    graph = DependencyGraph([core])
+
+    assert graph.upstreams(core) == set()
+    assert graph.get_producer(('com.acme', 'commons-util')) is None
+    assert graph.get_producer(('com.acme', 'core')) is core
+
+
+def test_not_selected_repositories_are_only_producers(make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+
+    graph = DependencyGraph([api], [api, core])
+
+    assert graph.upstreams(api) == set()
+    assert graph.topological_order() == [api]
+    assert graph.get_producer(('com.acme', 'core')) is core
+
+
+def test_missing_repository_named_by_the_names_raises(make_repository):
+    api = make_repository('sample_api', [('com.acme', 'sample_core-api')])
+
+    with pytest.raises(BuilderProcessException, \
+                                        match='com.acme:sample_core-api'):
+        DependencyGraph([api], repository_names=['sample_core'])
+
+
+def test_default_patterns_are_the_repo_paths(make_repository):
+    api = make_repository('api', [('com.acme', 'sample_1-core')])
+
+    with pytest.raises(BuilderProcessException, match='root path'):
+        DependencyGraph([api])
+
+
+def test_names_not_listed_are_external_artifacts(make_repository):
+    api = make_repository('sample_api', [('com.acme', 'commons-util'), \
+                            ('org.springframework', 'spring-core')])
+
+    graph = DependencyGraph([api], repository_names=['core', 'sample_1'])
+
+    assert graph.upstreams(api) == set()
+
+
+def test_broad_include_doesnt_flag_external_artifacts(make_repository, \
+                                                                tmp_path):
+    api = make_repository('sample_api', [('junit', 'junit')])
+    runner = BuildRunner({'repos_directory': str(tmp_path), \
+                                                    'include': ['*', 're:.*']})
+
+    process = runner.create_process([api])
+    graph = DependencyGraph(process.repositories, \
+            process.discovered_repositories, process.repository_names)
+
+    assert graph.topological_order() == [api]
+
+
+def test_bootstrap_manifest_paths_are_repository_names(make_repository, \
+                                                                tmp_path):
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(json.dumps({'repositories': [\
+                {'path': 'group/platform', 'url': 'git@host:platform.git'}]}))
+    api = make_repository('sample_api', [('com.acme', 'platform-api')])
+
+    process = BuildRunner({'bootstrap': str(manifest_path)}).create_process(\
+                                                                        [api])
+
+    with pytest.raises(BuilderProcessException, match='platform-api'):
+        DependencyGraph([api], repository_names=process.repository_names)
+
+
+def test_repositories_are_selected_by_the_exact_name(make_repository):
+    core = make_repository('core')
+    foo_core = make_repository('foo-core')
+    runner = BuildRunner({'repositories': ['foo-core']})
+
+    assert runner._filter_repositories([core, foo_core]) == [foo_core]
+
+    runner = BuildRunner({'repositories': ['core']})
+
+    assert runner._filter_repositories([core, foo_core]) == [core]
+
+
+def test_cycle_raises(make_repository):
+    first = make_repository('first', [('com.acme', 'second')])
+    second = make_repository('second', [('com.acme', 'first')])
+
+    with pytest.raises(BuilderProcessException, match='cycle'):
+        DependencyGraph([first, second])
+
+
+def test_duplicate_producer_raises(make_repository):
+    core = make_repository('core')
+    copy = make_repository('core', folder='core-copy')
+
+    with pytest.raises(BuilderProcessException, match='built by both'):
+        DependencyGraph([core, copy])
+
+
+def test_unreadable_pom_is_skipped(make_repository, tmp_path):
+    core = make_repository('core')
+    broken = make_repository('broken')
+    (tmp_path / 'broken' / 'pom.xml').write_text('<project><broken')
+    broken.refresh()
+
+    graph = DependencyGraph([core], [core, broken])
+
+    assert broken.modules == []
+    assert graph.topological_order() == [core]
+
+
+def test_critical_paths_sum_the_longest_downstream_path(make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    tool = make_repository('tool')
+    seconds = {core: 1, api: 5, tool: 2}
+
+    critical_paths = DependencyGraph([core, api, tool]).get_critical_paths(\
+                                                            seconds.get)
+
+    assert critical_paths == {core: 6, api: 5, tool: 2}
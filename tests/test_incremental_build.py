@@ -0,0 +1,62 @@
+import pytest
+
+from multiple_builder import BuilderProcessException, ProcessBuildFull, \
+                                                                Repository
+
+from conftest import write_pom
+
+PARENT_POM = '''<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>com.acme</groupId>
+  <artifactId>sample</artifactId>
+  <version>1.0</version>
+  <packaging>pom</packaging>
+  <modules>
+    <module>core</module>
+    <module>core-api</module>
+  </modules>
+</project>
+'''
+
+
+@pytest.fixture
+def repository(tmp_path):
+    (tmp_path / 'pom.xml').write_text(PARENT_POM)
+    write_pom(str(tmp_path / 'core'), 'core')
+    write_pom(str(tmp_path / 'core-api'), 'core-api')
+
+    return Repository(str(tmp_path))
+
+
+def get_changed_modules(repository, changed_files, error=None):
+    def run(command, path, on_line=None, env=None):
+        if error:
+            raise error
+
+        for changed_file in changed_files:
+            on_line(changed_file + '\n')
+
+    process = ProcessBuildFull()
+    process._run_process_command = run
+
+    return process._get_changed_modules(repository, 'a1', 'b2')
+
+
+def test_changed_files_are_mapped_to_theirs_modules(repository):
+    assert get_changed_modules(repository, ['core/src/A.java', \
+            'core-api/pom.xml', 'core/src/B.java']) == ['core', 'core-api']
+
+
+def test_module_prefix_of_another_module_is_not_matched(repository):
+    assert get_changed_modules(repository, \
+                            ['core-api/src/A.java']) == ['core-api']
+
+
+def test_change_outside_the_modules_requires_a_full_build(repository):
+    assert get_changed_modules(repository, \
+                            ['core/src/A.java', 'pom.xml']) is None
+
+
+def test_failed_diff_requires_a_full_build(repository):
+    assert get_changed_modules(repository, [], \
+                    BuilderProcessException('unknown revision')) is None
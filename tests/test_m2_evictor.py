@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from multiple_builder import BuilderProcessException, M2Evictor
+
+
+@pytest.mark.parametrize('size, expected', [
+    ('512', 512),
+    ('1K', 1024),
+    ('512M', 512 * 1024 ** 2),
+    ('10G', 10 * 1024 ** 3),
+    ('1.5g', int(1.5 * 1024 ** 3)),
+    (' 2 GB ', 2 * 1024 ** 3),
+    ('1T', 1024 ** 4),
+    (4096, 4096)
+])
+def test_parse_size(size, expected):
+    assert M2Evictor.parse_size(size) == expected
+
+
+@pytest.mark.parametrize('size', ['', 'G', '10X', '-1G', 'ten'])
+def test_parse_invalid_size_raises(size):
+    with pytest.raises(ValueError):
+        M2Evictor.parse_size(size)
+
+
+def write_version(m2_path, group_id, artifact_id, version, size, accessed):
+    '''Write an artifact version of size bytes accessed at the time.'''
+    path = m2_path.joinpath(*group_id.split('.'), artifact_id, version)
+    path.mkdir(parents=True)
+    jar_path = path / f'{artifact_id}-{version}.jar'
+    jar_path.write_bytes(b'0' * size)
+    os.utime(jar_path, (accessed, accessed))
+
+    return path
+
+
+def test_evict_lru_deletes_the_oldest_versions_until_the_budget(tmp_path):
+    old = write_version(tmp_path, 'org.junit', 'junit', '4.12', 400, 1000)
+    recent = write_version(tmp_path, 'org.junit', 'junit', '4.13', 300, 3000)
+    middle = write_version(tmp_path, 'com.acme', 'core', '1.0', 200, 2000)
+
+    freed = M2Evictor(str(tmp_path)).evict_lru(450)
+
+    assert freed == 600
+    assert not old.exists() and not middle.exists()
+    assert recent.exists()
+    assert not (tmp_path / 'com').exists()
+
+
+def test_evict_lru_within_the_budget_keeps_everything(tmp_path):
+    version = write_version(tmp_path, 'org.junit', 'junit', '4.12', 400, 1000)
+
+    assert M2Evictor(str(tmp_path)).evict_lru(400) == 0
+    assert version.exists()
+
+
+def test_evict_artifacts_deletes_only_the_project_artifacts(tmp_path):
+    core = write_version(tmp_path, 'com.acme', 'core', '1.0', 100, 1000)
+    core_next = write_version(tmp_path, 'com.acme', 'core', '1.1', 50, 1000)
+    api = write_version(tmp_path, 'com.acme', 'api', '1.0', 10, 1000)
+    junit = write_version(tmp_path, 'org.junit', 'junit', '4.12', 400, 1000)
+
+    freed = M2Evictor(str(tmp_path)).evict_artifacts(\
+                    {('com.acme', 'core'), ('com.acme', 'missing'), (None, 'x')})
+
+    assert freed == 150
+    assert not core.exists() and not core_next.exists()
+    assert api.exists() and junit.exists()
+
+
+@pytest.mark.parametrize('evict', [
+    lambda evictor: evictor.evict_lru(0),
+    lambda evictor: evictor.evict_artifacts({('com.acme', 'core')})
+])
+def test_missing_m2_folder_raises(tmp_path, evict):
+    with pytest.raises(BuilderProcessException, match='not a valid'):
+        evict(M2Evictor(str(tmp_path / 'missing')))
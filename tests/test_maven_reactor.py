@@ -0,0 +1,96 @@
+from multiple_builder import MavenReactor, ProcessBuildFull
+
+SUMMARY = '''[INFO] Reactor Summary for multiple-builder-reactor 1:
+[INFO]
+[INFO] core ............................................... SUCCESS [  1.234 s]
+[INFO] Acme API 1.0 ....................................... SUCCESS [  0.5 s]
+[INFO] web ................................................ FAILURE [  2.1 s]
+[INFO] tool ............................................... SKIPPED
+[INFO] multiple-builder-reactor 1 ......................... SUCCESS [  0.001 s]
+[INFO] BUILD FAILURE
+'''
+
+
+def read_summary(reactor):
+    for line in SUMMARY.splitlines():
+        reactor.read_line(line + '\n')
+
+
+def test_failed_repositories_are_read_from_the_summary(make_repository, \
+                                                                tmp_path):
+    core = make_repository('core')
+    api = make_repository('api')
+    web = make_repository('web')
+    tool = make_repository('tool')
+    api.modules[0].name = 'Acme API'
+    reactor = MavenReactor(str(tmp_path / 'reactor'), [core, api, web, tool])
+
+    read_summary(reactor)
+
+    assert reactor.get_failed_repositories() == [web, tool]
+
+
+def test_repository_not_in_the_summary_has_failed(make_repository, tmp_path):
+    core = make_repository('core')
+    other = make_repository('other')
+    reactor = MavenReactor(str(tmp_path / 'reactor'), [core, other])
+
+    read_summary(reactor)
+
+    assert reactor.get_failed_repositories() == [other]
+
+
+def test_aggregator_pom_lists_the_repositories(make_repository, tmp_path):
+    core = make_repository('core')
+    reactor = MavenReactor(str(tmp_path / 'reactor'), [core])
+
+    with open(reactor.write_aggregator_pom()) as pom_file:
+        assert '<module>../core</module>' in pom_file.read()
+
+
+def test_repository_without_modules_has_failed(make_repository, tmp_path):
+    core = make_repository('core')
+    empty = make_repository('empty')
+    (tmp_path / 'empty' / 'pom.xml').unlink()
+    empty.refresh()
+    reactor = MavenReactor(str(tmp_path / 'reactor'), [core, empty])
+
+    read_summary(reactor)
+
+    assert empty.modules == []
+    assert reactor.get_failed_repositories() == [empty]
+
+
+def test_modules_sharing_a_name_need_all_the_projects_to_succeed(\
+                                                make_repository, tmp_path):
+    first = make_repository('core', group_id='com.acme', folder='first')
+    second = make_repository('core', group_id='org.acme', folder='second')
+    web = make_repository('web')
+    reactor = MavenReactor(str(tmp_path / 'reactor'), [first, second, web])
+
+    read_summary(reactor)
+
+    assert reactor.get_failed_repositories() == [first, second, web]
+
+    reactor = MavenReactor(str(tmp_path / 'reactor'), [first, second])
+    reactor.read_line('[INFO] core ........ SUCCESS [  1.2 s]\n')
+
+    assert reactor.get_failed_repositories() == [first, second]
+
+    reactor.read_line('[INFO] core ........ SUCCESS [  0.8 s]\n')
+
+    assert reactor.get_failed_repositories() == []
+
+
+def test_reactor_phase_is_recorded_on_the_process_lane(make_repository, \
+                                                                tmp_path):
+    core = make_repository('core')
+    reactor = MavenReactor(str(tmp_path / 'reactor'), [core])
+    process = ProcessBuildFull()
+    process._process_lane = str(tmp_path / 'develop')
+    process._run_process_command = lambda command, path, on_line=None, \
+                                        env=None: read_summary(reactor)
+
+    assert process._run_reactor(reactor) == []
+    assert [e[:2] for e in process.timeline.get_events()] == \
+                    [(str(tmp_path / 'develop'), ProcessBuildFull.PHASE_REACTOR)]
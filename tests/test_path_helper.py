@@ -0,0 +1,11 @@
+import os
+import re
+
+from multiple_builder import PathHelper
+
+
+def test_run_id_has_the_microseconds_and_the_process_id():
+    run_id = PathHelper.create_run_id()
+
+    assert re.fullmatch(r'\d{8}-\d{6}-\d{6}-\d+', run_id)
+    assert run_id.endswith(f'-{os.getpid()}')
@@ -0,0 +1,87 @@
+import pytest
+
+from multiple_builder import Const, ProcessBuildFull
+
+HEAD = 'a1'
+
+
+class FakeGit:
+    '''Record the commands and answer them with the given outputs.'''
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.commands = list()
+
+    def __call__(self, command, path, on_line=None, env=None):
+        self.commands.append(command)
+
+        return self.outputs.get(command, '')
+
+
+@pytest.fixture
+def process():
+    process = ProcessBuildFull()
+    process.prepare_mode = Const.PREPARE_PRESERVE
+
+    return process
+
+
+def prepare(process, untracked='', branch='master', changes='', \
+                                                        remote_head=HEAD):
+    git = FakeGit({
+        ProcessBuildFull.GIT_UNTRACKED_CMD: untracked,
+        ProcessBuildFull.GIT_BRANCH_CMD: branch + '\n',
+        ProcessBuildFull.GIT_TRACKED_STATUS_CMD: changes,
+        ProcessBuildFull.GIT_HEAD_CMD: HEAD + '\n',
+        ProcessBuildFull.GIT_REMOTE_HEAD_CMD + 'master': remote_head + '\n'
+    })
+    process._run_process_command = git
+    process._prepare_repository('/repository')
+
+    return git.commands
+
+
+def is_run(commands, command):
+    return any([c.startswith(command) for c in commands])
+
+
+def test_clean_repository_at_the_remote_head_is_not_touched(process):
+    commands = prepare(process)
+
+    assert not is_run(commands, ProcessBuildFull.GIT_CLEAN_CMD)
+    assert not is_run(commands, ProcessBuildFull.GIT_CLEAN_UNTRACKED_CMD)
+    assert not is_run(commands, ProcessBuildFull.GIT_CHECKOUT_CMD)
+    assert not is_run(commands, ProcessBuildFull.GIT_RESET_HARD_CMD)
+
+
+def test_only_the_untracked_files_are_cleaned(process):
+    commands = prepare(process, untracked='notes.txt\n')
+
+    assert ProcessBuildFull.GIT_CLEAN_UNTRACKED_CMD in commands
+    assert ProcessBuildFull.GIT_CLEAN_CMD not in commands
+
+
+def test_other_branch_is_checked_out_and_reset(process):
+    commands = prepare(process, branch='develop', remote_head='b2')
+
+    assert ProcessBuildFull.GIT_CHECKOUT_CMD + 'master' in commands
+    assert ProcessBuildFull.GIT_RESET_HARD_CMD + 'master' in commands
+
+
+def test_local_changes_are_reset(process):
+    commands = prepare(process, changes=' M pom.xml\n')
+
+    assert ProcessBuildFull.GIT_RESET_HARD_CMD + 'master' in commands
+    assert not is_run(commands, ProcessBuildFull.GIT_CHECKOUT_CMD)
+
+
+@pytest.mark.parametrize('prepare_mode', Const.PREPARE_MODES)
+def test_reset_is_skipped_unless_is_to_reset(process, prepare_mode):
+    process.prepare_mode = prepare_mode
+    process.is_to_reset = False
+
+    commands = prepare(process, branch='develop', changes=' M pom.xml\n', \
+                                                            remote_head='b2')
+
+    assert ProcessBuildFull.GIT_CHECKOUT_CMD + 'master' in commands
+    assert not is_run(commands, 'git reset')
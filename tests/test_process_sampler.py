@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from multiple_builder import ProcessSampler
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+
+
+def write_process(proc_path, pid, ppid, rss_pages, cpu_ticks, \
+                            read_bytes=0, write_bytes=0, children=None):
+    '''
+    Write the stat and io files of a fake /proc process, whose command
+    has spaces and parentheses, and its task children file when passed.
+    '''
+    fields = ['S', str(ppid)] + ['0'] * 9 + [str(t) for t in cpu_ticks] + \
+                                        ['0'] * 6 + [str(rss_pages), '0']
+    process_path = proc_path / str(pid)
+    task_path = process_path / 'task' / str(pid)
+    task_path.mkdir(parents=True)
+    (process_path / 'stat').write_text(\
+                                f'{pid} (java (main) x) ' + ' '.join(fields))
+    (process_path / 'io').write_text(f'rchar: 1\nread_bytes: {read_bytes}\n' +\
+                                            f'write_bytes: {write_bytes}\n')
+
+    if children is not None:
+        (task_path / 'children').write_text(' '.join(map(str, children)))
+
+
+@pytest.fixture
+def proc_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(ProcessSampler, 'PROC_PATH', str(tmp_path))
+
+    return tmp_path
+
+
+def write_tree(proc_path, has_children_file):
+    def children(pids):
+        return pids if has_children_file else None
+
+    write_process(proc_path, 100, 1, 10, (1, 2, 3, 4), 100, 200, \
+                                                            children([101]))
+    write_process(proc_path, 101, 100, 20, (5, 5, 0, 0), 1000, 0, \
+                                                            children([102]))
+    write_process(proc_path, 102, 101, 30, (10, 0, 0, 0), 0, 50, children([]))
+    write_process(proc_path, 200, 1, 1000, (500, 0, 0, 0), 9999, 9999, \
+                                                            children([]))
+
+
+@pytest.mark.parametrize('has_children_file', [True, False])
+def test_sample_sums_the_process_tree(proc_path, has_children_file):
+    write_tree(proc_path, has_children_file)
+    sampler = ProcessSampler(100)
+
+    sampler._sample()
+
+    assert sorted(sampler._get_tree()) == [100, 101, 102]
+    assert sampler._usage.peak_rss == 60 * PAGE_SIZE
+    assert sampler._usage.cpu_seconds == pytest.approx(30 / CLOCK_TICKS)
+    assert sampler._usage.read_bytes == 1100
+    assert sampler._usage.write_bytes == 250
+
+
+def test_sample_keeps_the_peak_and_the_highest_totals(proc_path):
+    write_process(proc_path, 100, 1, 50, (10, 0, 0, 0), 500, 0, [])
+    sampler = ProcessSampler(100)
+    sampler._sample()
+
+    (proc_path / '100').rename(proc_path / 'exited')
+    write_process(proc_path, 100, 1, 5, (4, 0, 0, 0), 100, 0, [])
+    sampler._sample()
+
+    assert sampler._usage.peak_rss == 50 * PAGE_SIZE
+    assert sampler._usage.cpu_seconds == pytest.approx(10 / CLOCK_TICKS)
+    assert sampler._usage.read_bytes == 500
+
+
+def test_exited_process_is_not_sampled(proc_path):
+    sampler = ProcessSampler(100)
+
+    sampler._sample()
+
+    assert sampler._usage.peak_rss == 0
+    assert sampler._usage.cpu_seconds == 0
@@ -0,0 +1,85 @@
+import pytest
+
+from multiple_builder import BuilderProcessException, ProcessBuildFull
+
+HEAD = 'a1'
+
+
+class FakeGit:
+    '''
+    Answer the probe commands, raising for the ls-remote when the remote
+    head is None.
+    '''
+
+    def __init__(self, remote_head=HEAD, branch='master', changes=''):
+        self.outputs = {
+            ProcessBuildFull.GIT_LS_REMOTE_CMD + 'master': \
+                        f'{remote_head}\trefs/heads/master\n' \
+                                            if remote_head else '',
+            ProcessBuildFull.GIT_BRANCH_CMD: branch + '\n',
+            ProcessBuildFull.GIT_TRACKED_STATUS_CMD: changes,
+            ProcessBuildFull.GIT_HEAD_CMD: HEAD + '\n'
+        }
+        self.is_remote_failing = remote_head is None
+        self.commands = list()
+
+    def __call__(self, command, path, on_line=None, env=None):
+        self.commands.append(command)
+
+        if self.is_remote_failing and command.startswith(\
+                                        ProcessBuildFull.GIT_LS_REMOTE_CMD):
+            raise BuilderProcessException('Could not read from remote')
+
+        return self.outputs.get(command, '')
+
+
+@pytest.fixture
+def process():
+    return ProcessBuildFull()
+
+
+def is_moved(process, repository, **state):
+    process._run_process_command = FakeGit(**state)
+
+    return process._is_repository_moved(repository)
+
+
+def test_repository_at_the_remote_head_has_not_moved(process, \
+                                                            make_repository):
+    assert not is_moved(process, make_repository('core'))
+
+
+@pytest.mark.parametrize('state', [
+    {'remote_head': 'b2'},
+    {'remote_head': ''},
+    {'remote_head': None},
+    {'branch': 'develop'},
+    {'changes': ' M pom.xml\n'}
+])
+def test_repository_has_moved(process, make_repository, state):
+    assert is_moved(process, make_repository('core'), **state)
+
+
+def test_worktree_branch_is_not_checked(process, make_repository):
+    process._is_worktree = True
+
+    assert not is_moved(process, make_repository('core'), branch='HEAD')
+
+
+def test_sync_of_the_repositories_not_moved_is_skipped(process, \
+                                                            make_repository):
+    core = make_repository('core')
+    api = make_repository('api')
+    process.repositories = [core, api]
+    gits = {core._absolute_path: FakeGit(), \
+                            api._absolute_path: FakeGit(remote_head='b2')}
+    process._run_process_command = lambda command, path, on_line=None, \
+                                        env=None: gits[path](command, path)
+
+    process._moved_repositories = process._probe_moved_repositories()
+    probe_commands = list(gits[core._absolute_path].commands)
+    result = process._sync_repository(core)
+
+    assert process._moved_repositories == {api}
+    assert result.repository is core and result.error is None
+    assert gits[core._absolute_path].commands == probe_commands
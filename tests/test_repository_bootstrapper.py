@@ -0,0 +1,148 @@
+import json
+import os
+
+import pytest
+
+from multiple_builder import BuilderProcessException, BuildRunner, Const, \
+                                                    RepositoryBootstrapper
+
+OBJECTS_PATH = os.path.join(Const.GIT_DIR, 'objects')
+
+
+class FakeRunner:
+    '''Record the commands and answer the objects path of the clones.'''
+
+    def __init__(self, outputs=None):
+        self.outputs = outputs or dict()
+        self.commands = list()
+
+    def run(self, command, path, on_line=None, env=None, on_usage=None):
+        self.commands.append((command, path))
+
+        if command == RepositoryBootstrapper.GIT_OBJECTS_PATH_CMD:
+            return OBJECTS_PATH + '\n'
+
+        return self.outputs.get(command, '')
+
+
+def create_bootstrapper(tmp_path, repositories, runner=None, **options):
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(json.dumps({'repositories': repositories}))
+    bootstrapper = RepositoryBootstrapper(str(tmp_path / 'repos'), \
+                                            str(manifest_path), **options)
+    bootstrapper._command_runner = runner or FakeRunner()
+
+    return bootstrapper
+
+
+def create_clone(tmp_path, name):
+    path = tmp_path / 'repos' / name
+    (path / OBJECTS_PATH).mkdir(parents=True)
+
+    return str(path)
+
+
+def get_commands(bootstrapper):
+    return [c for c, p in bootstrapper._command_runner.commands]
+
+
+@pytest.mark.parametrize('repositories', [
+    [{'url': 'git@host:core.git'}],
+    [{'path': 'core'}],
+    [{'path': '', 'url': 'git@host:core.git'}],
+    ['core'],
+    {'path': 'core', 'url': 'git@host:core.git'}
+])
+def test_invalid_manifest_raises(tmp_path, repositories):
+    with pytest.raises(BuilderProcessException, match='bootstrap manifest'):
+        create_bootstrapper(tmp_path, repositories)
+
+
+def test_invalid_manifest_is_reported_by_the_runner(tmp_path):
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(json.dumps({'repositories': [{'path': 'core'}]}))
+
+    report = BuildRunner({'repos_directory': str(tmp_path), \
+                                    'bootstrap': str(manifest_path)}).run()
+
+    assert 'path and an url' in str(report.error)
+
+
+def test_missing_repository_is_cloned_with_the_options(tmp_path):
+    reference = tmp_path / 'cache.git'
+    bootstrapper = create_bootstrapper(tmp_path, [{'path': 'core', \
+                    'url': 'git@host:core.git', 'branch': 'develop'}], \
+                reference=str(reference), clone_filter='blob:none', depth=50)
+
+    bootstrapper.bootstrap()
+
+    assert get_commands(bootstrapper) == [RepositoryBootstrapper.\
+        GIT_CLONE_CMD + ' --filter=blob:none --depth=50 --reference-if-able' +\
+                f' "{reference}" --branch develop "git@host:core.git" .']
+
+
+def test_failed_clone_removes_the_created_folder(tmp_path):
+    class FailingRunner(FakeRunner):
+        def run(self, command, path, on_line=None, env=None, on_usage=None):
+            raise BuilderProcessException('clone failed')
+
+    bootstrapper = create_bootstrapper(tmp_path, [{'path': 'core', \
+                        'url': 'git@host:core.git'}], runner=FailingRunner())
+
+    with pytest.raises(BuilderProcessException, match='core'):
+        bootstrapper.bootstrap()
+
+    assert not os.path.exists(tmp_path / 'repos' / 'core')
+
+
+def test_existing_clone_is_never_made_shallow(tmp_path):
+    create_clone(tmp_path, 'core')
+    bootstrapper = create_bootstrapper(tmp_path, [{'path': 'core', \
+                                'url': 'git@host:core.git'}], \
+                                        clone_filter='blob:none', depth=1)
+
+    bootstrapper.bootstrap()
+
+    commands = get_commands(bootstrapper)
+    assert commands == [RepositoryBootstrapper.GIT_FILTER_CMD, \
+                        RepositoryBootstrapper.GIT_PROMISOR_CMD, \
+                        RepositoryBootstrapper.GIT_FILTER_CMD + ' blob:none']
+    assert not any(['--depth' in c or 'fetch' in c for c in commands])
+
+
+def test_existing_clone_with_the_filter_is_not_changed(tmp_path):
+    create_clone(tmp_path, 'core')
+    runner = FakeRunner({RepositoryBootstrapper.GIT_FILTER_CMD: 'blob:none\n'})
+    bootstrapper = create_bootstrapper(tmp_path, [{'path': 'core', \
+            'url': 'git@host:core.git'}], runner, clone_filter='blob:none')
+
+    bootstrapper.bootstrap()
+
+    assert get_commands(bootstrapper) == \
+                                    [RepositoryBootstrapper.GIT_FILTER_CMD]
+
+
+def test_reference_is_added_once_as_an_alternate(tmp_path):
+    path = create_clone(tmp_path, 'core')
+    reference = tmp_path / 'cache.git'
+    (reference / 'objects').mkdir(parents=True)
+    bootstrapper = create_bootstrapper(tmp_path, [{'path': 'core', \
+                    'url': 'git@host:core.git'}], reference=str(reference))
+
+    bootstrapper.bootstrap()
+    bootstrapper.bootstrap()
+
+    with open(os.path.join(path, OBJECTS_PATH, \
+                        RepositoryBootstrapper.ALTERNATES_FILE)) as alternates:
+        assert alternates.read() == str(reference / 'objects') + '\n'
+
+
+def test_missing_reference_is_ignored(tmp_path):
+    path = create_clone(tmp_path, 'core')
+    bootstrapper = create_bootstrapper(tmp_path, [{'path': 'core', \
+        'url': 'git@host:core.git'}], reference=str(tmp_path / 'missing'))
+
+    bootstrapper.bootstrap()
+
+    assert not os.path.exists(os.path.join(path, OBJECTS_PATH, \
+                                        RepositoryBootstrapper.ALTERNATES_FILE))
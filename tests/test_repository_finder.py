@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from multiple_builder import RepositoryFinder
+
+
+@pytest.fixture
+def root(tmp_path):
+    '''
+    A root folder with the repositories:
+    sample_core, sample_web, platform/sample_api, legacy/sample_old,
+    group/nested/deep/sample_deep and sample_core/modules/sample_inner.
+    '''
+    for path in ('sample_core', 'sample_web', 'platform/sample_api', \
+                    'legacy/sample_old', 'group/nested/deep/sample_deep', \
+                                    'sample_core/modules/sample_inner'):
+        folder = tmp_path / path
+        (folder / '.git').mkdir(parents=True)
+        (folder / 'pom.xml').write_text('<project/>')
+
+    (tmp_path / 'not_git').mkdir()
+    (tmp_path / 'not_git' / 'pom.xml').write_text('<project/>')
+
+    return str(tmp_path)
+
+
+def find(root, **options):
+    return [os.path.relpath(p, root).replace(os.sep, '/') \
+                            for p in RepositoryFinder(**options).find(root)]
+
+
+def test_include_suffix_finds_nested_repositories(root):
+    assert find(root, include=['sample_core', 'sample_web', 'sample_api', \
+            'sample_old', 'sample_deep', 'sample_inner']) == [\
+        'group/nested/deep/sample_deep', 'legacy/sample_old', \
+        'platform/sample_api', 'sample_core', 'sample_web']
+
+
+def test_max_depth_limits_the_search(root):
+    assert find(root, include=['sample_*'], max_depth=2) == [\
+        'legacy/sample_old', 'platform/sample_api', 'sample_core', \
+                                                            'sample_web']
+    assert find(root, include=['sample_*'], max_depth=1) == [\
+                                                'sample_core', 'sample_web']
+
+
+def test_glob_with_slash_matches_the_relative_path(root):
+    assert find(root, include=['platform/*']) == ['platform/sample_api']
+
+
+def test_regular_expression_searches_the_relative_path(root):
+    assert find(root, include=['re:^(legacy|platform)/']) == [\
+                                    'legacy/sample_old', 'platform/sample_api']
+
+
+def test_exclude_skips_repositories_and_folders(root):
+    assert find(root, include=['sample_*'], exclude=['legacy', 'sample_web'],\
+            max_depth=4) == ['group/nested/deep/sample_deep', \
+                                        'platform/sample_api', 'sample_core']
+
+
+def test_index_is_reused_until_a_folder_changes(root, tmp_path):
+    index_path = str(tmp_path / 'index.json')
+    finder = RepositoryFinder(include=['sample_*'], max_depth=1, \
+                                                    index_path=index_path)
+
+    assert len(finder.find(root)) == 2
+
+    (tmp_path / 'sample_new' / '.git').mkdir(parents=True)
+    (tmp_path / 'sample_new' / 'pom.xml').write_text('<project/>')
+    os.utime(root, ns=(0, 0))
+
+    assert len(finder.find(root)) == 3
+
+
+def test_index_is_reused_when_the_build_changes_a_repository(root, \
+                                tmp_path, tmp_path_factory, monkeypatch):
+    index_path = str(tmp_path_factory.mktemp('index') / 'index.json')
+    finder = RepositoryFinder(include=['sample_*'], max_depth=1, \
+                                                    index_path=index_path)
+    repositories = finder.find(root)
+
+    (tmp_path / 'sample_core' / 'target').mkdir()
+    os.utime(str(tmp_path / 'sample_core'), ns=(0, 0))
+    monkeypatch.setattr(finder, '_scan', None)
+
+    assert finder.find(root) == repositories
+
+
+def test_index_is_refreshed_when_a_repository_is_removed(root, tmp_path):
+    index_path = str(tmp_path / 'index.json')
+    finder = RepositoryFinder(include=['sample_*'], max_depth=1, \
+                                                    index_path=index_path)
+    finder.find(root)
+
+    (tmp_path / 'sample_web' / 'pom.xml').unlink()
+
+    assert find(root, include=['sample_*'], max_depth=1, \
+                                index_path=index_path) == ['sample_core']
@@ -0,0 +1,98 @@
+import pytest
+
+from multiple_builder import ProcessBuildFull, ResourceGovernor
+
+GB = 1024 ** 3
+
+
+def create_governor(load=None, available=None, **options):
+    governor = ResourceGovernor(cpu_count=8, **options)
+    governor._read_load = lambda: load
+    governor._read_available_memory = lambda: available
+
+    return governor
+
+
+def test_builds_started_together_share_the_free_cores_and_memory():
+    governor = create_governor(available=5 * GB, min_free_memory=1 * GB)
+
+    governor.allocate(['core', 'api'])
+
+    for key in ('core', 'api'):
+        assert governor.get_allocation(key).threads == 4
+        assert governor.get_allocation(key).heap_size == 1024
+
+
+def test_later_builds_get_the_cores_not_used():
+    governor = create_governor()
+    governor.allocate(['core'])
+
+    governor.allocate(['api', 'web'])
+
+    assert governor.get_allocation('core').threads == 8
+    assert governor.get_allocation('api').threads == 1
+    assert governor.get_allocation('web').heap_size is None
+
+    governor.release('core')
+    governor.allocate(['tool'])
+
+    assert governor.get_allocation('core') is None
+    assert governor.get_allocation('tool').threads == 6
+
+
+def test_heap_size_has_a_minimum():
+    governor = create_governor(available=1 * GB, min_free_memory=1 * GB)
+
+    governor.allocate(['core'])
+
+    assert governor.get_allocation('core').heap_size == \
+                                                ResourceGovernor.MIN_HEAP_SIZE
+
+
+def test_first_build_is_always_admitted():
+    governor = create_governor(load=100, available=0)
+
+    assert governor.is_admissible()
+
+
+@pytest.mark.parametrize('load, available, expected', [
+    (7.9, 2 * GB, True),
+    (8, 2 * GB, False),
+    (1, 1 * GB, False),
+    (None, None, True),
+    (None, 2 * GB, True),
+    (9, None, False)
+])
+def test_admission_by_the_load_and_the_memory(load, available, expected):
+    governor = create_governor(load, available, min_free_memory=1 * GB)
+    governor.allocate(['core'])
+
+    assert governor.is_admissible() is expected
+
+
+def test_max_load_overrides_the_cores():
+    governor = create_governor(load=3, max_load=2)
+    governor.allocate(['core'])
+
+    assert not governor.is_admissible()
+
+
+def test_allocation_sets_the_maven_threads_and_heap(make_repository, \
+                                                                monkeypatch):
+    monkeypatch.delenv(ProcessBuildFull.MAVEN_OPTS_ENV, raising=False)
+    core = make_repository('core')
+    process = ProcessBuildFull()
+    process._governor = create_governor(available=3 * GB)
+    process._governor.allocate([core])
+
+    command, env = process._get_resource_options(core, \
+                                                'mvn clean install -T 4')
+
+    assert command == 'mvn clean install -T 8'
+    assert env[ProcessBuildFull.MAVEN_OPTS_ENV] == '-Xmx1536m'
+
+    api = make_repository('api')
+    process._governor.allocate([api])
+
+    assert process._get_resource_options(api, 'mvn install -T 2C')[0] == \
+                                                        'mvn install -T 1'
@@ -0,0 +1,61 @@
+import pytest
+
+from multiple_builder import RunJournal
+
+OPTIONS = {'branch': 'master', 'command': 'mvn clean install'}
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    return str(tmp_path / 'journal.json')
+
+
+def interrupted_run(file_path, repository):
+    journal = RunJournal(file_path, OPTIONS)
+    journal.mark_step_done(RunJournal.STEP_CLEAN_M2)
+    journal.mark_done(repository, RunJournal.PHASE_PREPARE)
+    journal.mark_done(repository, RunJournal.PHASE_UPDATE)
+
+    return journal
+
+
+def test_resumed_run_skips_the_finished_phases(file_path, make_repository):
+    core = make_repository('core')
+    interrupted_run(file_path, core)
+
+    journal = RunJournal(file_path, OPTIONS, is_to_resume=True)
+
+    assert journal.is_step_done(RunJournal.STEP_CLEAN_M2)
+    assert journal.is_done(core, RunJournal.PHASE_UPDATE)
+    assert not journal.is_done(core, RunJournal.PHASE_BUILD)
+    assert not journal.is_done(make_repository('api'), \
+                                                RunJournal.PHASE_PREPARE)
+
+
+def test_run_without_resume_starts_a_new_journal(file_path, make_repository):
+    core = make_repository('core')
+    interrupted_run(file_path, core)
+
+    journal = RunJournal(file_path, OPTIONS)
+
+    assert not journal.is_step_done(RunJournal.STEP_CLEAN_M2)
+    assert not journal.is_done(core, RunJournal.PHASE_PREPARE)
+
+
+def test_run_with_other_options_is_not_resumed(file_path, make_repository):
+    core = make_repository('core')
+    interrupted_run(file_path, core)
+
+    journal = RunJournal(file_path, dict(OPTIONS, branch='develop'), \
+                                                            is_to_resume=True)
+
+    assert not journal.is_done(core, RunJournal.PHASE_PREPARE)
+
+
+def test_finished_run_is_not_resumed(file_path, make_repository):
+    core = make_repository('core')
+    interrupted_run(file_path, core).finish()
+
+    journal = RunJournal(file_path, OPTIONS, is_to_resume=True)
+
+    assert not journal.is_done(core, RunJournal.PHASE_PREPARE)
@@ -0,0 +1,99 @@
+import os
+import xml.etree.ElementTree as ElementTree
+
+from multiple_builder import StagingRepository
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_set_local_repository_replaces_the_maven_option(tmp_path):
+    staging = StagingRepository(str(tmp_path / 'staging'), tmp_path / 'm2')
+
+    command = staging.set_local_repository(\
+                        'mvn install -Dmaven.repo.local=/other -T 4')
+
+    assert command == 'mvn install -T 4 -Dmaven.repo.local=' + \
+            f'"{tmp_path / "staging"}" -Dmaven.repo.local.tail=' + \
+                                                    f'"{tmp_path / "m2"}"'
+    assert os.path.isdir(str(tmp_path / 'staging'))
+
+
+def test_merge_copies_the_artifacts_into_the_shared_repository(tmp_path):
+    staging_path = tmp_path / 'staging'
+    shared_path = tmp_path / 'm2'
+    artifact = os.path.join('com', 'acme', 'core', '1.0')
+    write(staging_path / artifact / 'core-1.0.jar', 'new jar')
+    write(staging_path / artifact / 'core-1.0.pom', 'pom')
+    write(staging_path / artifact / 'core-1.0.jar.lastUpdated', 'marker')
+    write(staging_path / artifact / 'core-1.0.jar.part', 'partial')
+    write(shared_path / artifact / 'core-1.0.jar', 'old jar')
+    write(shared_path / 'org' / 'other' / 'other-1.0.jar', 'other')
+
+    StagingRepository(str(staging_path), shared_path).merge()
+
+    assert sorted(os.listdir(str(shared_path / artifact))) == \
+                                            ['core-1.0.jar', 'core-1.0.pom']
+    assert (shared_path / artifact / 'core-1.0.jar').read_text() == 'new jar'
+    assert (shared_path / 'org' / 'other' / 'other-1.0.jar').exists()
+
+
+METADATA = '''<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://maven.apache.org/METADATA/1.1.0">
+  <groupId>com.acme</groupId>
+  <artifactId>core</artifactId>
+  <versioning>
+    <versions>
+      <version>{version}</version>
+    </versions>
+    <lastUpdated>{last_updated}</lastUpdated>
+  </versioning>
+</metadata>
+'''
+
+
+def stage_version(staging_path, version, last_updated):
+    artifact = staging_path / 'com' / 'acme' / 'core'
+    write(artifact / 'maven-metadata-local.xml', \
+            METADATA.format(version=version, last_updated=last_updated))
+    write(artifact / version / f'core-{version}.jar', 'jar')
+    write(artifact / version / '_remote.repositories', \
+            f'#NOTE: This is a Maven Resolver internal file\n' + \
+                                        f'core-{version}.jar>=\n')
+
+
+def test_merge_keeps_the_metadata_of_the_other_builds(tmp_path):
+    shared_path = tmp_path / 'm2'
+    artifact = shared_path / 'com' / 'acme' / 'core'
+    write(artifact / '1.1' / '_remote.repositories', 'core-1.1.pom>central=\n')
+
+    for version, last_updated in (('1.1', '20260102'), ('1.0', '20260101')):
+        staging_path = tmp_path / f'staging-{version}'
+        stage_version(staging_path, version, last_updated)
+        StagingRepository(str(staging_path), shared_path).merge()
+
+    metadata = ElementTree.parse(str(artifact / 'maven-metadata-local.xml'))
+    namespace = '{http://maven.apache.org/METADATA/1.1.0}'
+
+    assert [v.text for v in metadata.iter(namespace + 'version')] == \
+                                                                ['1.1', '1.0']
+    assert metadata.find(f'{namespace}versioning/{namespace}lastUpdated')\
+                                                        .text == '20260102'
+    assert (artifact / '1.0' / '_remote.repositories').read_text() == \
+                    '#NOTE: This is a Maven Resolver internal file\n' + \
+                                                        'core-1.0.jar>=\n'
+    assert (artifact / '1.1' / '_remote.repositories').read_text() == \
+                    '#NOTE: This is a Maven Resolver internal file\n' + \
+                            'core-1.1.pom>central=\ncore-1.1.jar>=\n'
+
+
+def test_discard_deletes_the_staging_repository(tmp_path):
+    staging_path = tmp_path / 'staging'
+    write(staging_path / 'com' / 'core.jar', 'jar')
+    staging = StagingRepository(str(staging_path), tmp_path / 'm2')
+
+    staging.discard()
+
+    assert not staging_path.exists()
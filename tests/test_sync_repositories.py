@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+
+import pytest
+
+from multiple_builder import BuilderProcessException, BuildHistory, \
+        BuildScheduler, DependencyGraph, ProcessBuildFull, SyncResult
+
+
+class Syncer:
+    '''
+    Sync task thats records the repositories synchronized at same time
+    and raises for the failed ones.
+    '''
+
+    def __init__(self, failed=(), seconds=0.02):
+        self.failed = set(failed)
+        self.seconds = seconds
+        self.running = 0
+        self.max_running = 0
+        self.synced = list()
+        self._lock = threading.Lock()
+
+    def __call__(self, repository):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        time.sleep(self.seconds)
+
+        with self._lock:
+            self.running -= 1
+            self.synced.append(repository)
+
+        if repository in self.failed:
+            raise RuntimeError(f'{repository} sync has crashed')
+
+        return SyncResult(repository)
+
+
+@pytest.fixture
+def process(tmp_path):
+    process = ProcessBuildFull()
+    process.root_path = str(tmp_path)
+
+    return process
+
+
+def set_graph(process, tmp_path, repositories):
+    process.repositories = repositories
+    process._graph = DependencyGraph(repositories)
+    process._history = BuildHistory(os.path.join(str(tmp_path), \
+                                                            'history.json'))
+
+
+def test_sync_runs_up_to_the_sync_jobs_at_same_time(process, tmp_path, \
+                                                            make_repository):
+    repositories = [make_repository(f'repo{i}') for i in range(6)]
+    set_graph(process, tmp_path, repositories)
+    syncer = Syncer()
+    process._sync_repository = syncer
+    process.sync_jobs = 2
+
+    process._sync_repositories()
+
+    assert syncer.max_running == 2
+    assert set(syncer.synced) == set(repositories)
+    assert set(process._sync_results) == set(repositories)
+
+
+def test_sync_errors_raise_unless_keep_going(process, tmp_path, \
+                                                            make_repository):
+    core = make_repository('core')
+    set_graph(process, tmp_path, [core])
+    process._sync_repository = lambda r: SyncResult(r, \
+                                    error=BuilderProcessException('failed'))
+
+    with pytest.raises(BuilderProcessException, match='CORE'):
+        process._sync_repositories()
+
+    process.is_keep_going = True
+    process._sync_repositories()
+
+    assert process._sync_results[core].error is not None
+
+
+def run_pipeline(process, timeout=10):
+    errors = list()
+
+    def pipeline():
+        try:
+            process._pipeline_repositories(process._graph, BuildScheduler(\
+                        process._graph, 2, process.is_keep_going))
+        except BuilderProcessException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=pipeline, daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    assert not thread.is_alive(), 'The pipeline has not finished'
+    return errors
+
+
+@pytest.mark.parametrize('is_keep_going', [False, True])
+def test_pipeline_releases_the_crashed_sync_as_failed(process, tmp_path, \
+                                            make_repository, is_keep_going):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    tool = make_repository('tool')
+    set_graph(process, tmp_path, [core, api, tool])
+    process._sync_repository = Syncer(failed=[core])
+    process.is_keep_going = is_keep_going
+    built = list()
+    process._build_repository = built.append
+
+    errors = run_pipeline(process)
+
+    assert len(errors) == 1 and 'CORE' in str(errors[0])
+    assert process._sync_results[core].error is not None
+    assert core not in built and api not in built
+
+    if is_keep_going:
+        assert built == [tool]
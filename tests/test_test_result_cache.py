@@ -0,0 +1,231 @@
+import json
+import threading
+
+import pytest
+
+from multiple_builder import BuilderProcessException, BuildStateStore, \
+        DependencyGraph, ModuleTestKeys, ProcessBuildFull, Repository, \
+                                            TestResultCache as ResultCache
+
+from conftest import write_pom
+
+TREES = ['root-pom-sha', 'module-pom-sha', 'src-sha']
+
+
+def test_key_is_stable():
+    assert ResultCache.compute_key(TREES, 'mvn clean install', \
+                                                        ['b', 'a']) == \
+        ResultCache.compute_key(list(TREES), 'mvn clean install', \
+                                                                ['a', 'b'])
+
+
+def test_key_changes_with_the_sources_command_and_upstreams():
+    key = ResultCache.compute_key(TREES, 'mvn clean install', ['a'])
+    changed = [
+        ResultCache.compute_key(['root-pom-sha', 'module-pom-sha', \
+                                    'other-src-sha'], 'mvn clean install', ['a']),
+        ResultCache.compute_key(TREES, 'mvn clean install -T 4', ['a']),
+        ResultCache.compute_key(TREES, 'mvn clean install', ['b']),
+        ResultCache.compute_key(TREES, 'mvn clean install', []),
+        ResultCache.compute_key(['root-pom-sha', 'module-pom-sha', \
+                                            None], 'mvn clean install', ['a'])
+    ]
+
+    assert key not in changed
+    assert len(set(changed)) == len(changed)
+
+
+def test_recorded_keys_are_passed_and_persisted(tmp_path):
+    file_path = str(tmp_path / 'test_cache.json')
+    cache = ResultCache(file_path)
+
+    cache.record(['a', 'b'])
+
+    assert cache.is_passed('a')
+    assert not cache.is_passed('c')
+    assert not cache.is_passed(None)
+    assert ResultCache(file_path).is_passed('b')
+
+
+def test_only_the_most_recent_keys_are_kept(tmp_path):
+    file_path = str(tmp_path / 'test_cache.json')
+    cache = ResultCache(file_path, max_size=2)
+
+    cache.record(['a'])
+    cache.record(['b'])
+    cache.record(['c'])
+
+    with open(file_path) as cache_file:
+        assert sorted(json.load(cache_file)) == ['b', 'c']
+
+    assert not cache.is_passed('a')
+
+
+class FakeGit:
+    '''Answer git status and git ls-tree with the given tree SHAs.'''
+
+    def __init__(self, trees, status=''):
+        self.trees = trees
+        self.status = status
+
+    def __call__(self, command, path, on_line=None):
+        if command == ModuleTestKeys.GIT_STATUS_CMD:
+            return self.status
+
+        for tree_path, sha in self.trees.items():
+            on_line(f'040000 tree {sha}\t{tree_path}')
+
+        return ''
+
+
+def test_module_keys_include_the_upstream_repository_keys(make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    git = FakeGit({'pom.xml': 'pom-sha', 'src': 'src-sha'})
+    keys = ModuleTestKeys(DependencyGraph([core, api]), 'mvn install', git)
+
+    core_key = keys.get(core)[('com.acme', 'core')]
+    api_key = keys.get(api)[('com.acme', 'api')]
+
+    assert core_key == ResultCache.compute_key(\
+                        ['pom-sha', 'pom-sha', 'src-sha'], 'mvn install', [])
+    assert api_key == ResultCache.compute_key(\
+                ['pom-sha', 'pom-sha', 'src-sha'], 'mvn install', [core_key])
+
+
+def test_repository_with_local_changes_has_no_keys(make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    git = FakeGit({'pom.xml': 'pom-sha'}, status=' M pom.xml')
+    keys = ModuleTestKeys(DependencyGraph([core, api]), 'mvn install', git)
+
+    assert keys.get(api) == dict()
+
+
+def test_keys_being_computed_by_another_build_are_not_read(make_repository):
+    core = make_repository('core')
+    api = make_repository('api', [('com.acme', 'core')])
+    git = FakeGit({'pom.xml': 'pom-sha', 'src': 'src-sha'})
+    started = threading.Event()
+    resumed = threading.Event()
+
+    def run_command(command, path, on_line=None):
+        if path == core._absolute_path and not started.is_set():
+            started.set()
+            resumed.wait(5)
+
+        return git(command, path, on_line)
+
+    keys = ModuleTestKeys(DependencyGraph([core, api]), 'mvn install', \
+                                                                run_command)
+    core_thread = threading.Thread(target=keys.get, args=(core,))
+    core_thread.start()
+    started.wait(5)
+
+    api_keys = keys.get(api)
+    resumed.set()
+    core_thread.join()
+
+    assert ('com.acme', 'api') in api_keys
+    assert keys.get(core) == {('com.acme', 'core'): \
+                ResultCache.compute_key(['pom-sha', 'pom-sha', 'src-sha'], \
+                                                        'mvn install', [])}
+
+
+PARENT_POM = '''<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>com.acme</groupId>
+  <artifactId>sample</artifactId>
+  <version>1.0</version>
+  <packaging>pom</packaging>
+  <modules>
+    <module>core</module>
+    <module>web</module>
+  </modules>
+</project>
+'''
+
+
+class FakeMaven:
+    '''
+    Stub of the git and mvn commands: a mvn command installs the -pl
+    modules, or all of them, running first theirs tests unless they are
+    skipped, and a failing module stops the command before installing it.
+    '''
+
+    def __init__(self, repository, failing=()):
+        self.modules = [str(m) for m in repository.modules]
+        self.failing = set(failing)
+        self.installed = list()
+        self.commands = list()
+
+    def __call__(self, command, path, on_line=None, env=None):
+        if not command.startswith('mvn'):
+            return 'a1\n'
+
+        self.commands.append(command)
+        names = command.partition(ProcessBuildFull.MAVEN_PROJECTS_OPT)[2]
+        modules = names.split()[0].split(',') if names else self.modules
+
+        for module in modules:
+            if '-DskipTests' not in command and module in self.failing:
+                raise BuilderProcessException(f'Tests of {module} failed')
+
+            self.installed.append(module)
+
+        return ''
+
+
+@pytest.fixture
+def build(tmp_path):
+    '''
+    Return a function thats builds a repository with the modules sample,
+    core and web, where the tests of sample and core have already passed.
+    '''
+    (tmp_path / 'sample' / 'pom.xml').parent.mkdir()
+    (tmp_path / 'sample' / 'pom.xml').write_text(PARENT_POM)
+    write_pom(str(tmp_path / 'sample' / 'core'), 'core')
+    write_pom(str(tmp_path / 'sample' / 'web'), 'web', [('com.acme', 'core')])
+    repository = Repository(str(tmp_path / 'sample'))
+    keys = {m.coordinate: f'{m.artifact_id}-key' for m in repository.modules}
+
+    process = ProcessBuildFull()
+    process.is_test_cache = True
+    process.root_path = str(tmp_path)
+    process._test_cache = process._create_test_cache()
+    process._test_cache.record(['sample-key', 'core-key'])
+    process._test_keys = type('Keys', (), {'get': lambda self, r: keys})()
+    process._build_state = BuildStateStore(str(tmp_path / 'state.json'))
+
+    def run(maven):
+        process._run_process_command = maven
+        process._execute_build_process(repository)
+
+    return process, repository, run
+
+
+def test_only_the_untested_modules_run_the_tests(build):
+    process, repository, run = build
+    maven = FakeMaven(repository)
+
+    run(maven)
+
+    assert maven.commands == [
+        'mvn clean install -pl com.acme:sample,com.acme:core -DskipTests',
+        'mvn clean install -pl com.acme:web']
+    assert process._test_cache.is_passed('web-key')
+    assert process._build_state.get_built_sha(repository, \
+                    process.build_branch, process.build_command) == 'a1'
+
+
+def test_failing_tests_install_and_record_nothing_untested(build):
+    process, repository, run = build
+    maven = FakeMaven(repository, failing=['com.acme:web'])
+
+    with pytest.raises(BuilderProcessException, match='com.acme:web'):
+        run(maven)
+
+    assert maven.installed == ['com.acme:sample', 'com.acme:core']
+    assert not process._test_cache.is_passed('web-key')
+    assert process._build_state.get_built_sha(repository, \
+                    process.build_branch, process.build_command) is None
@@ -0,0 +1,185 @@
+import os
+
+import pytest
+
+import multiple_builder
+
+from multiple_builder import BuilderProcessException, BuildStateStore, \
+                                                Const, ProcessBuildFull
+
+HEAD = 'a1'
+
+
+class FakeGit:
+    '''
+    Answer the commands by the path relative to the root, the ls-remote
+    of the moved paths returning a new remote head.
+    '''
+
+    def __init__(self, root_path, moved=()):
+        self.root_path = root_path
+        self.moved = moved
+
+    def __call__(self, command, path, on_line=None, env=None):
+        if command.startswith(ProcessBuildFull.GIT_LS_REMOTE_CMD):
+            sha = 'b2' if os.path.relpath(path, self.root_path) \
+                                                    in self.moved else HEAD
+            return f'{sha}\trefs/heads/{command.split("/")[-1]}\n'
+
+        if command == ProcessBuildFull.GIT_BRANCH_CMD:
+            return 'master\n'
+
+        if command == ProcessBuildFull.GIT_HEAD_CMD:
+            return HEAD + '\n'
+
+        return ''
+
+
+def record_built(state_path, repositories, branch=Const.BUILD_BRANCH):
+    store = BuildStateStore(os.path.join(state_path, Const.BUILD_STATE_FILE))
+
+    for repository in repositories:
+        store.record(repository, HEAD, branch, \
+                                                    Const.BUILD_CMDS.get(1))
+
+
+@pytest.fixture
+def process(tmp_path):
+    process = ProcessBuildFull()
+    process.root_path = str(tmp_path)
+
+    return process
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return os.path.join(str(tmp_path), Const.STATE_DIR)
+
+
+def test_poll_returns_the_moved_repositories(process, make_repository, \
+                                                    tmp_path, state_path):
+    core = make_repository('core')
+    api = make_repository('api')
+    record_built(state_path, [core, api])
+    process._run_process_command = FakeGit(str(tmp_path), moved=['core'])
+
+    assert process._poll_repositories([core, api]) == [core]
+    assert os.path.dirname(process._command_runner._log_dir) == \
+                    os.path.join(state_path, Const.LOGS_DIR, Const.POLLS_DIR)
+
+
+def test_poll_returns_the_repositories_not_built_at_theirs_head(process, \
+                                    make_repository, tmp_path, state_path):
+    core = make_repository('core')
+    api = make_repository('api')
+    record_built(state_path, [core])
+    process._run_process_command = FakeGit(str(tmp_path))
+
+    assert process._poll_repositories([core, api]) == [api]
+
+
+def create_worktrees(process):
+    '''
+    Create the core and api worktrees of the master and develop branches,
+    recorded as built, and return the BranchWorktrees.
+    '''
+    process.build_branches = ['master', 'develop']
+    worktrees = process._create_branch_worktrees()
+
+    for branch in process.build_branches:
+        branch_path = worktrees.get_branch_path(branch)
+        branch_repositories = list()
+
+        for name in ('core', 'api'):
+            os.makedirs(os.path.join(branch_path, name, Const.GIT_DIR))
+            branch_repositories.append(multiple_builder.Repository(\
+                                            os.path.join(branch_path, name)))
+
+        record_built(worktrees.get_state_path(branch), \
+                                            branch_repositories, branch)
+
+    return worktrees
+
+
+def test_poll_reads_the_worktrees_of_every_branch(process, \
+                                                make_repository, tmp_path):
+    core = make_repository('core')
+    api = make_repository('api')
+    create_worktrees(process)
+    git = FakeGit(str(tmp_path), moved=[os.path.join(Const.STATE_DIR, \
+                                    Const.WORKTREES_DIR, 'develop', 'api')])
+    process._run_process_command = git
+
+    assert process._poll_repositories([core, api]) == [api]
+
+
+def test_watch_builds_again_the_failed_repository(process, make_repository, \
+                                        tmp_path, state_path, monkeypatch):
+    core = make_repository('core')
+    api = make_repository('api')
+    process.repositories = [core, api]
+    process._run_process_command = FakeGit(str(tmp_path))
+    builds = list()
+    sleeps = list()
+
+    def build_repositories():
+        builds.append(list(process.repositories))
+        record_built(state_path, [r for r in process.repositories \
+                                                if builds[1:] or r is core])
+
+        if len(builds) == 1:
+            raise BuilderProcessException('The api build has failed')
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+
+        if len(sleeps) == 3:
+            raise KeyboardInterrupt()
+
+    process.build_repositories = build_repositories
+    monkeypatch.setattr(multiple_builder.time, 'sleep', sleep)
+
+    with pytest.raises(KeyboardInterrupt):
+        process.watch_repositories()
+
+    assert builds == [[core, api], [api]]
+    assert sleeps == [Const.WATCH_INTERVAL, Const.WATCH_INTERVAL, \
+                                                Const.WATCH_INTERVAL * 2]
+
+
+def test_watch_creates_the_branch_processes_once(process, make_repository, \
+                                                    tmp_path, monkeypatch):
+    core = make_repository('core')
+    api = make_repository('api')
+    process.repositories = [core, api]
+    worktrees = create_worktrees(process)
+    process._run_process_command = FakeGit(str(tmp_path), \
+        moved=[os.path.join(Const.STATE_DIR, Const.WORKTREES_DIR, 'develop', \
+                                                                    'api')])
+    builds = list()
+    log_dirs = list()
+
+    def build_branch_repositories(branch_process):
+        builds.append((branch_process, [os.path.basename(\
+                r._absolute_path) for r in branch_process.repositories]))
+
+    def sleep(seconds):
+        log_dirs.extend([p._command_runner._log_dir \
+                for p in process._branch_processes if p._command_runner])
+
+        if builds[2:]:
+            raise KeyboardInterrupt()
+
+    monkeypatch.setattr(ProcessBuildFull, '_build_branch_repositories', \
+                                                    build_branch_repositories)
+    monkeypatch.setattr(multiple_builder.time, 'sleep', sleep)
+
+    with pytest.raises(KeyboardInterrupt):
+        process.watch_repositories()
+
+    master, develop = process._branch_processes
+    assert builds == [(master, ['core', 'api']), (develop, ['core', 'api']), \
+                                    (master, ['api']), (develop, ['api'])]
+    assert os.path.dirname(log_dirs[-1]) == os.path.join(\
+                worktrees.get_state_path('develop'), Const.LOGS_DIR, \
+                                                            Const.POLLS_DIR)